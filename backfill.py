@@ -0,0 +1,247 @@
+# -*- coding: utf-8 -*-
+
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Type
+from urllib.parse import urlsplit
+
+from config import (
+    BACKFILL_CHECKPOINT_FILE,
+    BACKFILL_MAX_PAGES,
+    BACKFILL_HOST_CONCURRENCY,
+    BACKFILL_PARSE_WORKERS,
+    BROWSER_WORKERS,
+)
+from crawlers import BaseCrawler, BrowserWorkers, Post
+from crawlers.static_html import HTTPStatusError, extract_from_html, fetch_html
+from pipeline import NotionPipeline, PipelineSummary
+from state_store import JsonStateStore
+
+
+class BackfillCheckpoint(JsonStateStore):
+    """
+    backfill 진행 위치 저장소
+
+    소스별로 다음에 읽을 목록 페이지(cursor)와 완료 여부를 저장해 두고,
+    중단된 backfill을 처음이 아니라 멈춘 페이지부터 이어서 진행한다.
+    """
+
+    def __init__(self, path: str = BACKFILL_CHECKPOINT_FILE):
+        super().__init__(path)
+
+    def get(self, source_id: str) -> Dict[str, Any]:
+        """소스의 진행 위치 ({'cursor', 'gap', 'done'}, 없으면 빈 값)"""
+        self.load()
+        with self._lock:
+            return dict(self._entries.get(source_id, {}))
+
+    def update(self, source_id: str, cursor: int, gap: int, done: bool) -> None:
+        """진행 위치 갱신 후 바로 저장 (중단되어도 이어서 할 수 있도록)"""
+        self.load()
+        with self._lock:
+            self._entries[source_id] = {
+                'cursor': cursor,
+                'gap': gap,
+                'done': done,
+                'updated_at': datetime.now().isoformat(timespec='seconds'),
+            }
+            self.save()
+
+
+class HostLimiter:
+    """호스트별 동시 요청 수 제한 (같은 호스트를 쓰는 소스끼리 공유)"""
+
+    def __init__(self, limit: int = BACKFILL_HOST_CONCURRENCY):
+        self.limit = max(1, limit)
+        self._semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, url: str) -> threading.BoundedSemaphore:
+        host = urlsplit(url).hostname or ''
+        with self._lock:
+            if host not in self._semaphores:
+                self._semaphores[host] = threading.BoundedSemaphore(self.limit)
+            return self._semaphores[host]
+
+
+class BackfillSourceResult:
+    """소스별 backfill 결과"""
+
+    def __init__(self, crawler: BaseCrawler):
+        self.crawler = crawler
+        self.pages = 0        # 이번 실행에서 읽은 목록 페이지 수
+        self.posts = 0        # 목록에서 찾은 글 수
+        self.cursor = 0       # 다음에 읽을 페이지
+        self.done = False     # 마지막 페이지까지 읽음
+        self.error = ""
+
+    @property
+    def name(self) -> str:
+        return self.crawler.name
+
+
+class BackfillRunner:
+    """
+    과거 글 backfill 실행기
+
+    소스마다 backfill_url(cursor)로 과거 목록 페이지를 차례로 넘기며,
+    호스트별 동시 요청 수 안에서 여러 페이지를 한꺼번에 받는다.
+    받은 HTML은 프로세스 풀에서 extraction 스펙으로 파싱하고,
+    찾은 글은 NotionPipeline(중복 제거 → Notion 작성)으로 보낸다.
+    한 묶음의 글이 모두 작성된 뒤에 cursor를 저장하므로, 중단되면
+    마지막으로 끝난 묶음 다음 페이지부터 다시 시작한다.
+    """
+
+    def __init__(self, max_pages: int = BACKFILL_MAX_PAGES,
+                 host_concurrency: int = BACKFILL_HOST_CONCURRENCY,
+                 parse_workers: int = BACKFILL_PARSE_WORKERS,
+                 browser_workers: int = BROWSER_WORKERS,
+                 checkpoint: Optional[BackfillCheckpoint] = None,
+                 pipeline: Optional[NotionPipeline] = None):
+        self.max_pages = max_pages  # 이번 실행에서 소스별로 읽을 최대 페이지 수
+        self.window = max(1, host_concurrency)
+        self.parse_workers = parse_workers  # 0이면 현재 프로세스에서 파싱
+        self.browser_workers = max(1, browser_workers)
+        self.checkpoint = checkpoint or BackfillCheckpoint()
+        self.pipeline = pipeline or NotionPipeline()
+        self._host_limit = HostLimiter(host_concurrency)
+        self._parser: Optional[ProcessPoolExecutor] = None
+        self._browsers: Optional[BrowserWorkers] = None
+        self._stopped = threading.Event()
+
+    def run(self, crawler_classes: List[Type[BaseCrawler]]) -> List[BackfillSourceResult]:
+        """backfill을 지원하는 모든 소스를 동시에 진행하고 결과 반환"""
+        crawlers = [cls() for cls in crawler_classes]
+        crawlers = [crawler for crawler in crawlers
+                    if crawler.extraction and crawler.backfill_url(0)]
+
+        if self.parse_workers > 0:
+            self._parser = ProcessPoolExecutor(max_workers=self.parse_workers)
+        if any(crawler.uses_browser for crawler in crawlers):
+            self._browsers = BrowserWorkers(self.browser_workers)
+
+        # 소스마다 한 스레드가 페이지 묶음을 조율하고, 묶음 안의 페이지는 page_executor에서 받음
+        page_executor = ThreadPoolExecutor(max_workers=self.window * max(1, len(crawlers)),
+                                           thread_name_prefix="backfill-page")
+        source_executor = ThreadPoolExecutor(max_workers=max(1, len(crawlers)),
+                                             thread_name_prefix="backfill-source")
+        self.pipeline.start()
+        try:
+            futures = [source_executor.submit(self._backfill_source, crawler, page_executor)
+                       for crawler in crawlers]
+            return [future.result() for future in futures]
+        finally:
+            # 중단 후 버려지는 글이 생기므로 그 뒤로는 진행 위치를 저장하지 않음
+            self._stopped.set()
+            self.pipeline.close()
+            source_executor.shutdown(wait=True, cancel_futures=True)
+            page_executor.shutdown(wait=True, cancel_futures=True)
+            if self._parser:
+                self._parser.shutdown()
+            if self._browsers:
+                self._browsers.shutdown()
+
+    @property
+    def summary(self) -> PipelineSummary:
+        return self.pipeline.summary
+
+    def _backfill_source(self, crawler: BaseCrawler,
+                         page_executor: ThreadPoolExecutor) -> BackfillSourceResult:
+        """소스 하나의 과거 목록을 묶음 단위로 진행"""
+        result = BackfillSourceResult(crawler)
+        state = self.checkpoint.get(crawler.source_id)
+        cursor = state.get('cursor', 0)
+        gap = state.get('gap', 0)
+        result.cursor = cursor
+
+        if state.get('done'):
+            result.done = True
+            print(f"  ✔️  {crawler.name}: 이미 backfill 완료 (페이지 {cursor}개)")
+            return result
+
+        print(f"  📚 {crawler.name}: 페이지 {cursor + 1}부터 backfill")
+        seen_urls = set()
+        end = cursor + self.max_pages
+        done = False
+
+        while cursor < end and not done and not self._stopped.is_set():
+            batch = [c for c in range(cursor, min(cursor + self.window, end))
+                     if crawler.backfill_url(c)]
+            if not batch:
+                done = True
+                break
+
+            futures = [page_executor.submit(self._fetch_page, crawler, c) for c in batch]
+
+            # 앞 페이지부터 순서대로 반영하고, 실패한 페이지에서 멈춤
+            for page_cursor, future in zip(batch, futures):
+                try:
+                    posts = future.result()
+                except Exception as e:
+                    result.error = f"페이지 {page_cursor + 1}: {e}"
+                    for pending in futures:
+                        pending.cancel()
+                    break
+
+                new_posts = [post for post in posts if post.key not in seen_urls]
+                result.pages += 1
+                result.posts += len(new_posts)
+                cursor = page_cursor + 1
+
+                # 글이 없거나 이미 본 글만 있으면(범위 밖 페이지) 빈 페이지로 취급
+                gap = 0 if new_posts else gap + 1
+                if gap >= crawler.max_backfill_gap:
+                    done = True
+                    break
+
+                for post in new_posts:
+                    seen_urls.add(post.key)
+                    self.pipeline.submit(post.to_dict())
+
+            # 이 묶음의 글이 모두 Notion에 반영된 뒤에 진행 위치 저장
+            self.pipeline.drain()
+            if self._stopped.is_set():
+                break
+            self.checkpoint.update(crawler.source_id, cursor, gap, done)
+            if result.error:
+                break
+
+        result.cursor = cursor
+        result.done = done
+        return result
+
+    def _fetch_page(self, crawler: BaseCrawler, cursor: int) -> List[Post]:
+        """목록 페이지 하나를 받아 파싱 (정적 HTML에 글이 없으면 브라우저로 다시 시도)"""
+        url = crawler.backfill_url(cursor)
+        static = not crawler.uses_browser or crawler.static_first
+
+        with self._host_limit(url):
+            try:
+                if static:
+                    html = fetch_html(url, timeout=crawler.timeout / 1000, source=crawler.source_id)
+                else:
+                    html = self._render(crawler, url)
+            except HTTPStatusError as e:
+                if e.status == 404:  # 마지막 페이지 다음
+                    return []
+                raise
+        posts = crawler.build_posts(self._parse(crawler, html))
+
+        if not posts and static and crawler.uses_browser:
+            with self._host_limit(url):
+                html = self._render(crawler, url)
+            posts = crawler.build_posts(self._parse(crawler, html))
+
+        return posts
+
+    def _render(self, crawler: BaseCrawler, url: str) -> str:
+        """브라우저 워커에서 페이지 렌더링 (Chromium 수는 browser_workers로 제한)"""
+        future: Future = self._browsers.submit(lambda: crawler.render_html(url))
+        return future.result()
+
+    def _parse(self, crawler: BaseCrawler, html: str) -> List[Dict[str, str]]:
+        """HTML에 extraction 스펙 적용 (프로세스 풀이 있으면 그곳에서)"""
+        if self._parser:
+            return self._parser.submit(extract_from_html, crawler.extraction, html).result()
+        return extract_from_html(crawler.extraction, html)
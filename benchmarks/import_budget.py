@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+"""
+시작 시 import 시간 예산 확인
+
+시나리오마다 새 프로세스에서 main과 선택한 크롤러 모듈을 import하는 데
+걸린 시간(5회 중 최소)을 재고, 예산을 넘거나 RSS 전용 실행에서
+Playwright가 import되면 실패(종료 코드 1)한다.
+
+    python benchmarks/import_budget.py
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RUNS = 5
+
+# (이름, 선택할 소스 (None이면 전체), 예산 ms, Playwright import 허용 여부)
+SCENARIOS = [
+    ('RSS 소스 하나 (daangn)', ['daangn'], 200, False),
+    ('RSS 소스 전체', ['daangn', 'gccompany', 'wanted', 'coupang'], 200, False),
+    ('브라우저 소스 하나 (d2)', ['d2'], 200, False),
+    ('전체 소스', None, 250, False),
+]
+
+_PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import main
+from crawlers import select_crawlers
+select_crawlers({sources!r})
+elapsed = (time.perf_counter() - started) * 1000
+print(json.dumps({{'ms': elapsed, 'playwright': any(m.startswith('playwright') for m in sys.modules)}}))
+"""
+
+
+def measure(sources) -> dict:
+    """새 프로세스에서 import 시간 측정 (RUNS회 중 최소)"""
+    results = []
+    for _ in range(RUNS):
+        output = subprocess.run(
+            [sys.executable, '-c', _PROBE.format(sources=sources)],
+            check=True, capture_output=True, text=True, cwd=ROOT,
+        ).stdout
+        results.append(json.loads(output.strip().splitlines()[-1]))
+    return min(results, key=lambda result: result['ms'])
+
+
+def main() -> int:
+    failed = False
+    print(f"{'시나리오':<28} {'import(ms)':>10} {'예산(ms)':>9}  Playwright")
+    print("-" * 64)
+    for name, sources, budget_ms, playwright_allowed in SCENARIOS:
+        result = measure(sources)
+        over = result['ms'] > budget_ms
+        bad_import = result['playwright'] and not playwright_allowed
+        failed |= over or bad_import
+        mark = "❌" if over or bad_import else "✅"
+        print(f"{name:<28} {result['ms']:>10.1f} {budget_ms:>9}  "
+              f"{'import됨' if result['playwright'] else '-'} {mark}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
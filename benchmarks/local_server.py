@@ -0,0 +1,247 @@
+# -*- coding: utf-8 -*-
+"""
+벤치마크용 로컬 서버: 블로그 fixture 서버와 Notion API 스텁
+
+- FixtureServer: benchmarks/fixtures의 목록 HTML과 Medium RSS를
+  /{source_id}/ 와 /{source_id}/feed 경로로 제공
+- NotionStub: /v1/pages, /v1/databases/{id}/query, /v1/databases/{id}를
+  흉내 내며, 응답 지연과 429 응답 비율을 설정할 수 있음
+
+둘 다 keep-alive(HTTP/1.1)를 지원하는 스레드 서버라 연결 풀 동작도
+실제와 비슷하게 측정된다.
+"""
+
+import json
+import os
+import random
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+
+class _QuietHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status: int, body: bytes, content_type: str,
+              headers: Optional[Dict[str, str]] = None) -> None:
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(body)
+
+    def _read_body(self) -> bytes:
+        length = int(self.headers.get('Content-Length') or 0)
+        return self.rfile.read(length) if length else b''
+
+
+class _LocalServer:
+    """백그라운드 스레드에서 도는 ThreadingHTTPServer"""
+
+    handler_class = _QuietHandler
+
+    def __init__(self, port: int = 0):
+        handler = type('Handler', (self.handler_class,), {'owner': self})
+        self._server = ThreadingHTTPServer(('127.0.0.1', port), handler)
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> '_LocalServer':
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class _FixtureHandler(_QuietHandler):
+
+    def do_GET(self):
+        path = urlsplit(self.path).path
+        parts = [part for part in path.split('/') if part]
+        self.owner.requests += 1
+
+        if len(parts) == 2 and parts[1] == 'feed':
+            name, content_type = f"{parts[0]}.xml", 'application/rss+xml; charset=utf-8'
+        elif len(parts) == 1:
+            name, content_type = f"{parts[0]}.html", 'text/html; charset=utf-8'
+        else:
+            # 목록 안의 글 링크, 이미지 등은 빈 응답
+            self._send(404, b'', 'text/plain')
+            return
+
+        body = self.owner.fixture(name)
+        if body is None:
+            self._send(404, b'', 'text/plain')
+        else:
+            self._send(200, body, content_type)
+
+    do_HEAD = do_GET
+
+
+class FixtureServer(_LocalServer):
+    """fixture 디렉토리의 목록 HTML / RSS 피드 서버"""
+
+    handler_class = _FixtureHandler
+
+    def __init__(self, fixture_dir: str = FIXTURE_DIR, port: int = 0):
+        super().__init__(port)
+        self.fixture_dir = fixture_dir
+        self.requests = 0
+        self._fixtures: Dict[str, Optional[bytes]] = {}
+
+    def fixture(self, name: str) -> Optional[bytes]:
+        if name not in self._fixtures:
+            path = os.path.join(self.fixture_dir, os.path.basename(name))
+            try:
+                with open(path, 'rb') as f:
+                    self._fixtures[name] = f.read()
+            except OSError:
+                self._fixtures[name] = None
+        return self._fixtures[name]
+
+    def base_url(self, source_id: str) -> str:
+        return f"{self.url}/{source_id}/"
+
+    def feed_url(self, source_id: str) -> str:
+        return f"{self.url}/{source_id}/feed"
+
+
+class _NotionHandler(_QuietHandler):
+
+    def do_GET(self):
+        if self._throttled():
+            return
+        parts = [part for part in urlsplit(self.path).path.split('/') if part]
+        if parts[:2] == ['v1', 'databases'] and len(parts) == 3:
+            self._respond_json(self.owner.database(parts[2]))
+        else:
+            self._respond_json({'object': 'error', 'status': 404}, 404)
+
+    def do_POST(self):
+        body = self._read_body()
+        if self._throttled():
+            return
+        parts = [part for part in urlsplit(self.path).path.split('/') if part]
+        try:
+            payload = json.loads(body or b'{}')
+        except ValueError:
+            self._respond_json({'object': 'error', 'status': 400}, 400)
+            return
+
+        if parts == ['v1', 'pages']:
+            self._respond_json(self.owner.create_page(payload))
+        elif parts[:2] == ['v1', 'databases'] and parts[3:] == ['query']:
+            self._respond_json(self.owner.query(payload))
+        else:
+            self._respond_json({'object': 'error', 'status': 404}, 404)
+
+    def _throttled(self) -> bool:
+        """429 주입 대상이면 바로 429 응답 (요청은 처리하지 않음)"""
+        stub = self.owner
+        if not stub.should_throttle():
+            return False
+        body = json.dumps({'object': 'error', 'status': 429, 'code': 'rate_limited'})
+        self._send(429, body.encode(), 'application/json',
+                   {'Retry-After': f"{stub.retry_after:g}"})
+        return True
+
+    def _respond_json(self, result, status: int = 200) -> None:
+        if self.owner.latency:
+            time.sleep(self.owner.latency)
+        self._send(status, json.dumps(result).encode(), 'application/json')
+
+
+class NotionStub(_LocalServer):
+    """
+    Notion API 스텁
+
+    Args:
+        latency_ms: 성공 응답마다 더할 지연 (ms)
+        throttle_rate: 429로 응답할 요청 비율 (0~1, seed로 재현 가능)
+        retry_after: 429 응답의 Retry-After (초)
+    """
+
+    handler_class = _NotionHandler
+
+    def __init__(self, latency_ms: float = 0, throttle_rate: float = 0.0,
+                 retry_after: float = 0.5, seed: int = 0, port: int = 0):
+        super().__init__(port)
+        self.latency = latency_ms / 1000
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.pages: List[Dict] = []
+        self.requests = 0
+        self.throttled = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    @property
+    def api_url(self) -> str:
+        """NOTION_API_BASE_URL로 쓸 주소"""
+        return f"{self.url}/v1"
+
+    def should_throttle(self) -> bool:
+        with self._lock:
+            self.requests += 1
+            if self._random.random() < self.throttle_rate:
+                self.throttled += 1
+                return True
+            return False
+
+    def create_page(self, payload: Dict) -> Dict:
+        page = {
+            'object': 'page',
+            'id': str(uuid.uuid4()),
+            'last_edited_time': datetime.now(timezone.utc).isoformat(timespec='milliseconds'),
+            'properties': payload.get('properties', {}),
+        }
+        with self._lock:
+            self.pages.append(page)
+        return page
+
+    def query(self, payload: Dict) -> Dict:
+        """데이터베이스 조회 (필터는 URL 속성 equals만 지원)"""
+        page_size = min(100, int(payload.get('page_size', 100)))
+        start = int(payload.get('start_cursor') or 0)
+        url = (payload.get('filter') or {}).get('url', {}).get('equals')
+        with self._lock:
+            pages = [page for page in self.pages
+                     if url is None or page['properties'].get('URL', {}).get('url') == url]
+            results = pages[start:start + page_size]
+            has_more = start + page_size < len(pages)
+        return {
+            'object': 'list',
+            'results': results,
+            'has_more': has_more,
+            'next_cursor': str(start + page_size) if has_more else None,
+        }
+
+    def database(self, database_id: str) -> Dict:
+        return {
+            'object': 'database',
+            'id': database_id,
+            'properties': {
+                'Name': {'id': 'title', 'type': 'title'},
+                'URL': {'id': 'Ur%3DL', 'type': 'url'},
+            },
+        }
@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+"""
+오프라인 파이프라인 벤치마크 (실제 블로그·Notion에 요청하지 않음)
+
+benchmarks/fixtures의 목록 HTML과 Medium RSS를 로컬 서버로 제공하고
+모든 크롤러의 base_url/feed_url을 그 서버로 바꾼 뒤, Notion API는
+로컬 스텁(지연·429 주입)으로 보내 main.main을 실행한다.
+실행마다 빈 작업 디렉토리의 새 프로세스에서 돌리고 단계별 시간
+(브라우저 실행, 페이지 이동, 준비 대기, 정적 HTML/피드 다운로드, 파싱,
+중복 제거, Notion 작성)을 출력한다. --output으로 저장한 JSON끼리
+비교하면 변경 전후 성능을 비교할 수 있다.
+
+    python benchmarks/pipeline_bench.py
+    python benchmarks/pipeline_bench.py --sources daangn,d2 --runs 3 --latency-ms 300 --throttle 0.1
+    python benchmarks/pipeline_bench.py --output before.json
+"""
+
+import argparse
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# 출력 순서 (실행 흐름 순)
+STAGES = ['fetch', 'browser_launch', 'navigate', 'ready', 'static_fetch', 'feed_download',
+          'parse', 'filter', 'notion_rate_wait', 'notion_write']
+
+
+def worker(fixture_url: str, sources, result_path: str) -> None:
+    """
+    측정 한 번 (자식 프로세스, 작업 디렉토리와 Notion 환경변수는 부모가 설정)
+
+    크롤러 클래스마다 URL만 로컬 서버로 바꾼 하위 클래스를 만들어 실행한다.
+    """
+    started = time.perf_counter()
+    import main
+    from crawlers import select_crawlers
+    from metrics import metrics
+    import_ms = (time.perf_counter() - started) * 1000
+
+    crawler_classes = []
+    for cls in select_crawlers(sources):
+        overrides = {'base_url': f"{fixture_url}/{cls.source_id}/"}
+        if getattr(cls, 'feed_url', ''):
+            overrides['feed_url'] = f"{fixture_url}/{cls.source_id}/feed"
+        crawler_classes.append(type(cls.__name__, (cls,), overrides))
+
+    log = io.StringIO()
+    started = time.perf_counter()
+    with redirect_stdout(log):
+        main.main(crawler_classes)
+    wall_ms = (time.perf_counter() - started) * 1000
+
+    with open(result_path, 'w', encoding='utf-8') as f:
+        json.dump({
+            'import_ms': import_ms,
+            'wall_ms': wall_ms,
+            'stages': metrics.stages(),
+            'log': log.getvalue(),
+        }, f, ensure_ascii=False)
+
+
+def run_once(fixture_url: str, notion_url: str, sources) -> dict:
+    """빈 작업 디렉토리에서 자식 프로세스로 한 번 실행"""
+    with tempfile.TemporaryDirectory(prefix='pipeline-bench-') as workdir:
+        result_path = os.path.join(workdir, 'result.json')
+        env = dict(os.environ,
+                   NOTION_API_KEY='bench-token',
+                   NOTION_API_BASE_URL=notion_url,
+                   CACHE_BACKEND='text')
+        command = [sys.executable, os.path.abspath(__file__), '--worker',
+                   '--fixture-url', fixture_url, '--result', result_path]
+        if sources:
+            command += ['--sources', ','.join(sources)]
+        subprocess.run(command, check=True, cwd=workdir, env=env)
+
+        with open(result_path, encoding='utf-8') as f:
+            return json.load(f)
+
+
+def print_run(index: int, result: dict) -> None:
+    stages = result['stages']
+    print(f"\n▶ 실행 {index}: 전체 {result['wall_ms'] / 1000:.2f}초 "
+          f"(import {result['import_ms']:.0f}ms)")
+    print(f"  {'단계':<16} {'횟수':>5} {'합계(ms)':>10} {'중앙값(ms)':>11} {'최대(ms)':>10}")
+    for name in STAGES + sorted(set(stages) - set(STAGES)):
+        if name not in stages:
+            continue
+        stage = stages[name]
+        print(f"  {name:<16} {stage['count']:>5} {stage['total_ms']:>10.1f} "
+              f"{stage['p50_ms']:>11.1f} {stage['max_ms']:>10.1f}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="오프라인 파이프라인 벤치마크")
+    parser.add_argument('--sources', type=lambda value: [s.strip() for s in value.split(',') if s.strip()],
+                        metavar='ID[,ID...]', help="실행할 소스 (기본: 전체)")
+    parser.add_argument('--runs', type=int, default=1, help="반복 횟수 (매번 빈 캐시)")
+    parser.add_argument('--latency-ms', type=float, default=200,
+                        help="Notion 스텁 응답 지연 (기본 200ms)")
+    parser.add_argument('--throttle', type=float, default=0.05,
+                        help="Notion 스텁 429 응답 비율 (기본 0.05)")
+    parser.add_argument('--retry-after', type=float, default=0.5,
+                        help="429 응답의 Retry-After 초 (기본 0.5)")
+    parser.add_argument('--output', help="결과 JSON 저장 경로")
+    parser.add_argument('--verbose', action='store_true', help="main.main 출력도 표시")
+    parser.add_argument('--worker', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('--fixture-url', help=argparse.SUPPRESS)
+    parser.add_argument('--result', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        worker(args.fixture_url, args.sources, args.result)
+        return 0
+
+    from local_server import FixtureServer, NotionStub
+
+    fixtures = FixtureServer().start()
+    results = []
+    print(f"📦 fixture 서버 {fixtures.url}, Notion 스텁 지연 {args.latency_ms:.0f}ms, "
+          f"429 비율 {args.throttle:.0%}")
+    try:
+        for index in range(1, args.runs + 1):
+            # 실행마다 새 스텁 (같은 seed라 429 위치도 같음)
+            stub = NotionStub(args.latency_ms, args.throttle, args.retry_after).start()
+            try:
+                result = run_once(fixtures.url, stub.api_url, args.sources)
+            finally:
+                stub.stop()
+
+            result['notion'] = {'requests': stub.requests, 'throttled': stub.throttled,
+                                'pages': len(stub.pages)}
+            results.append(result)
+            if args.verbose:
+                print(result['log'])
+            print_run(index, result)
+            print(f"  Notion 스텁: 요청 {stub.requests}개, 429 {stub.throttled}개, "
+                  f"페이지 {len(stub.pages)}개 생성")
+    finally:
+        fixtures.stop()
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({
+                'args': {'sources': args.sources, 'latency_ms': args.latency_ms,
+                         'throttle': args.throttle, 'retry_after': args.retry_after},
+                'runs': [{key: value for key, value in result.items() if key != 'log'}
+                         for result in results],
+            }, f, ensure_ascii=False, indent=2)
+        print(f"\n💾 결과 저장: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
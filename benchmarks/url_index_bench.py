@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""
+URL 캐시 로드 벤치마크: set(텍스트 파일) vs mmap 해시 인덱스 vs SQLite
+
+URL 수별로 합성 캐시 파일을 만들고, 백엔드마다 별도 프로세스에서
+로드 시간, 로드로 늘어난 RSS, 조회 10,000회 시간을 측정한다.
+
+    python benchmarks/url_index_bench.py              # 10k, 100k, 1M
+    python benchmarks/url_index_bench.py 10000 50000
+"""
+
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+BACKENDS = ['text', 'index', 'index+bloom', 'sqlite']
+LOOKUPS = 10_000
+
+
+def rss_kb() -> int:
+    """현재 프로세스 RSS (KB, Linux는 /proc, 그 외는 최대 RSS)"""
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    import resource
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def make_urls(count: int):
+    """블로그 글 URL과 비슷한 합성 URL 생성 (이미 정규화된 형태)"""
+    rng = random.Random(count)
+    hosts = ['d2.naver.com', 'tech.kakao.com', 'toss.tech', 'ridicorp.com', 'medium.com']
+    for i in range(count):
+        host = hosts[i % len(hosts)]
+        if host == 'medium.com':
+            yield f"https://medium.com/p/{rng.getrandbits(48):012x}"
+        else:
+            yield f"https://{host}/posts/{i}-{rng.getrandbits(32):08x}"
+
+
+def make_backend(name: str, workdir: str):
+    from cache import TextFileBackend, HashIndexBackend, SQLiteBackend
+
+    text_file = os.path.join(workdir, 'urls.txt')
+    if name == 'text':
+        return TextFileBackend(text_file)
+    if name == 'index':
+        return HashIndexBackend(text_file, os.path.join(workdir, 'urls.idx'))
+    if name == 'index+bloom':
+        return HashIndexBackend(text_file, os.path.join(workdir, 'urls.bloom.idx'),
+                                bloom_bits_per_key=10)
+    return SQLiteBackend(os.path.join(workdir, 'urls.db'), import_from=text_file)
+
+
+def worker(name: str, workdir: str) -> None:
+    """측정 한 번 (자식 프로세스에서 실행, 결과는 JSON으로 출력)"""
+    import cache  # noqa: F401  (import 비용은 측정에서 제외)
+
+    with open(os.path.join(workdir, 'urls.txt')) as f:
+        sample = [next(f).strip() for _ in range(LOOKUPS // 2)]
+    sample += [f"https://example.com/missing/{i}" for i in range(LOOKUPS - len(sample))]
+
+    backend = make_backend(name, workdir)
+    before = rss_kb()
+    started = time.perf_counter()
+    backend.load()
+    load_ms = (time.perf_counter() - started) * 1000
+    rss_delta = rss_kb() - before
+
+    started = time.perf_counter()
+    hits = sum(backend.contains(url) for url in sample)
+    lookup_ms = (time.perf_counter() - started) * 1000
+
+    result = {'load_ms': load_ms, 'rss_kb': rss_delta, 'lookup_ms': lookup_ms,
+              'hits': hits, 'count': backend.count()}
+    backend.close()
+    print(json.dumps(result))
+
+
+def run_worker(name: str, workdir: str) -> dict:
+    output = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), '--worker', name, workdir],
+        check=True, capture_output=True, text=True, cwd=ROOT,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main(sizes) -> None:
+    print(f"{'URL 수':>10} {'백엔드':<12} {'로드(ms)':>10} {'RSS 증가(KB)':>14} "
+          f"{'조회 {0}회(ms)'.format(LOOKUPS):>16}")
+    print("-" * 68)
+
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as workdir:
+            with open(os.path.join(workdir, 'urls.txt'), 'w') as f:
+                f.writelines(url + '\n' for url in make_urls(size))
+
+            for name in BACKENDS:
+                # 첫 실행은 인덱스/DB 생성 비용, 두 번째 실행이 평소 시작 비용
+                first = run_worker(name, workdir)
+                result = run_worker(name, workdir)
+                assert result['count'] == size and result['hits'] == LOOKUPS // 2
+                print(f"{size:>10,} {name:<12} {result['load_ms']:>10.1f} "
+                      f"{result['rss_kb']:>14,} {result['lookup_ms']:>16.1f}"
+                      + (f"   (최초 생성 {first['load_ms']:.0f}ms)" if name != 'text' else ""))
+        print()
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ['--worker']:
+        worker(sys.argv[2], sys.argv[3])
+    else:
+        main([int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES)
@@ -1,57 +1,515 @@
 # -*- coding: utf-8 -*-
 
+import atexit
 import os
-from config import CACHE_FILE
+import sqlite3
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, BinaryIO, Dict, List, Optional
 
+from config import (
+    CACHE_FILE, CACHE_FLUSH_INTERVAL, CACHE_BACKEND, CACHE_DB_FILE,
+    CACHE_INDEX_FILE, CACHE_INDEX_BLOOM_BITS,
+)
+from url_canon import canonicalize_url
+from url_index import HashIndex, url_hash, file_digest
+
+if sys.platform == 'win32':
+    import msvcrt
+else:
+    import fcntl
+
+
+@contextmanager
+def file_lock(lock_path: str):
+    """다른 프로세스와 공유하는 advisory 파일 잠금 (배타적)"""
+    with open(lock_path, 'a+') as f:
+        if sys.platform == 'win32':
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        else:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if sys.platform == 'win32':
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def complete_lines(text: str) -> List[str]:
+    """
+    줄바꿈으로 끝난 줄만 반환
+
+    마지막 줄이 줄바꿈 없이 끝나면 쓰기 도중 끊긴 것이므로 버린다
+    (잘린 URL이 유효한 항목으로 읽히지 않게).
+    """
+    lines = text.split('\n')
+    return lines[:-1]
+
+
+def read_raw_url_file(path: str) -> List[str]:
+    """URL 목록 텍스트 파일의 줄을 기록된 그대로 읽기 (끊긴 마지막 줄 제외, 없으면 빈 리스트)"""
+    if not os.path.exists(path):
+        return []
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        lines = complete_lines(f.read())
+    return [line.strip() for line in lines if line.strip()]
+
+
+def read_url_file(path: str) -> List[str]:
+    """URL 목록 텍스트 파일 읽기 (정규화 적용, 끊긴 마지막 줄 제외, 없으면 빈 리스트)"""
+    return [canonicalize_url(line) for line in read_raw_url_file(path)]
+
+
+def truncate_torn_tail(f: BinaryIO) -> None:
+    """
+    이전 쓰기가 줄 중간에 끊겼으면 마지막 줄바꿈 뒤를 잘라냄
+
+    f는 읽기·쓰기 가능한 바이너리 파일 (예: 'a+b').
+    """
+    end = pos = f.seek(0, os.SEEK_END)
+    while pos > 0:
+        start = max(0, pos - 4096)
+        f.seek(start)
+        chunk = f.read(pos - start)
+        if pos == end and chunk.endswith(b'\n'):
+            return
+        newline = chunk.rfind(b'\n')
+        if newline >= 0:
+            f.truncate(start + newline + 1)
+            return
+        pos = start
+    f.truncate(0)
+
+
+class CacheBackend(ABC):
+    """
+    캐시 저장소 인터페이스
+
+    URL은 URLCache에서 이미 정규화된 상태로 전달된다.
+    """
+
+    def load(self) -> None:
+        pass
+
+    @abstractmethod
+    def contains(self, url: str) -> bool:
+        """URL이 저장돼 있는지 확인"""
+
+    @abstractmethod
+    def add(self, url: str, post: Optional[Dict[str, Any]] = None,
+            page_id: str = "") -> None:
+        """URL 저장 (post, page_id는 저장소가 지원하면 함께 기록)"""
+
+    @abstractmethod
+    def count(self) -> int:
+        """저장된 URL 수"""
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.flush()
 
-class URLCache:
-    """URL 캐시 관리 클래스"""
 
-    def __init__(self, cache_file: str = CACHE_FILE):
+class TextFileBackend(CacheBackend):
+    """
+    텍스트 파일 캐시 (한 줄에 URL 하나)
+
+    추가된 URL은 메모리 버퍼에 모았다가 flush_interval마다(또는 종료 시)
+    한 번의 write + fsync로 파일에 추가한다. 파일 쓰기는 잠금 파일로
+    보호되므로 여러 실행이 같은 캐시를 안전하게 공유할 수 있다.
+    """
+
+    def __init__(self, cache_file: str = CACHE_FILE,
+                 flush_interval: float = CACHE_FLUSH_INTERVAL):
         self.cache_file = cache_file
+        self.lock_file = f"{cache_file}.lock"
+        self.flush_interval = flush_interval  # 0이면 추가할 때마다 기록
         self._urls: set = set()
-        self._loaded = False
+        self._pending: List[str] = []
+        self._last_flush = time.monotonic()
+        self._lock = threading.RLock()
 
-    def load(self) -> set:
-        """캐시 파일에서 URL 목록 로드"""
-        if self._loaded:
-            return self._urls
+    def load(self) -> None:
+        lines = read_raw_url_file(self.cache_file)
+        urls = [canonicalize_url(line) for line in lines]
+        self._urls = set(urls)
+        if urls != lines:
+            self._migrate()
 
-        if os.path.exists(self.cache_file):
-            with open(self.cache_file, 'r', encoding='utf-8') as f:
-                self._urls = set(line.strip() for line in f if line.strip())
-        else:
-            self._urls = set()
+    def _migrate(self) -> None:
+        """
+        표준 형태가 아닌 줄(정규화 이전 기록, 규칙 변경)이 있으면 파일을 다시 쓰기
+
+        순서는 유지하고 정규화로 겹친 줄만 하나로 합친다.
+        """
+        with self._lock:
+            with file_lock(self.lock_file):
+                urls = list(dict.fromkeys(read_url_file(self.cache_file)))
+                self._replace_file(urls)
+            self._urls = set(urls)
+        print(f"🔄 {self.cache_file}을 표준 URL 형태로 변환 ({len(urls)}개)")
 
-        self._loaded = True
-        return self._urls
+    def _replace_file(self, urls: List[str]) -> None:
+        """캐시 파일을 urls로 원자적으로 교체 (file_lock 안에서 호출)"""
+        tmp_path = f"{self.cache_file}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8', newline='\n') as f:
+            f.write(''.join(url + '\n' for url in urls))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.cache_file)
+
+    def contains(self, url: str) -> bool:
+        return url in self._urls
+
+    def add(self, url: str, post: Optional[Dict[str, Any]] = None,
+            page_id: str = "") -> None:
+        with self._lock:
+            if url in self._urls:
+                return
+            self._urls.add(url)
+            self._pending.append(url)
+
+            if time.monotonic() - self._last_flush >= self.flush_interval:
+                self.flush()
+
+    def count(self) -> int:
+        return len(self._urls)
+
+    def flush(self) -> None:
+        """버퍼의 URL을 파일에 추가하고 fsync"""
+        with self._lock:
+            self._last_flush = time.monotonic()
+            if not self._pending:
+                return
+
+            data = ''.join(url + '\n' for url in self._pending)
+            with file_lock(self.lock_file):
+                with open(self.cache_file, 'a+b') as f:
+                    # 이전 쓰기가 중간에 끊겼으면 잘린 URL을 먼저 지움
+                    truncate_torn_tail(f)
+                    f.write(data.encode('utf-8'))
+                    f.flush()
+                    os.fsync(f.fileno())
+
+            self._pending = []
+
+    def compact(self) -> int:
+        """
+        캐시 파일을 정규화·정렬·중복 제거해 원자적으로 다시 쓰기
+
+        Returns:
+            정리 후 URL 개수
+        """
+        with self._lock:
+            self.flush()
+            with file_lock(self.lock_file):
+                # 다른 실행이 추가한 URL까지 포함
+                urls = set(read_url_file(self.cache_file)) | self._urls
+                urls = sorted(url for url in urls if url.startswith('http'))
+                self._replace_file(urls)
+
+            self._urls = set(urls)
+            return len(urls)
+
+
+class HashIndexBackend(TextFileBackend):
+    """
+    텍스트 파일 + mmap 해시 인덱스 캐시
+
+    URL 문자열을 메모리에 올리지 않고, 텍스트 파일 옆의 정렬된 64비트
+    해시 인덱스(url_index.HashIndex)를 mmap해 이진 탐색으로 조회한다.
+    인덱스 이후 텍스트 파일에 추가된 줄만 읽어 메모리 해시 집합에 두고,
+    그 수가 rebuild_threshold를 넘으면 종료 시 인덱스를 다시 만든다.
+    텍스트 파일 기록(버퍼·잠금·fsync)은 TextFileBackend와 같다.
+    """
+
+    def __init__(self, cache_file: str = CACHE_FILE,
+                 index_file: str = CACHE_INDEX_FILE,
+                 flush_interval: float = CACHE_FLUSH_INTERVAL,
+                 bloom_bits_per_key: int = CACHE_INDEX_BLOOM_BITS,
+                 rebuild_threshold: int = 1000):
+        super().__init__(cache_file, flush_interval)
+        self.index = HashIndex(index_file)
+        self.bloom_bits_per_key = bloom_bits_per_key
+        self.rebuild_threshold = rebuild_threshold
+        self._extra: set = set()  # 인덱스에 없는 URL 해시
+
+    def load(self) -> None:
+        size = os.path.getsize(self.cache_file) if os.path.exists(self.cache_file) else 0
+        fresh = (
+            self.index.open()
+            and self.index.source_size <= size
+            and self.index.source_digest == file_digest(self.cache_file, self.index.source_size)
+        )
+        if not fresh:
+            # 인덱스가 없거나 텍스트 파일이 새로 쓰였으면 처음부터 생성
+            self._rebuild()
+            return
+
+        self._extra = set()
+        if size > self.index.source_size:
+            with open(self.cache_file, 'rb') as f:
+                f.seek(self.index.source_size)
+                tail = f.read().decode('utf-8', errors='replace')
+            for line in complete_lines(tail):
+                line = line.strip()
+                if not line:
+                    continue
+                h = url_hash(canonicalize_url(line))
+                if not self.index.contains_hash(h):
+                    self._extra.add(h)
+
+    def _rebuild(self) -> None:
+        """텍스트 파일 전체로 인덱스 다시 생성 (다른 실행의 기록과 겹치지 않게 잠금)"""
+        with self._lock:
+            self.flush()
+            self.index.close()
+            with file_lock(self.lock_file):
+                size = os.path.getsize(self.cache_file) if os.path.exists(self.cache_file) else 0
+                HashIndex.build(
+                    self.index.path,
+                    (url_hash(url) for url in read_url_file(self.cache_file)),
+                    source_size=size,
+                    source_digest=file_digest(self.cache_file, size),
+                    bloom_bits_per_key=self.bloom_bits_per_key,
+                )
+            self.index.open()
+            self._extra = set()
+
+    def _contains_hash(self, h: int) -> bool:
+        return h in self._extra or self.index.contains_hash(h)
+
+    def contains(self, url: str) -> bool:
+        return self._contains_hash(url_hash(url))
+
+    def add(self, url: str, post: Optional[Dict[str, Any]] = None,
+            page_id: str = "") -> None:
+        h = url_hash(url)
+        with self._lock:
+            if self._contains_hash(h):
+                return
+            self._extra.add(h)
+            self._pending.append(url)
+
+            if time.monotonic() - self._last_flush >= self.flush_interval:
+                self.flush()
+
+    def count(self) -> int:
+        return len(self.index) + len(self._extra)
+
+    def compact(self) -> int:
+        count = super().compact()
+        self._urls = set()  # 문자열 집합은 인덱스로 대체
+        self._rebuild()
+        return count
+
+    def close(self) -> None:
+        self.flush()
+        if len(self._extra) >= self.rebuild_threshold:
+            self._rebuild()
+        self.index.close()
+
+
+class SQLiteBackend(CacheBackend):
+    """
+    SQLite 캐시 (글 하나당 인덱스된 행 하나)
+
+    URL 외에 소스, 날짜, 제목, Notion 페이지 ID, 기록 시각을 저장한다.
+    포함 여부는 기본 키 인덱스로 조회하므로 시작 시 전체 로드가 없다.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS posts (
+            url TEXT PRIMARY KEY,
+            source TEXT NOT NULL DEFAULT '',
+            date TEXT NOT NULL DEFAULT '',
+            title TEXT NOT NULL DEFAULT '',
+            notion_page_id TEXT NOT NULL DEFAULT '',
+            created_at TEXT NOT NULL,
+            updated_at TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_posts_source_date ON posts (source, date);
+    """
+
+    def __init__(self, db_file: str = CACHE_DB_FILE,
+                 import_from: Optional[str] = CACHE_FILE):
+        self.db_file = db_file
+        self.import_from = import_from  # DB가 비어 있으면 한 번 가져올 텍스트 캐시
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def load(self) -> None:
+        """DB 연결 및 스키마 생성 (행은 읽지 않음)"""
+        if self._conn is not None:
+            return
+
+        self._conn = sqlite3.connect(self.db_file, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(self.SCHEMA)
+
+        if self.import_from and self._is_empty():
+            imported = self.import_text_file(self.import_from)
+            if imported:
+                print(f"📥 {self.import_from}에서 {imported}개 URL 가져옴")
+
+    def _is_empty(self) -> bool:
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM posts LIMIT 1").fetchone() is None
+
+    def import_text_file(self, path: str) -> int:
+        """텍스트 캐시 파일의 URL을 가져오기 (이미 있는 URL은 무시)"""
+        urls = read_url_file(path)
+        now = datetime.now().isoformat(timespec='seconds')
+        with self._lock, self._conn:
+            before = self._conn.total_changes
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO posts (url, created_at, updated_at) VALUES (?, ?, ?)",
+                [(url, now, now) for url in urls],
+            )
+            return self._conn.total_changes - before
+
+    def contains(self, url: str) -> bool:
+        with self._lock:
+            row = self._conn.execute("SELECT 1 FROM posts WHERE url = ?", (url,)).fetchone()
+        return row is not None
+
+    def add(self, url: str, post: Optional[Dict[str, Any]] = None,
+            page_id: str = "") -> None:
+        post = post or {}
+        now = datetime.now().isoformat(timespec='seconds')
+        with self._lock, self._conn:
+            self._conn.execute(
+                """
+                INSERT INTO posts (url, source, date, title, notion_page_id, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(url) DO UPDATE SET
+                    source = COALESCE(NULLIF(excluded.source, ''), posts.source),
+                    date = COALESCE(NULLIF(excluded.date, ''), posts.date),
+                    title = COALESCE(NULLIF(excluded.title, ''), posts.title),
+                    notion_page_id = COALESCE(NULLIF(excluded.notion_page_id, ''), posts.notion_page_id),
+                    updated_at = excluded.updated_at
+                """,
+                (url, post.get('source', ''), post.get('date', ''), post.get('title', ''),
+                 page_id or '', now, now),
+            )
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM posts").fetchone()[0]
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+class URLCache:
+    """
+    URL 캐시 관리 클래스
+
+    실제 저장은 백엔드(텍스트 파일, 해시 인덱스 또는 SQLite)가 담당한다.
+    모든 URL은 canonicalize_url로 정규화해서 비교·저장한다.
+    """
+
+    def __init__(self, cache_file: str = CACHE_FILE,
+                 backend: Optional[CacheBackend] = None):
+        self.cache_file = cache_file
+        self.backend = backend or TextFileBackend(cache_file)
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def load(self) -> None:
+        """백엔드 준비 (텍스트 백엔드는 파일 전체 로드)"""
+        with self._lock:
+            if self._loaded:
+                return
+            self.backend.load()
+            self._loaded = True
 
     def contains(self, url: str) -> bool:
         """URL이 캐시에 있는지 확인"""
         if not self._loaded:
             self.load()
-        return url in self._urls
+        return self.backend.contains(canonicalize_url(url))
+
+    def add(self, url: str, post: Optional[Dict[str, Any]] = None,
+            page_id: str = "") -> None:
+        """
+        URL을 캐시에 추가
 
-    def add(self, url: str) -> None:
-        """URL을 캐시에 추가"""
+        Args:
+            post: 글 정보 (source, date, title) - 저장 가능한 백엔드만 사용
+            page_id: 생성된 Notion 페이지 ID
+        """
         if not self._loaded:
             self.load()
+        self.backend.add(canonicalize_url(url), post, page_id)
 
-        if url not in self._urls:
-            self._urls.add(url)
-            with open(self.cache_file, 'a', encoding='utf-8') as f:
-                f.write(url + '\n')
+    def flush(self) -> None:
+        """버퍼된 변경 사항 기록"""
+        if self._loaded:
+            self.backend.flush()
+
+    def compact(self) -> int:
+        """텍스트 캐시 파일 정리 (정규화·정렬·중복 제거)"""
+        if not self._loaded:
+            self.load()
+        if not isinstance(self.backend, TextFileBackend):
+            raise TypeError("compact는 텍스트 파일 백엔드에서만 지원합니다")
+        return self.backend.compact()
+
+    def close(self) -> None:
+        """남은 버퍼 기록 후 백엔드 정리"""
+        if self._loaded:
+            self.backend.close()
+            self._loaded = False
 
     def __len__(self) -> int:
         """캐시된 URL 개수"""
         if not self._loaded:
             self.load()
-        return len(self._urls)
+        return self.backend.count()
 
     def __contains__(self, url: str) -> bool:
         """in 연산자 지원"""
         return self.contains(url)
 
 
+def create_cache(backend: str = CACHE_BACKEND) -> URLCache:
+    """설정에 맞는 백엔드로 캐시 생성 ("text", "index" 또는 "sqlite")"""
+    if backend == 'sqlite':
+        return URLCache(backend=SQLiteBackend())
+    if backend == 'index':
+        return URLCache(backend=HashIndexBackend())
+    return URLCache(backend=TextFileBackend())
+
+
 # 기본 캐시 인스턴스
-cache = URLCache()
+cache = create_cache()
+atexit.register(cache.close)
+
+
+if __name__ == "__main__":
+    # python cache.py compact : 텍스트 캐시 파일 정규화·정렬·중복 제거
+    # python cache.py import  : 텍스트 캐시 파일을 SQLite DB로 가져오기
+    command = sys.argv[1:]
+    if command == ['compact']:
+        text_cache = URLCache(backend=TextFileBackend())
+        print(f"🧹 캐시 정리 완료: {text_cache.compact()}개 URL")
+    elif command == ['import']:
+        db = SQLiteBackend(import_from=None)
+        db.load()
+        print(f"📥 {db.import_text_file(CACHE_FILE)}개 URL 가져옴 → {CACHE_DB_FILE}")
+        db.close()
+    else:
+        print("사용법: python cache.py compact | import")
@@ -5,15 +5,82 @@ import os
 # Notion API 설정
 NOTION_API_TOKEN = os.getenv('NOTION_API_KEY', '')
 NOTION_API_VERSION = "2022-06-28"
+NOTION_API_BASE_URL = os.getenv('NOTION_API_BASE_URL', "https://api.notion.com/v1")  # 로컬 스텁 등으로 바꿀 때 사용
 WEBLINKS_DATABASE_ID = "89728ea5-acb0-423c-b047-14ef6ce4ca83"
+NOTION_RATE_LIMIT = 3.0  # 평균 요청 수 상한 (req/s, Notion 문서 기준)
+NOTION_MAX_RETRIES = 5  # 429/5xx 응답 재시도 횟수
+NOTION_BACKOFF_BASE = 1.0  # 재시도 백오프 시작값 (초)
+NOTION_BACKOFF_MAX = 30.0  # 재시도 백오프 최대값 (초)
+
+# HTTP 연결 풀 설정
+HTTP_POOL_MAXSIZE = 8  # 호스트별 유지할 keep-alive 연결 수
+HTTP_TIMEOUT = 10  # 기본 요청 타임아웃 (초)
 
 # 캐시 설정
 CACHE_FILE = "notion_urls_cache.txt"
+CACHE_FLUSH_INTERVAL = 5.0  # 캐시 파일 기록 간격 (초, 0이면 추가할 때마다 기록)
+CACHE_BACKEND = os.getenv('CACHE_BACKEND', 'text')  # 캐시 백엔드 ("text", "index" 또는 "sqlite")
+CACHE_DB_FILE = "notion_posts.db"  # SQLite 캐시 파일
+CACHE_INDEX_FILE = "notion_urls_cache.idx"  # URL 해시 인덱스 파일 ("index" 백엔드)
+CACHE_INDEX_BLOOM_BITS = 0  # 해시 인덱스 앞단 Bloom 필터의 키당 비트 수 (0이면 사용 안 함)
+NOTION_SYNC_STATE_FILE = "notion_sync_state.json"  # Notion 미러 동기화 상태 (last_edited_time high-water mark)
+FEED_VALIDATOR_FILE = "feed_validators.json"  # RSS 조건부 요청 검증값 (ETag/Last-Modified/본문 해시)
+SOURCE_MARK_FILE = "source_marks.json"  # 소스별 최신 글 high-water mark (URL/날짜)
+HEALTH_FILE = "source_health.json"  # 소스별 최근 결과(성공 여부, 소요 시간, 오류 종류)와 회로 상태
+
+# URL 정규화 설정
+MEDIUM_CUSTOM_DOMAINS = frozenset({  # Medium에서 호스팅하는 커스텀 도메인
+    'techblog.gccompany.co.kr',
+})
 
 # 크롤링 설정
 MAX_POSTS_PER_SOURCE = 10  # 각 블로그당 최대 가져올 글 수
-REQUEST_DELAY = 0.3  # Notion API 호출 간 딜레이 (초)
+EARLY_STOP_STREAK = 2  # 이미 아는 글이 연속 몇 개 나오면 목록 파싱을 멈출지 (0이면 끝까지, 지난 실행이 끝까지 처리되지 않은 소스는 끝까지)
 PLAYWRIGHT_TIMEOUT = 15000  # Playwright 타임아웃 (ms)
+CRAWL_CONCURRENCY = 8  # 동시에 크롤링할 최대 소스 수
+SOURCE_TIMEOUT = 60  # 소스별 크롤링 제한 시간 (초, 크롤러의 모든 대기에 deadline으로 적용, 파이프라인 큐 대기는 제외)
+WORKER_SHUTDOWN_TIMEOUT = 10  # 크롤링이 끝난 뒤 브라우저 워커 종료를 기다리는 최대 시간 (초, 넘으면 두고 진행)
+BROWSER_WORKERS = 1  # Playwright 크롤러 동시 실행 수 (워커마다 Playwright 드라이버와 Chromium을 따로 띄우므로 N이면 Chromium N개)
+NOTION_WRITERS = 3  # Notion 작성 워커 수 (속도는 NOTION_RATE_LIMIT로 제한)
+PIPELINE_QUEUE_SIZE = 20  # 크롤러 → Notion 작성 큐 크기 (가득 차면 크롤러 대기)
+BROWSER_RECYCLE_PAGES = 50  # 브라우저 재시작 전 최대 페이지 수 (0이면 재시작 안 함)
+BROWSER_RSS_LIMIT_MB = int(os.getenv('BROWSER_RSS_LIMIT_MB', 1024))  # 풀마다 자기 Chromium 프로세스 RSS 합이 넘으면 재시작 (MB, 0이면 확인 안 함, /proc가 있는 Linux만)
+
+# backfill 설정 (python main.py --backfill)
+BACKFILL_MAX_PAGES = 20  # 1회 실행에서 소스별로 읽을 최대 목록 페이지 수
+BACKFILL_HOST_CONCURRENCY = 2  # 호스트별 동시 요청 수 (같은 호스트 소스끼리 공유)
+BACKFILL_PARSE_WORKERS = min(4, os.cpu_count() or 1)  # HTML 파싱 프로세스 수 (0이면 현재 프로세스)
+BACKFILL_CHECKPOINT_FILE = "backfill_checkpoint.json"  # 소스별 backfill 진행 위치
+
+# 실행 지표 설정
+METRICS_REPORT_FILE = "run_metrics.json"  # 실행 보고서 (단계별 시간, 소스별 글 수, Notion 지연, 빈 문자열이면 저장 안 함)
+METRICS_PROM_FILE = os.getenv('METRICS_PROM_FILE', "run_metrics.prom")  # Prometheus textfile collector 파일 (빈 문자열이면 저장 안 함)
+METRICS_LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)  # Notion 요청 지연 히스토그램 버킷 (초)
+
+# 녹화/재생 설정 (python main.py --record / --replay)
+REPLAY_DIR = "replay_cache"  # 목록 응답·DOM 스냅샷 저장 디렉토리
+REPLAY_TTL = int(os.getenv('REPLAY_TTL', 24 * 3600))  # 녹화한 응답을 재생할 수 있는 시간 (초, 0이면 무제한)
+
+# 프로파일링 설정 (python main.py --profile cpu|mem)
+PROFILE_DIR = "profiles"  # run.prof / 단계별 .mem.txt 저장 디렉토리
+PROFILE_TOP_N = 25  # 메모리 스냅샷 차이에서 남길 상위 줄 수
+PROFILE_MEM_FRAMES = 10  # tracemalloc이 할당마다 저장할 호출 스택 깊이
+
+# 회로 차단 설정 (연속으로 실패하는 소스는 제한 시간까지 기다리지 않고 건너뜀)
+HEALTH_HISTORY = 20  # 소스별로 남길 최근 결과 수
+HEALTH_FAILURE_THRESHOLD = 3  # 연속 실패가 이만큼이면 회로 열림 (0이면 회로 차단 안 함)
+HEALTH_OPEN_SECONDS = 6 * 3600  # 회로가 열린 뒤 다시 확인할 때까지 대기 시간 (초)
+HEALTH_OPEN_MAX_SECONDS = 7 * 24 * 3600  # 확인이 실패할 때마다 두 배로 늘리는 대기 시간 상한 (초)
+HEALTH_PROBE_TIMEOUT = 5  # 회로가 열린 소스 확인 요청(HEAD) 타임아웃 (초)
+
+# 데몬 모드 설정 (python main.py --daemon)
+DAEMON_STATE_FILE = "daemon_state.json"  # 소스별 폴링 일정 (최근 글 날짜, 다음 실행 시각, 연속 실패·무소식 횟수)
+DAEMON_DEFAULT_INTERVAL = 3 * 3600  # 글 날짜가 부족해 발행 주기를 모를 때 폴링 간격 (초)
+DAEMON_MIN_INTERVAL = 15 * 60  # 최소 폴링 간격 (초)
+DAEMON_MAX_INTERVAL = 24 * 3600  # 최대 폴링 간격 (초, 백오프 상한)
+DAEMON_CADENCE_FRACTION = 0.25  # 폴링 간격 = 최근 글 사이 간격(중앙값) × 이 값
+DAEMON_CADENCE_SAMPLES = 10  # 발행 주기 계산에 쓸 최근 글 날짜 수
+DAEMON_BACKOFF = 2.0  # 새 글이 없거나 실패할 때마다 간격에 곱할 값
 
 # Notion 기본 태그
 DEFAULT_TAG = "Articles"
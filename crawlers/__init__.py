@@ -1,45 +1,108 @@
 # -*- coding: utf-8 -*-
+"""
+크롤러 패키지
+
+크롤러 모듈은 이름(source_id)으로 등록해 두고 실제로 선택됐을 때만
+import한다. RSS 소스만 돌리면 Playwright를 불러오지 않는다.
+패키지 속성(D2Crawler, fetch_d2_posts, CRAWLERS, BrowserPool 등)도
+처음 접근할 때 해당 모듈을 import한다.
+"""
+
+from importlib import import_module
+from typing import Dict, Iterable, List, NamedTuple, Optional, Type
+
+# 인스턴스 이름이 모듈 이름과 같아서 바로 import (둘 다 Playwright 없이 가벼움)
+from .browser_pool import BrowserPool, BrowserWorkers, browser_pool, get_browser_pool
+from .feed_fetcher import FeedFetcher, feed_fetcher
+
+
+class CrawlerSpec(NamedTuple):
+    """등록된 크롤러 (모듈은 load할 때 import)"""
+    source_id: str
+    module: str       # 패키지 안 모듈 이름
+    class_name: str
+    fetch_name: str   # 함수형 인터페이스 이름
+    browser: bool     # Playwright 필요 여부
+
+    def load(self) -> Type:
+        return getattr(import_module(f".{self.module}", __name__), self.class_name)
+
+
+# 등록된 모든 크롤러 (실행 순서)
+CRAWLER_SPECS: Dict[str, CrawlerSpec] = {spec.source_id: spec for spec in [
+    CrawlerSpec('d2', 'd2', 'D2Crawler', 'fetch_d2_posts', browser=True),
+    CrawlerSpec('kakao', 'kakao', 'KakaoCrawler', 'fetch_kakao_tech_posts', browser=True),
+    CrawlerSpec('toss', 'toss', 'TossCrawler', 'fetch_toss_posts', browser=True),
+    CrawlerSpec('daangn', 'daangn', 'DaangnCrawler', 'fetch_daangn_posts', browser=False),
+    CrawlerSpec('gccompany', 'gccompany', 'GCCompanyCrawler', 'fetch_gccompany_posts', browser=False),
+    CrawlerSpec('wanted', 'wanted', 'WantedCrawler', 'fetch_wanted_posts', browser=False),
+    CrawlerSpec('coupang', 'coupang', 'CoupangCrawler', 'fetch_coupang_posts', browser=False),
+    CrawlerSpec('ridi', 'ridi', 'RidiCrawler', 'fetch_ridi_posts', browser=True),
+]}
+
+# 크롤러 외 공개 이름 → 모듈
+_EXPORTS = {
+    'BaseCrawler': 'base',
+    'Post': 'base',
+    'RSSCrawler': 'rss',
+    'MediumCrawler': 'medium',
+    'RoutingProfile': 'routing',
+    'RoutingStats': 'routing',
+    'ExtractionSpec': 'extraction',
+    'Field': 'extraction',
+    'ReadinessStrategy': 'readiness',
+    'SelectorReady': 'readiness',
+    'MinItemsReady': 'readiness',
+    'DomStableReady': 'readiness',
+    'NetworkIdleReady': 'readiness',
+    'AllReady': 'readiness',
+    'ReplayTransport': 'replay',
+    'ResponseStore': 'replay',
+    'ReplayMiss': 'replay',
+    'replay_transport': 'replay',
+}
+for _spec in CRAWLER_SPECS.values():
+    _EXPORTS[_spec.class_name] = _spec.module
+    _EXPORTS[_spec.fetch_name] = _spec.module
+
+
+def select_crawlers(source_ids: Optional[Iterable[str]] = None) -> List[Type]:
+    """
+    source_id 목록에 해당하는 크롤러 클래스 반환 (없으면 전체, 등록 순서 유지)
+
+    Raises:
+        KeyError: 등록되지 않은 source_id가 있을 때
+    """
+    if source_ids is None:
+        return [spec.load() for spec in CRAWLER_SPECS.values()]
+
+    wanted = set(source_ids)
+    unknown = wanted - CRAWLER_SPECS.keys()
+    if unknown:
+        raise KeyError(f"알 수 없는 소스: {', '.join(sorted(unknown))} "
+                       f"(가능: {', '.join(CRAWLER_SPECS)})")
+    return [spec.load() for source_id, spec in CRAWLER_SPECS.items() if source_id in wanted]
+
+
+def __getattr__(name: str):
+    if name == 'CRAWLERS':
+        return select_crawlers()
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(f".{module}", __name__), name)
 
-from .base import BaseCrawler, Post
-from .d2 import D2Crawler, fetch_d2_posts
-from .kakao import KakaoCrawler, fetch_kakao_tech_posts
-from .toss import TossCrawler, fetch_toss_posts
-from .daangn import DaangnCrawler, fetch_daangn_posts
-from .gccompany import GCCompanyCrawler, fetch_gccompany_posts
-from .wanted import WantedCrawler, fetch_wanted_posts
-from .coupang import CoupangCrawler, fetch_coupang_posts
-from .ridi import RidiCrawler, fetch_ridi_posts
-
-# 등록된 모든 크롤러 클래스
-CRAWLERS = [
-    D2Crawler,
-    KakaoCrawler,
-    TossCrawler,
-    DaangnCrawler,
-    GCCompanyCrawler,
-    WantedCrawler,
-    CoupangCrawler,
-    RidiCrawler,
-]
 
 __all__ = [
-    'BaseCrawler',
-    'Post',
-    'D2Crawler',
-    'KakaoCrawler',
-    'TossCrawler',
-    'DaangnCrawler',
-    'GCCompanyCrawler',
-    'WantedCrawler',
-    'CoupangCrawler',
-    'RidiCrawler',
-    'fetch_d2_posts',
-    'fetch_kakao_tech_posts',
-    'fetch_toss_posts',
-    'fetch_daangn_posts',
-    'fetch_gccompany_posts',
-    'fetch_wanted_posts',
-    'fetch_coupang_posts',
-    'fetch_ridi_posts',
+    'CRAWLER_SPECS',
+    'CrawlerSpec',
+    'select_crawlers',
     'CRAWLERS',
+    'BrowserPool',
+    'BrowserWorkers',
+    'browser_pool',
+    'get_browser_pool',
+    'FeedFetcher',
+    'feed_fetcher',
+    *_EXPORTS,
 ]
@@ -1,13 +1,27 @@
 # -*- coding: utf-8 -*-
 
+import time
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from datetime import datetime
-from typing import List, Dict, Any
-from playwright.sync_api import sync_playwright, Page
+from typing import List, Dict, Any, Optional, Iterable, Iterator, Callable, TYPE_CHECKING
 
-import sys
-sys.path.insert(0, '..')
-from config import MAX_POSTS_PER_SOURCE, PLAYWRIGHT_TIMEOUT
+if TYPE_CHECKING:
+    from playwright.sync_api import Page
+
+from config import MAX_POSTS_PER_SOURCE, PLAYWRIGHT_TIMEOUT, EARLY_STOP_STREAK, HEALTH_PROBE_TIMEOUT
+from url_canon import canonicalize_url
+from http_pool import http_pool
+from cache import cache
+from source_marks import source_marks
+from metrics import metrics
+from profiling import profiler
+from .browser_pool import get_browser_pool
+from .routing import RoutingProfile, RoutingStats, DEFAULT_ROUTING
+from .readiness import ReadinessStrategy, NetworkIdleReady
+from .extraction import ExtractionSpec
+from .static_html import USER_AGENT, extract_from_html, fetch_html
+from .replay import replay_transport
 
 
 class Post:
@@ -16,11 +30,16 @@ class Post:
     def __init__(self, title: str, url: str, summary: str = "",
                  date: str = "", source: str = ""):
         self.title = title
-        self.url = url
+        self.url = url  # Notion에 그대로 저장하는 원래 링크
         self.summary = summary
         self.date = date or datetime.now().strftime('%Y.%m.%d')
         self.source = source
 
+    @property
+    def key(self) -> str:
+        """캐시·중복 비교용 URL (canonicalize_url)"""
+        return canonicalize_url(self.url)
+
     def to_dict(self) -> Dict[str, Any]:
         """딕셔너리로 변환"""
         return {
@@ -39,16 +58,35 @@ class BaseCrawler(ABC):
     name: str = ""           # 크롤러 이름 (예: "D2", "카카오")
     source_id: str = ""      # 소스 ID (예: "d2", "kakao")
     base_url: str = ""       # 블로그 기본 URL
+    uses_browser: bool = True  # Playwright 사용 여부 (RSS 크롤러는 False)
+    routing: Optional[RoutingProfile] = DEFAULT_ROUTING  # 요청 차단 프로필 (None이면 차단 안 함)
+    readiness: ReadinessStrategy = NetworkIdleReady()  # 페이지 준비 완료 판단 전략
+    extraction: Optional[ExtractionSpec] = None  # 한 번의 page.evaluate로 추출할 항목 스펙
+    static_first: bool = False  # 정적 HTML을 먼저 시도하고 항목이 없을 때만 브라우저 사용
+    early_stop_streak: int = EARLY_STOP_STREAK  # 아는 글이 연속 N개면 중단 (0이면 끝까지)
+    max_backfill_gap: int = 1  # backfill에서 빈 목록 페이지가 연속 N개면 끝으로 판단
 
     def __init__(self):
         self.max_posts = MAX_POSTS_PER_SOURCE
         self.timeout = PLAYWRIGHT_TIMEOUT
+        self.routing_stats: Optional[RoutingStats] = None
+        self.readiness_ms: float = 0.0
+        self.parse_ms: float = 0.0
+        self.not_modified = False  # 소스가 지난 실행 이후 바뀌지 않음 (새 글 없음)
+        self.fetch_path = ""  # 실제 사용한 경로 ("static", "browser", "rss")
+        self.skipped = 0  # 이미 알고 있어서 건너뛴 목록 항목 수
+        self.deadline: Optional[float] = None  # 이 시각(time.monotonic)이 지나면 중단 (오케스트레이터가 설정)
+        self._paused_since: Optional[float] = None  # on_post에서 대기 중이면 그 시작 시각
+        self.error = ""  # fetch에서 처리한 예외 메시지 (없으면 빈 문자열)
+        self.error_class = ""  # 그 예외의 클래스 이름 (소스 상태 기록용)
 
     @abstractmethod
-    def parse_posts(self, page: Page) -> List[Post]:
+    def parse_posts(self, page: 'Page') -> List[Post]:
         """
         페이지에서 포스트 목록 파싱 (서브클래스에서 구현)
 
+        fetch가 readiness 전략을 만족시킨 뒤 호출하므로 별도 대기는 필요 없다.
+
         Args:
             page: Playwright 페이지 객체
 
@@ -57,26 +95,293 @@ class BaseCrawler(ABC):
         """
         pass
 
-    def fetch(self) -> List[Dict[str, Any]]:
-        """블로그에서 최신 글 가져오기"""
+    def time_left_ms(self) -> float:
+        """
+        다음 대기에 쓸 타임아웃 (ms): self.timeout과 deadline까지 남은 시간 중 작은 값
+
+        Raises:
+            TimeoutError: deadline이 이미 지났을 때
+        """
+        if self.deadline is None:
+            return self.timeout
+        remaining = (self.deadline - time.monotonic()) * 1000
+        if remaining <= 0:
+            raise TimeoutError(f"{self.name} 제한 시간 초과")
+        return min(self.timeout, remaining)
+
+    def seconds_left(self) -> Optional[float]:
+        """
+        deadline까지 남은 시간 (초, deadline이 없거나 멈춰 있으면 None)
+
+        크롤러 스레드 밖(오케스트레이터)에서 제한 시간을 확인할 때 쓴다.
+        """
+        if self.deadline is None or self._paused_since is not None:
+            return None
+        return self.deadline - time.monotonic()
+
+    @contextmanager
+    def _deadline_paused(self) -> Iterator[None]:
+        """
+        블록 동안 deadline을 멈춤
+
+        파이프라인 큐가 가득 차 on_post에서 기다리는 시간은 작성 쪽
+        backpressure라 소스의 크롤링 시간에 넣지 않는다.
+        """
+        started = time.monotonic()
+        self._paused_since = started
         try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                page = browser.new_page()
+            yield
+        finally:
+            if self.deadline is not None:
+                self.deadline += time.monotonic() - started
+            self._paused_since = None
+
+    def settle(self, delivered: bool) -> None:
+        """
+        실행이 끝난 뒤 이번에 받은 소스 상태를 확정하거나 버림
+
+        파이프라인이 모든 글을 처리(작성 또는 중복 확인)한 뒤에 호출한다.
+        delivered가 False면(오류, 시간 초과, 작성 실패) 다음 실행에서 처음부터
+        다시 보도록 저장된 상태를 지운다. 기본 구현은 mark의 'incomplete'
+        표시만 정리한다.
+        """
+        if delivered:
+            source_marks.complete(self.source_id)
+
+    def _bound_page(self, page: 'Page') -> None:
+        """페이지의 모든 Playwright 대기가 deadline을 넘지 않게 기본 타임아웃 설정"""
+        timeout = self.time_left_ms()
+        page.set_default_timeout(timeout)
+        page.set_default_navigation_timeout(timeout)
+
+    def build_posts(self, rows: List[Dict[str, str]]) -> List[Post]:
+        """
+        extraction 스펙 추출 결과에서 Post 목록 생성
+
+        정적 HTML 경로와 브라우저 경로가 같은 코드를 쓴다. 기본 구현은
+        'title', 'href', 'summary', 'date' 필드를 그대로 쓰고, 제목이나 링크가
+        없는 항목과 중복 URL은 건너뛴다. 필드 가공이 필요한 크롤러는 재정의한다.
+        """
+        posts = []
+        seen_urls = set()
+
+        for row in rows:
+            title = row.get('title', '')
+            href = row.get('href', '')
+            if not href or not title:
+                continue
+
+            url = self._make_absolute_url(href)
+            if url in seen_urls:
+                continue
+
+            posts.append(Post(
+                title=title,
+                url=url,
+                summary=row.get('summary', ''),
+                date=row.get('date', ''),
+                source=self.source_id,
+            ))
+            seen_urls.add(url)
+
+        return posts
+
+    def iter_posts(self) -> Iterator[Dict[str, Any]]:
+        """파싱된 글을 하나씩 반환 (예외는 fetch에서 처리)"""
+        posts = []
+        if replay_transport.replaying and self.extraction:
+            posts = self._fetch_snapshot()
+        if not posts and self.static_first and self.extraction:
+            posts = self._fetch_static()
+        if not posts:
+            posts = self._fetch_browser()
+
+        for post in self._until_known(posts[:self.max_posts]):
+            yield post.to_dict()
+
+    def _is_known(self, url: str, mark: Dict[str, str]) -> bool:
+        """high-water mark 글이거나 이미 캐시에 있는 글인지 확인 (url은 Post.key)"""
+        return url == mark.get('url') or url in cache
+
+    def _until_known(self, posts: Iterable[Optional[Post]]) -> Iterator[Post]:
+        """
+        최신순 목록에서 새 글만 반환하고, 아는 글이 early_stop_streak번
+        연속으로 나오면 나머지는 보지 않고 중단
+
+        상단 고정 글처럼 아는 글 하나가 끼어 있어도 바로 멈추지 않도록
+        연속 횟수로 판단한다. 건너뛴 항목 수(아는 글 + 보지 않은 나머지)는
+        self.skipped에 기록한다. posts는 지연 생성되는 이터러블이어도 된다.
+
+        지난 실행이 끝까지 처리되지 않았으면(mark의 'incomplete') 아는 글
+        뒤에 실패하거나 보지 못한 글이 남아 있을 수 있으므로 중단하지 않는다.
+        """
+        mark = source_marks.get(self.source_id)
+        stop_streak = 0 if mark.get('incomplete') else self.early_stop_streak
+        source_marks.begin(self.source_id)
+        remaining = iter(posts)
+        streak = 0
+        for index, post in enumerate(remaining):
+            if post is None:
+                continue
+            if not self._is_known(post.key, mark):
+                streak = 0
+                yield post
+                continue
 
-                print(f"  🌐 {self.name} 페이지 로딩 중...")
-                page.goto(self.base_url, wait_until="networkidle")
+            if index == 0:
+                # 목록 맨 위 글이 이미 알려져 있으면 mark로 기록
+                source_marks.advance(self.source_id, post.key, post.date)
+            self.skipped += 1
+            streak += 1
+            if stop_streak and streak >= stop_streak:
+                self.skipped += sum(1 for _ in remaining)
+                return
 
-                posts = self.parse_posts(page)
-                browser.close()
+    def fetch(self, on_post: Optional[Callable[[Dict[str, Any]], None]] = None) -> List[Dict[str, Any]]:
+        """
+        블로그에서 최신 글 가져오기
+
+        Args:
+            on_post: 글이 파싱될 때마다 호출할 콜백 (스트리밍 파이프라인용)
+        """
+        posts = []
+        try:
+            with metrics.span('fetch', self.source_id), profiler.stage(f"fetch-{self.source_id}"):
+                for post in self.iter_posts():
+                    # 제한 시간이 지난 뒤에는 오케스트레이터가 이미 실패로 처리했으므로 전달하지 않음
+                    self.time_left_ms()
+                    posts.append(post)
+                    if on_post:
+                        with self._deadline_paused():
+                            on_post(post)
 
-                print(f"  ✅ {len(posts)}개 글 파싱 완료")
-                return [post.to_dict() for post in posts[:self.max_posts]]
+            if not self.not_modified:
+                skipped = f", 아는 글 {self.skipped}개 건너뜀" if self.skipped else ""
+                print(f"  ✅ {self.name}: 새 글 {len(posts)}개 파싱 완료 "
+                      f"({self.fetch_path}, {self.parse_ms:.0f}ms{skipped})")
+            return posts
 
         except Exception as e:
+            self.error = str(e) or type(e).__name__
+            self.error_class = type(e).__name__
+            metrics.count('source_errors', source=self.source_id, error=self.error_class)
             print(f"❌ {self.name} 크롤링 실패: {e}")
+            return posts
+
+        finally:
+            if self.skipped:
+                metrics.count('posts', self.skipped, source=self.source_id, state='skipped')
+
+    @property
+    def probe_url(self) -> str:
+        """회로가 열린 뒤 가볍게 확인할 URL"""
+        return self.base_url
+
+    def probe(self, timeout: float = HEALTH_PROBE_TIMEOUT) -> None:
+        """
+        브라우저 없이 HEAD 요청 한 번으로 소스가 살아 있는지 확인 (실패하면 예외)
+
+        마크업이 바뀐 경우는 알 수 없으므로 통과하면 실제 크롤링으로 확인한다.
+        """
+        response = http_pool.request('HEAD', self.probe_url,
+                                     headers={'User-Agent': USER_AGENT}, timeout=timeout)
+        # 405, 501: HEAD를 받지 않는 서버 (살아 있음)
+        if response.status >= 400 and response.status not in (405, 501):
+            raise RuntimeError(f"확인 요청 HTTP {response.status}")
+
+    def _fetch_static(self) -> List[Post]:
+        """HTTP로 받은 HTML을 같은 셀렉터로 파싱 (실패하면 빈 리스트)"""
+        try:
+            print(f"  ⚡ {self.name} 정적 HTML 로딩 중...")
+            html = fetch_html(self.base_url, timeout=self.time_left_ms() / 1000,
+                              source=self.source_id)
+
+            parse_started = time.perf_counter()
+            posts = self.build_posts(extract_from_html(self.extraction, html))
+            self.parse_ms = (time.perf_counter() - parse_started) * 1000
+            metrics.record('parse', self.parse_ms, self.source_id)
+        except Exception as e:
+            print(f"  ⚠️  {self.name} 정적 HTML 실패, 브라우저로 전환: {e}")
+            return []
+
+        if not posts:
+            print(f"  ↪️  {self.name} 정적 HTML에 글 없음, 브라우저로 전환")
             return []
 
+        self.fetch_path = "static"
+        return posts
+
+    def _fetch_snapshot(self) -> List[Post]:
+        """녹화해 둔 DOM 스냅샷을 브라우저 없이 파싱 (재생 모드, 없으면 빈 리스트)"""
+        html = replay_transport.load_snapshot(self.base_url)
+        if html is None:
+            return []
+
+        parse_started = time.perf_counter()
+        posts = self.build_posts(extract_from_html(self.extraction, html))
+        self.parse_ms = (time.perf_counter() - parse_started) * 1000
+        metrics.record('parse', self.parse_ms, self.source_id)
+        self.fetch_path = "snapshot"
+        return posts
+
+    def _fetch_browser(self) -> List[Post]:
+        """Playwright로 페이지를 렌더링한 뒤 파싱"""
+        with get_browser_pool().page() as page:
+            self._bound_page(page)
+            if self.routing:
+                self.routing_stats = self.routing.apply(page)
+            else:
+                replay_transport.apply(page)
+
+            print(f"  🌐 {self.name} 페이지 로딩 중...")
+            with metrics.span('navigate', self.source_id):
+                page.goto(self.base_url, wait_until="domcontentloaded")
+
+            self.readiness_ms = self.readiness.measure(page, self.time_left_ms())
+            metrics.record('ready', self.readiness_ms, self.source_id)
+            print(f"  ⏱️  {self.name} 준비 완료: {self.readiness.label} {self.readiness_ms:.0f}ms")
+
+            parse_started = time.perf_counter()
+            posts = self.parse_posts(page)
+            self.parse_ms = (time.perf_counter() - parse_started) * 1000
+            metrics.record('parse', self.parse_ms, self.source_id)
+
+            if replay_transport.recording:
+                replay_transport.record_snapshot(self.base_url, page.content())
+
+        self.fetch_path = "browser"
+        if self.routing_stats:
+            print(f"  🚫 {self.name}: {self.routing_stats.summary()}")
+        return posts
+
+    def backfill_url(self, cursor: int) -> Optional[str]:
+        """
+        backfill용 과거 목록 페이지 URL (cursor는 0부터, 0은 첫 페이지)
+
+        목록을 페이지 단위로 넘겨 볼 수 없는 소스는 None을 반환한다.
+        """
+        return None
+
+    def render_html(self, url: str) -> str:
+        """
+        Playwright로 렌더링한 목록 페이지 HTML (backfill용)
+
+        마지막 페이지를 넘으면 readiness 신호가 오지 않으므로 대기 시간이
+        지나도 그때까지의 HTML을 그대로 반환한다.
+        """
+        with get_browser_pool().page() as page:
+            self._bound_page(page)
+            if self.routing:
+                self.routing.apply(page)
+            else:
+                replay_transport.apply(page)
+            page.goto(url, wait_until="domcontentloaded")
+            try:
+                self.readiness.measure(page, self.time_left_ms())
+            except Exception:
+                pass
+            return page.content()
+
     def _make_absolute_url(self, href: str) -> str:
         """상대 경로를 절대 경로로 변환"""
         if href.startswith('http'):
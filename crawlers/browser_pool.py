@@ -0,0 +1,271 @@
+# -*- coding: utf-8 -*-
+
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from playwright.sync_api import Browser, Page, Playwright
+
+from config import BROWSER_RECYCLE_PAGES, BROWSER_RSS_LIMIT_MB
+from metrics import metrics
+
+
+def _process_children() -> Dict[int, List[int]]:
+    """/proc에서 부모 pid → 자식 pid 목록 (/proc가 없으면 빈 dict)"""
+    try:
+        names = os.listdir('/proc')
+    except OSError:
+        return {}
+
+    children: Dict[int, List[int]] = {}
+    for name in names:
+        if not name.isdigit():
+            continue
+        try:
+            with open(f'/proc/{name}/stat', 'rb') as f:
+                stat = f.read()
+        except OSError:
+            continue
+        # 두 번째 필드(comm)에 공백·괄호가 들어갈 수 있어서 마지막 ')' 뒤부터 읽음
+        ppid = int(stat[stat.rindex(b')') + 2:].split()[1])
+        children.setdefault(ppid, []).append(int(name))
+    return children
+
+
+def child_pids(pid: Optional[int] = None) -> Set[int]:
+    """pid(기본: 현재 프로세스)의 직접 자식 프로세스"""
+    return set(_process_children().get(os.getpid() if pid is None else pid, []))
+
+
+def child_rss_mb(pid: int) -> float:
+    """
+    pid의 모든 하위 프로세스 RSS 합 (MB, pid 자신은 제외)
+
+    공유 메모리가 중복으로 더해지므로 실제보다 크게 나온다. /proc가 없으면 0.
+    """
+    children = _process_children()
+    page_size = os.sysconf('SC_PAGE_SIZE')
+    total = 0
+    pending = list(children.get(pid, []))
+    while pending:
+        child = pending.pop()
+        pending.extend(children.get(child, []))
+        try:
+            with open(f'/proc/{child}/statm', 'rb') as f:
+                total += int(f.read().split()[1]) * page_size
+        except (OSError, ValueError, IndexError):
+            continue
+    return total / (1024 * 1024)
+
+
+# 드라이버를 띄우기 전후의 자식 프로세스를 비교하는 동안 다른 풀이 끼어들지 않게 함
+_driver_start_lock = threading.Lock()
+
+
+class BrowserPool:
+    """
+    Chromium 브라우저 풀
+
+    프로세스당 Chromium을 한 번만 띄우고, 크롤러마다 격리된
+    BrowserContext/Page를 빌려준 뒤 반납받는다.
+
+    Playwright sync API 객체는 생성한 스레드에서만 사용할 수 있으므로
+    하나의 풀은 하나의 스레드에서만 사용해야 한다.
+    """
+
+    def __init__(self, recycle_after: int = BROWSER_RECYCLE_PAGES,
+                 headless: bool = True, rss_limit_mb: int = BROWSER_RSS_LIMIT_MB):
+        self.recycle_after = recycle_after  # N개 페이지 제공 후 브라우저 재시작 (0이면 비활성)
+        self.headless = headless
+        self.rss_limit_mb = rss_limit_mb  # 이 풀의 Chromium RSS 합이 넘으면 재시작 (0이면 비활성)
+        self._playwright: Optional['Playwright'] = None
+        self._driver_pid: Optional[int] = None  # 이 풀의 Playwright 드라이버 (Chromium의 부모)
+        self._browser: Optional['Browser'] = None
+        self._pages_served = 0
+        self._leased = 0
+        self.launches = 0
+
+    def _is_healthy(self) -> bool:
+        """브라우저 연결 상태 확인"""
+        if self._browser is None:
+            return False
+        try:
+            return self._browser.is_connected()
+        except Exception:
+            return False
+
+    def _needs_recycle(self) -> bool:
+        """재시작이 필요한지 확인 (빌려준 페이지가 없을 때만)"""
+        if self._leased:
+            return False
+        if not self._is_healthy():
+            return True
+        if self.recycle_after and self._pages_served >= self.recycle_after:
+            return True
+        return self._over_memory_limit()
+
+    def _over_memory_limit(self) -> bool:
+        """
+        Chromium 메모리가 rss_limit_mb를 넘었는지 확인
+
+        이 풀의 드라이버 아래 프로세스(Chromium 브라우저·렌더러·GPU)만 더한다.
+        드라이버 자신과 다른 워커의 Chromium은 포함하지 않는다.
+        """
+        if not self.rss_limit_mb or self._driver_pid is None:
+            return False
+        rss = child_rss_mb(self._driver_pid)
+        if rss <= self.rss_limit_mb:
+            return False
+        print(f"  ♻️  Chromium 메모리 {rss:.0f}MB > {self.rss_limit_mb}MB, 브라우저 재시작")
+        metrics.count('browser_recycles', reason='memory')
+        return True
+
+    def _launch(self) -> 'Browser':
+        """Chromium 실행"""
+        with metrics.span('browser_launch'):
+            if self._playwright is None:
+                # Playwright는 처음 브라우저를 띄울 때만 import (RSS만 돌 때는 불러오지 않음)
+                from playwright.sync_api import sync_playwright
+                with _driver_start_lock:
+                    before = child_pids()
+                    self._playwright = sync_playwright().start()
+                    started = child_pids() - before
+                # 새로 생긴 자식이 하나가 아니면(/proc 없음 등) 메모리 확인을 하지 않음
+                self._driver_pid = started.pop() if len(started) == 1 else None
+
+            self._browser = self._playwright.chromium.launch(headless=self.headless)
+        self._pages_served = 0
+        self.launches += 1
+        return self._browser
+
+    def _close_browser(self) -> None:
+        """브라우저만 종료 (Playwright 드라이버는 유지)"""
+        if self._browser is not None:
+            try:
+                self._browser.close()
+            except Exception:
+                pass
+        self._browser = None
+
+    def _acquire_browser(self) -> 'Browser':
+        """건강한 브라우저 반환 (필요하면 재시작)"""
+        if self._browser is not None and self._needs_recycle():
+            self._close_browser()
+        if self._browser is None:
+            self._launch()
+        return self._browser
+
+    @contextmanager
+    def page(self) -> Iterator['Page']:
+        """격리된 컨텍스트의 페이지를 빌려주고 종료 시 반납"""
+        browser = self._acquire_browser()
+        try:
+            context = browser.new_context()
+        except Exception:
+            # 브라우저가 죽었으면 한 번만 재시작 후 재시도
+            if self._leased:
+                raise
+            self._close_browser()
+            context = self._launch().new_context()
+
+        self._leased += 1
+        self._pages_served += 1
+        try:
+            yield context.new_page()
+        finally:
+            self._leased -= 1
+            try:
+                context.close()
+            except Exception:
+                pass
+
+    def close(self) -> None:
+        """브라우저와 Playwright 드라이버 종료"""
+        self._close_browser()
+        if self._playwright is not None:
+            try:
+                self._playwright.stop()
+            except Exception:
+                pass
+        self._playwright = None
+        self._driver_pid = None
+
+
+class BrowserWorkers:
+    """
+    브라우저 전용 워커 스레드 묶음
+
+    각 워커 스레드는 자기 BrowserPool을 소유하고, 작업이 끝나면
+    자기 스레드에서 브라우저를 종료한다. Playwright sync API 객체는 만든
+    스레드 밖에서 쓸 수 없어 브라우저 하나를 워커끼리 나눠 쓰지 못하므로,
+    워커 N개는 Playwright 드라이버와 Chromium N개를 띄운다 (메모리도 N배).
+    """
+
+    def __init__(self, workers: int):
+        self._jobs: queue.Queue = queue.Queue()
+        self._threads: List[threading.Thread] = []
+        for i in range(max(1, workers)):
+            thread = threading.Thread(target=self._run, name=f"browser-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def submit(self, fn: Callable[[], Any]) -> Future:
+        """작업을 워커에 전달하고 Future 반환"""
+        future: Future = Future()
+        self._jobs.put((future, fn))
+        return future
+
+    def _run(self) -> None:
+        """워커 루프"""
+        try:
+            while True:
+                job = self._jobs.get()
+                if job is None:
+                    break
+
+                future, fn = job
+                if not future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    future.set_result(fn())
+                except BaseException as e:
+                    future.set_exception(e)
+        finally:
+            get_browser_pool().close()
+
+    def shutdown(self, timeout: Optional[float] = None) -> List[str]:
+        """
+        남은 작업을 마친 뒤 모든 워커 종료
+
+        timeout(초)이 있으면 그만큼만 기다리고, 아직 작업 중인 워커는
+        (데몬 스레드이므로) 두고 돌아간다. 남겨 둔 워커 이름 목록을 반환한다.
+        """
+        for _ in self._threads:
+            self._jobs.put(None)
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for thread in self._threads:
+            thread.join(None if deadline is None else max(0.0, deadline - time.monotonic()))
+        return [thread.name for thread in self._threads if thread.is_alive()]
+
+
+# 기본 브라우저 풀 인스턴스 (메인 스레드용)
+browser_pool = BrowserPool()
+
+_local = threading.local()
+
+
+def get_browser_pool() -> BrowserPool:
+    """현재 스레드의 브라우저 풀 반환"""
+    if threading.current_thread() is threading.main_thread():
+        return browser_pool
+
+    pool = getattr(_local, 'pool', None)
+    if pool is None:
+        pool = _local.pool = BrowserPool()
+    return pool
@@ -1,9 +1,13 @@
 # -*- coding: utf-8 -*-
 
-from typing import List
-from playwright.sync_api import Page
+from typing import List, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from playwright.sync_api import Page
 
 from .base import BaseCrawler, Post
+from .extraction import ExtractionSpec, Field
+from .readiness import SelectorReady
 
 
 class D2Crawler(BaseCrawler):
@@ -12,58 +16,26 @@ class D2Crawler(BaseCrawler):
     name = "D2"
     source_id = "d2"
     base_url = "https://d2.naver.com/helloworld"
-
-    def parse_posts(self, page: Page) -> List[Post]:
+    static_first = True  # 목록 마크업이 초기 HTML에 포함됨
+    readiness = SelectorReady('.cont_post')
+
+    extraction = ExtractionSpec(
+        items=['.cont_post'],
+        fields={
+            'title': Field('h2 a'),                # h2 > a 태그에서 제목
+            'href': Field('h2 a', attr='href'),    # h2 > a 태그에서 URL
+            'summary': Field('.post_txt'),
+            'date': Field('dl dd'),                # dl > dd 중 첫 번째
+        },
+    )
+
+    def backfill_url(self, cursor: int) -> Optional[str]:
+        """과거 목록 페이지 URL (?page=N, 1부터)"""
+        return self.base_url if cursor == 0 else f"{self.base_url}?page={cursor + 1}"
+
+    def parse_posts(self, page: 'Page') -> List[Post]:
         """D2 블로그 포스트 파싱"""
-        posts = []
-        seen_urls = set()
-
-        # JavaScript 렌더링 대기
-        page.wait_for_selector('.cont_post', timeout=self.timeout)
-
-        # 모든 article 선택
-        articles = page.query_selector_all('.cont_post')
-
-        for article in articles:
-            try:
-                # h2 > a 태그에서 제목과 URL 추출
-                h2_link = article.query_selector('h2 a')
-                if not h2_link:
-                    continue
-
-                title = h2_link.inner_text().strip()
-                href = h2_link.get_attribute('href')
-
-                if not href or not title:
-                    continue
-
-                url = self._make_absolute_url(href)
-
-                # URL 중복 체크
-                if url in seen_urls:
-                    continue
-
-                # 요약(summary) 추출
-                summary_elem = article.query_selector('.post_txt')
-                summary = summary_elem.inner_text().strip() if summary_elem else ""
-
-                # 날짜 추출 (dl > dd 중 첫 번째)
-                date_elem = article.query_selector('dl dd')
-                date = date_elem.inner_text().strip() if date_elem else ""
-
-                posts.append(Post(
-                    title=title,
-                    url=url,
-                    summary=summary,
-                    date=date,
-                    source=self.source_id,
-                ))
-                seen_urls.add(url)
-
-            except Exception:
-                continue
-
-        return posts
+        return self.build_posts(self.extraction.extract(page))
 
 
 # 편의를 위한 함수형 인터페이스
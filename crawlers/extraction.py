@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+
+from typing import Dict, Iterable, List, Optional, Any, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from playwright.sync_api import Page
+
+# 스펙을 인자로 받아 모든 항목을 한 번에 추출하는 브라우저 측 스크립트
+EXTRACT_SCRIPT = """(spec) => {
+    const pick = (root, field) => {
+        const selectors = field.selectors.length ? field.selectors : [null];
+        for (const selector of selectors) {
+            const el = selector === null ? root : root.querySelector(selector);
+            if (!el) continue;
+            const raw = field.attr ? el.getAttribute(field.attr) : el.innerText;
+            const value = (raw || '').trim();
+            if (value && value.length > field.minLength) return value;
+        }
+        return '';
+    };
+
+    let items = [];
+    for (const selector of spec.items) {
+        items = Array.from(document.querySelectorAll(selector));
+        if (items.length) break;
+    }
+
+    return items.map((item) => {
+        const root = (spec.container && item.querySelector(spec.container)) || item;
+        const row = {};
+        for (const [name, field] of Object.entries(spec.fields)) {
+            row[name] = pick(root, field);
+        }
+        return row;
+    });
+}"""
+
+
+class Field:
+    """
+    추출할 필드 정의
+
+    Args:
+        selectors: 항목 안에서 차례로 시도할 셀렉터 (비우면 항목 자신)
+        attr: 읽을 속성 이름 (None이면 innerText)
+        min_length: 이 길이보다 긴 값만 채택
+    """
+
+    def __init__(self, *selectors: str, attr: Optional[str] = None,
+                 min_length: int = 0):
+        self.selectors = list(selectors)
+        self.attr = attr
+        self.min_length = min_length
+
+    def compile(self) -> Dict[str, Any]:
+        return {
+            'selectors': self.selectors,
+            'attr': self.attr,
+            'minLength': self.min_length,
+        }
+
+
+class ExtractionSpec:
+    """
+    선언적 추출 스펙
+
+    Args:
+        items: 항목 셀렉터 후보 (처음으로 결과가 있는 셀렉터 사용)
+        fields: 필드 이름 → Field
+        container: 항목 안에서 필드를 찾을 하위 요소 (없으면 항목 자신)
+    """
+
+    def __init__(self, items: Iterable[str], fields: Dict[str, Field],
+                 container: Optional[str] = None):
+        self.items = list(items)
+        self.fields = fields
+        self.container = container
+
+    def compile(self) -> Dict[str, Any]:
+        """page.evaluate 인자로 넘길 JSON 구조로 변환"""
+        return {
+            'items': self.items,
+            'container': self.container,
+            'fields': {name: field.compile() for name, field in self.fields.items()},
+        }
+
+    def extract(self, page: 'Page') -> List[Dict[str, str]]:
+        """한 번의 page.evaluate 호출로 모든 항목 추출"""
+        return page.evaluate(EXTRACT_SCRIPT, self.compile())
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+
+from datetime import date
+from typing import List, Dict, Optional
+
+from .base import Post
+from .extraction import ExtractionSpec, Field
+from .rss import RSSCrawler
+
+
+class MediumCrawler(RSSCrawler):
+    """
+    Medium 크롤러 베이스 클래스 (RSS 피드 + 월별 아카이브 backfill)
+
+    RSS 피드에는 최신 글 10개만 있으므로 backfill은 퍼블리케이션의
+    월별 아카이브(/archive/YYYY/MM)를 이번 달부터 거꾸로 훑는다.
+    """
+
+    # 글이 없는 달이 길게 이어질 수 있으므로 2년 연속 비어 있을 때 종료
+    max_backfill_gap = 24
+
+    extraction = ExtractionSpec(
+        items=['.postArticle', '.streamItem', 'article'],
+        fields={
+            'href': Field(
+                '.postArticle-readMore a', 'a[data-action="open-post"]',
+                'h3 a', 'a[href*="/p/"]', attr='href',
+            ),
+            'title': Field('h3', 'h2'),
+            'summary': Field('h4', '.graf--subtitle', 'p', min_length=10),
+            'date': Field('time', attr='datetime'),
+        },
+    )
+
+    def backfill_url(self, cursor: int) -> Optional[str]:
+        """cursor개월 전 아카이브 URL (개인 프로필은 월별 아카이브가 없어 None)"""
+        if '/@' in self.base_url:
+            return None
+
+        today = date.today()
+        months = today.year * 12 + (today.month - 1) - cursor
+        year, month = divmod(months, 12)
+        if year < 2012:  # Medium 서비스 시작 이전
+            return None
+        return f"{self.base_url.rstrip('/')}/archive/{year}/{month + 1:02d}"
+
+    def build_posts(self, rows: List[Dict[str, str]]) -> List[Post]:
+        """아카이브 추출 결과에서 Post 목록 생성"""
+        posts = []
+        seen_urls = set()
+
+        for row in rows:
+            href = row['href']
+            title = row['title']
+            if not href or not title:
+                continue
+
+            post = Post(
+                title=title,
+                url=self._make_absolute_url(href),
+                summary=row['summary'],
+                # <time datetime="2023-05-10T01:23:45.678Z">
+                date=row['date'][:10].replace('-', '.'),
+                source=self.source_id,
+            )
+            if post.key in seen_urls:
+                continue
+
+            posts.append(post)
+            seen_urls.add(post.key)
+
+        return posts
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+
+import time
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from playwright.sync_api import Page
+
+
+class ReadinessStrategy(ABC):
+    """페이지 준비 완료 판단 전략 (서브클래스에서 wait 구현)"""
+
+    label: str = ""
+
+    @abstractmethod
+    def wait(self, page: 'Page', timeout: float) -> None:
+        """준비될 때까지 대기 (timeout: ms)"""
+
+    def measure(self, page: 'Page', timeout: float) -> float:
+        """대기 후 소요 시간(ms) 반환"""
+        started = time.perf_counter()
+        self.wait(page, timeout)
+        return (time.perf_counter() - started) * 1000
+
+
+class SelectorReady(ReadinessStrategy):
+    """셀렉터가 DOM에 나타나면 준비 완료"""
+
+    def __init__(self, selector: str):
+        self.selector = selector
+        self.label = f"selector({selector})"
+
+    def wait(self, page: 'Page', timeout: float) -> None:
+        page.wait_for_selector(self.selector, state='attached', timeout=timeout)
+
+
+class MinItemsReady(ReadinessStrategy):
+    """셀렉터에 맞는 요소가 N개 이상이면 준비 완료"""
+
+    def __init__(self, selector: str, count: int):
+        self.selector = selector
+        self.count = count
+        self.label = f"min_items({selector}, {count})"
+
+    def wait(self, page: 'Page', timeout: float) -> None:
+        page.wait_for_function(
+            "([selector, count]) => document.querySelectorAll(selector).length >= count",
+            arg=[self.selector, self.count],
+            timeout=timeout,
+        )
+
+
+class DomStableReady(ReadinessStrategy):
+    """DOM 변경이 X ms 동안 없으면 준비 완료"""
+
+    _OBSERVE_SCRIPT = """() => {
+        if (window.__domStableObserver) return;
+        window.__lastDomMutation = performance.now();
+        window.__domStableObserver = new MutationObserver(() => {
+            window.__lastDomMutation = performance.now();
+        });
+        window.__domStableObserver.observe(document, {
+            childList: true, subtree: true, characterData: true,
+        });
+    }"""
+
+    def __init__(self, quiet_ms: int = 500):
+        self.quiet_ms = quiet_ms
+        self.label = f"dom_stable({quiet_ms}ms)"
+
+    def wait(self, page: 'Page', timeout: float) -> None:
+        page.evaluate(self._OBSERVE_SCRIPT)
+        page.wait_for_function(
+            "(quietMs) => performance.now() - window.__lastDomMutation >= quietMs",
+            arg=self.quiet_ms,
+            polling=100,
+            timeout=timeout,
+        )
+
+
+class NetworkIdleReady(ReadinessStrategy):
+    """네트워크 요청이 멈추면 준비 완료 (기존 networkidle 동작)"""
+
+    label = "networkidle"
+
+    def wait(self, page: 'Page', timeout: float) -> None:
+        page.wait_for_load_state('networkidle', timeout=timeout)
+
+
+class AllReady(ReadinessStrategy):
+    """여러 전략을 순서대로 모두 만족하면 준비 완료"""
+
+    def __init__(self, *strategies: ReadinessStrategy):
+        self.strategies = strategies
+        self.label = " + ".join(s.label for s in strategies)
+
+    def wait(self, page: 'Page', timeout: float) -> None:
+        deadline = time.perf_counter() + timeout / 1000
+        for strategy in self.strategies:
+            remaining = max(1.0, (deadline - time.perf_counter()) * 1000)
+            strategy.wait(page, remaining)
@@ -0,0 +1,231 @@
+# -*- coding: utf-8 -*-
+
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Dict, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from playwright.sync_api import Page, Route
+
+from config import REPLAY_DIR, REPLAY_TTL
+from http_pool import HTTPResponse
+
+REPLAY_MODES = ('record', 'replay')
+
+# 응답 헤더 중 재생할 때 빼는 것 (본문은 이미 풀려 있고 길이도 달라질 수 있음)
+_DROP_HEADERS = frozenset({'content-encoding', 'content-length', 'transfer-encoding', 'connection'})
+
+
+class ReplayMiss(LookupError):
+    """재생 모드에서 저장된 응답이 없거나 TTL이 지남"""
+
+
+class ResponseStore:
+    """
+    URL별 응답 저장소
+
+    응답마다 메타데이터(<키>.json)와 본문(<키>.body) 두 파일로 저장한다.
+    키는 URL의 해시라 파일 이름 길이와 문자를 신경 쓰지 않아도 된다.
+    각 파일은 임시 파일 교체 방식으로 써서 여러 스레드가 동시에 기록해도 된다.
+    """
+
+    def __init__(self, directory: str = REPLAY_DIR, ttl: float = REPLAY_TTL):
+        self.directory = directory
+        self.ttl = ttl  # 저장 후 재생할 수 있는 시간 (초, 0이면 무제한)
+
+    def _path(self, url: str, suffix: str) -> str:
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()[:32]
+        return os.path.join(self.directory, f"{key}{suffix}")
+
+    def _fresh(self, recorded_at: float) -> bool:
+        return not self.ttl or time.time() - recorded_at <= self.ttl
+
+    def get(self, url: str) -> Optional[HTTPResponse]:
+        """저장된 응답 (없거나 TTL이 지났으면 None)"""
+        try:
+            with open(self._path(url, '.json'), 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            if not self._fresh(meta.get('recorded_at', 0)):
+                return None
+            with open(self._path(url, '.body'), 'rb') as f:
+                body = f.read()
+        except (OSError, ValueError):
+            return None
+        return HTTPResponse(meta['status'], meta.get('headers', {}), body)
+
+    def put(self, url: str, status: int, headers: Dict[str, str], body: bytes) -> None:
+        """응답 저장 (본문을 먼저 쓰고 메타데이터를 나중에 써서 반쯤 쓴 항목이 보이지 않게 함)"""
+        os.makedirs(self.directory, exist_ok=True)
+        headers = {k.lower(): v for k, v in headers.items() if k.lower() not in _DROP_HEADERS}
+        meta = {'url': url, 'status': status, 'headers': headers, 'recorded_at': time.time()}
+
+        suffix = f".{threading.get_ident()}.tmp"
+        for path, data in ((self._path(url, '.body'), body),
+                           (self._path(url, '.json'), json.dumps(meta, ensure_ascii=False).encode('utf-8'))):
+            with open(path + suffix, 'wb') as f:
+                f.write(data)
+            os.replace(path + suffix, path)
+
+    def prune(self) -> int:
+        """TTL이 지난 항목 삭제 후 삭제한 수 반환"""
+        if not self.ttl or not os.path.isdir(self.directory):
+            return 0
+
+        removed = 0
+        for name in os.listdir(self.directory):
+            if not name.endswith('.json'):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    recorded_at = json.load(f).get('recorded_at', 0)
+            except (OSError, ValueError):
+                recorded_at = 0
+            if self._fresh(recorded_at):
+                continue
+            for stale in (path, path[:-len('.json')] + '.body'):
+                try:
+                    os.remove(stale)
+                except OSError:
+                    pass
+            removed += 1
+        return removed
+
+
+class ReplayTransport:
+    """
+    크롤러 응답 녹화/재생
+
+    - record: 평소처럼 요청하면서 목록 응답(정적 HTML, 피드 본문)과
+      브라우저가 받은 모든 응답, 준비 완료 시점의 DOM 스냅샷을 저장
+    - replay: 블로그에 요청하지 않고 저장된 응답만 사용 (없으면 ReplayMiss)
+      브라우저 소스는 DOM 스냅샷이 있으면 Chromium 없이 바로 파싱하고,
+      없으면 Playwright 라우팅에서 저장된 응답으로 페이지를 다시 렌더링
+    - 그 외(기본): 아무것도 하지 않음
+
+    정적 HTML은 static_html.fetch_html, 피드는 FeedFetcher, 브라우저는
+    RoutingProfile과 BaseCrawler가 이 객체를 거친다. Notion 요청은 대상이 아니다.
+    """
+
+    def __init__(self, store: Optional[ResponseStore] = None):
+        self.mode = ""
+        self.store = store or ResponseStore()
+        self.recorded = 0
+        self.replayed = 0
+        self.missed = 0
+        self._lock = threading.Lock()
+
+    def configure(self, mode: str, ttl: Optional[float] = None) -> None:
+        """모드 설정 (빈 문자열이면 끔), 녹화 모드면 만료된 항목 정리"""
+        if mode and mode not in REPLAY_MODES:
+            raise ValueError(f"알 수 없는 녹화/재생 모드: {mode}")
+        self.mode = mode
+        if ttl is not None:
+            self.store.ttl = ttl
+        if mode == 'record':
+            self.store.prune()
+
+    @property
+    def active(self) -> bool:
+        return bool(self.mode)
+
+    @property
+    def recording(self) -> bool:
+        return self.mode == 'record'
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == 'replay'
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def lookup(self, url: str) -> Optional[HTTPResponse]:
+        """
+        재생 모드면 저장된 응답 반환 (없으면 ReplayMiss), 아니면 None
+
+        None이면 호출한 쪽에서 평소처럼 요청한다.
+        """
+        if not self.replaying:
+            return None
+        response = self.store.get(url)
+        if response is None:
+            self._count('missed')
+            raise ReplayMiss(f"재생할 응답 없음 (녹화 안 됨 또는 만료): {url}")
+        self._count('replayed')
+        return response
+
+    def record(self, url: str, status: int, headers: Dict[str, str], body: bytes) -> None:
+        """녹화 모드면 응답 저장"""
+        if not self.recording:
+            return
+        self.store.put(url, status, headers, body)
+        self._count('recorded')
+
+    def snapshot_url(self, url: str) -> str:
+        """DOM 스냅샷 저장 키 (원본 응답과 구분)"""
+        return f"{url}#dom-snapshot"
+
+    def record_snapshot(self, url: str, html: str) -> None:
+        """준비 완료 시점의 DOM 저장 (녹화 모드)"""
+        self.record(self.snapshot_url(url), 200,
+                    {'content-type': 'text/html; charset=utf-8'}, html.encode('utf-8'))
+
+    def load_snapshot(self, url: str) -> Optional[str]:
+        """재생 모드에서 저장된 DOM (없으면 None, 원본 응답 재생으로 넘어감)"""
+        if not self.replaying:
+            return None
+        response = self.store.get(self.snapshot_url(url))
+        if response is None:
+            return None
+        self._count('replayed')
+        return response.text()
+
+    def forward(self, route: 'Route') -> None:
+        """
+        차단하지 않은 Playwright 요청 처리
+
+        평소에는 그대로 보내고, 녹화 모드면 받은 응답을 저장한 뒤 전달,
+        재생 모드면 저장된 응답으로 응답한다 (없으면 요청 중단).
+        GET이 아닌 요청은 녹화/재생하지 않는다.
+        """
+        request = route.request
+        if not self.active or request.method != 'GET':
+            if self.replaying:
+                route.abort()
+            else:
+                route.continue_()
+            return
+
+        if self.recording:
+            response = route.fetch()
+            body = response.body()
+            self.record(request.url, response.status, response.headers, body)
+            route.fulfill(response=response, body=body)
+            return
+
+        try:
+            response = self.lookup(request.url)
+        except ReplayMiss:
+            route.abort()
+            return
+        route.fulfill(status=response.status, headers=response.headers, body=response.body)
+
+    def apply(self, page: 'Page') -> None:
+        """라우팅 프로필이 없는 크롤러용: 모든 요청을 forward로 처리"""
+        if self.active:
+            page.route("**/*", self.forward)
+
+    def summary(self) -> str:
+        """한 줄 요약"""
+        if self.recording:
+            return f"응답 {self.recorded}개 녹화 ({self.store.directory}/)"
+        return f"응답 {self.replayed}개 재생, 없음 {self.missed}개"
+
+
+# 기본 녹화/재생 인스턴스 (configure 전에는 꺼져 있음)
+replay_transport = ReplayTransport()
@@ -1,9 +1,13 @@
 # -*- coding: utf-8 -*-
 
-from typing import List
-from playwright.sync_api import Page
+from typing import List, Dict, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from playwright.sync_api import Page
 
 from .base import BaseCrawler, Post
+from .extraction import ExtractionSpec, Field
+from .readiness import SelectorReady
 
 
 class RidiCrawler(BaseCrawler):
@@ -12,109 +16,67 @@ class RidiCrawler(BaseCrawler):
     name = "RIDI"
     source_id = "ridi"
     base_url = "https://ridicorp.com/story-category/tech-blog/"
-
-    def parse_posts(self, page: Page) -> List[Post]:
+    static_first = True  # Listing markup is server-rendered.
+    readiness = SelectorReady('.entry-meta')
+
+    extraction = ExtractionSpec(
+        items=['article', '.entry-meta'],
+        container='.entry-meta',
+        fields={
+            'href': Field('.entry-title a', 'a[href*="/story/"]', attr='href'),
+            'link_text': Field('.entry-title a', 'a[href*="/story/"]'),
+            'title': Field(
+                '.entry-title', 'h2', 'h3', '.story-card__title', '.story-item__title',
+                '.card__title', '.title', '[class*="title"]',
+            ),
+            'summary': Field(
+                '.entry-summary', 'p', '.story-card__desc', '.story-item__desc',
+                '.card__desc', '.summary', '[class*="desc"]',
+                min_length=10,
+            ),
+            'date': Field(
+                '.entry-date', 'time', '.date', '.post-date', '[class*="date"]',
+            ),
+        },
+    )
+
+    def backfill_url(self, cursor: int) -> Optional[str]:
+        """Archive listing URL (WordPress /page/N/, 1-based)."""
+        return self.base_url if cursor == 0 else f"{self.base_url}page/{cursor + 1}/"
+
+    def parse_posts(self, page: 'Page') -> List[Post]:
         """Parse posts from RIDI story category page."""
+        return self.build_posts(self.extraction.extract(page))
+
+    def build_posts(self, rows: List[Dict[str, str]]) -> List[Post]:
+        """Build posts from extracted rows."""
         posts = []
         seen_urls = set()
 
-        page.wait_for_selector('.entry-meta', timeout=self.timeout)
-
-        articles = page.query_selector_all('article')
-        if not articles:
-            articles = page.query_selector_all('.entry-meta')
-
-        for article in articles:
-            try:
-                container = article
-                if hasattr(article, "query_selector"):
-                    meta = article.query_selector('.entry-meta')
-                    if meta:
-                        container = meta
-
-                link = None
-                if hasattr(container, "query_selector"):
-                    link = container.query_selector('.entry-title a')
-                    if not link:
-                        link = container.query_selector('a[href*="/story/"]')
-                if not link:
-                    continue
-
-                href = link.get_attribute('href')
-                if not href:
-                    continue
-
-                url = self._make_absolute_url(href)
-                if url in seen_urls:
-                    continue
-
-                title = self._extract_title(container, link)
-                if not title or len(title) < 3:
-                    continue
-
-                summary = self._extract_summary(container, link)
-                date = self._extract_date(container, link)
-
-                posts.append(Post(
-                    title=title,
-                    url=url,
-                    summary=summary,
-                    date=date,
-                    source=self.source_id,
-                ))
-                seen_urls.add(url)
-
-            except Exception:
+        for row in rows:
+            href = row['href']
+            if not href:
                 continue
 
-        return posts
+            url = self._make_absolute_url(href)
+            if url in seen_urls:
+                continue
 
-    def _extract_title(self, article, link) -> str:
-        """Extract title from the entry meta."""
-        candidates = [
-            '.entry-title', 'h2', 'h3', '.story-card__title', '.story-item__title',
-            '.card__title', '.title', '[class*="title"]',
-        ]
-        for selector in candidates:
-            elem = article.query_selector(selector) if hasattr(article, "query_selector") else None
-            if elem:
-                text = elem.inner_text().strip()
-                if text:
-                    return text
-
-        if hasattr(link, "inner_text"):
-            text = link.inner_text().strip()
-            if text:
-                return text.split('\n')[0].strip()
-
-        return ""
-
-    def _extract_summary(self, article, link) -> str:
-        """Extract summary if available."""
-        candidates = [
-            '.entry-summary', 'p', '.story-card__desc', '.story-item__desc',
-            '.card__desc', '.summary', '[class*="desc"]',
-        ]
-        for selector in candidates:
-            elem = article.query_selector(selector) if hasattr(article, "query_selector") else None
-            if elem:
-                text = elem.inner_text().strip()
-                if text and len(text) > 10:
-                    return text
-        return ""
-
-    def _extract_date(self, article, link) -> str:
-        """Extract date text if available."""
-        candidates = [
-            '.entry-date', 'time', '.date', '.post-date', '[class*="date"]',
-        ]
-        for selector in candidates:
-            elem = article.query_selector(selector) if hasattr(article, "query_selector") else None
-            if elem:
-                text = elem.inner_text().strip()
-                if text:
-                    return text
-        return ""
+            # Fall back to the first line of the link text.
+            title = row['title'] or row['link_text'].split('\n')[0].strip()
+            if not title or len(title) < 3:
+                continue
+
+            posts.append(Post(
+                title=title,
+                url=url,
+                summary=row['summary'],
+                date=row['date'],
+                source=self.source_id,
+            ))
+            seen_urls.add(url)
+
+        return posts
 
 
 def fetch_ridi_posts():
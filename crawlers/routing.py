@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+
+from typing import Dict, Iterable, TYPE_CHECKING
+from urllib.parse import urlparse
+
+if TYPE_CHECKING:
+    from playwright.sync_api import Page, Route
+
+from .replay import replay_transport
+
+
+# 기본 차단 리소스 타입 (parse_posts는 텍스트와 href만 읽음)
+DEFAULT_BLOCKED_TYPES = frozenset({
+    'image', 'media', 'font', 'stylesheet', 'beacon', 'ping', 'texttrack',
+})
+
+# 기본 차단 서드파티 도메인 (분석/광고/트래커)
+DEFAULT_BLOCKED_DOMAINS = frozenset({
+    'google-analytics.com',
+    'googletagmanager.com',
+    'doubleclick.net',
+    'googlesyndication.com',
+    'facebook.net',
+    'facebook.com',
+    'hotjar.com',
+    'amplitude.com',
+    'mixpanel.com',
+    'segment.io',
+    'sentry.io',
+    'datadoghq.com',
+    'nr-data.net',
+    'clarity.ms',
+    'channel.io',
+    'wcs.naver.net',
+})
+
+# 차단한 요청의 예상 크기 (바이트, 리소스 타입별 대략적인 중앙값)
+# 차단된 요청은 응답을 받지 않으므로 실제 크기 대신 추정치로 집계한다.
+ESTIMATED_BYTES = {
+    'image': 40_000,
+    'media': 500_000,
+    'font': 30_000,
+    'stylesheet': 20_000,
+    'script': 25_000,
+    'xhr': 5_000,
+    'fetch': 5_000,
+}
+DEFAULT_ESTIMATED_BYTES = 2_000
+
+
+def _host_matches(host: str, domains: Iterable[str]) -> bool:
+    """호스트가 도메인 목록(하위 도메인 포함)에 속하는지 확인"""
+    return any(host == d or host.endswith('.' + d) for d in domains)
+
+
+class RoutingStats:
+    """요청 차단 통계"""
+
+    def __init__(self):
+        self.allowed = 0
+        self.blocked = 0
+        self.bytes_avoided = 0
+        self.blocked_by_type: Dict[str, int] = {}
+
+    def record_block(self, resource_type: str) -> None:
+        self.blocked += 1
+        self.bytes_avoided += ESTIMATED_BYTES.get(resource_type, DEFAULT_ESTIMATED_BYTES)
+        self.blocked_by_type[resource_type] = self.blocked_by_type.get(resource_type, 0) + 1
+
+    def summary(self) -> str:
+        """한 줄 요약"""
+        return (f"요청 {self.blocked}/{self.allowed + self.blocked}개 차단, "
+                f"약 {self.bytes_avoided / 1024:.0f}KB 절약")
+
+
+class RoutingProfile:
+    """
+    Playwright 요청 가로채기 프로필
+
+    리소스 타입과 서드파티 도메인 기준으로 무거운 요청을 차단한다.
+    크롤러별로 allow_types / allow_domains 로 예외를 둘 수 있다.
+    """
+
+    def __init__(self,
+                 blocked_types: Iterable[str] = DEFAULT_BLOCKED_TYPES,
+                 blocked_domains: Iterable[str] = DEFAULT_BLOCKED_DOMAINS,
+                 allow_types: Iterable[str] = (),
+                 allow_domains: Iterable[str] = ()):
+        self.blocked_types = frozenset(blocked_types) - frozenset(allow_types)
+        self.blocked_domains = frozenset(blocked_domains)
+        self.allow_domains = frozenset(allow_domains)
+
+    def should_block(self, url: str, resource_type: str) -> bool:
+        """요청 차단 여부 판단"""
+        if resource_type == 'document':
+            return False
+
+        host = urlparse(url).hostname or ''
+        if self.allow_domains and _host_matches(host, self.allow_domains):
+            return False
+        if resource_type in self.blocked_types:
+            return True
+        return _host_matches(host, self.blocked_domains)
+
+    def apply(self, page: 'Page') -> RoutingStats:
+        """페이지에 라우팅 규칙 등록 후 통계 객체 반환"""
+        stats = RoutingStats()
+
+        def handle(route: 'Route') -> None:
+            request = route.request
+            if self.should_block(request.url, request.resource_type):
+                stats.record_block(request.resource_type)
+                route.abort()
+            else:
+                stats.allowed += 1
+                replay_transport.forward(route)  # 평소에는 continue_, 녹화/재생 모드면 저장소 경유
+
+        page.route("**/*", handle)
+        return stats
+
+
+# 기본 라우팅 프로필
+DEFAULT_ROUTING = RoutingProfile()
@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+
+import hashlib
+import re
+import time
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Iterator
+from html import unescape
+
+import feedparser
+
+from .base import BaseCrawler, Post
+from .feed_fetcher import feed_fetcher
+from .replay import replay_transport
+from feed_validators import feed_validators
+from metrics import metrics
+
+
+class RSSCrawler(BaseCrawler):
+    """RSS 피드 기반 크롤러 베이스 클래스 (조건부 GET 지원)"""
+
+    feed_url: str = ""       # RSS 피드 URL
+    uses_browser = False
+
+    def __init__(self):
+        super().__init__()
+        # 이번에 받은 피드의 검증값 (settle에서 저장 여부 결정)
+        self.pending_validators: Optional[Dict[str, str]] = None
+
+    def iter_posts(self) -> Iterator[Dict[str, Any]]:
+        """RSS 피드에서 최신 글을 엔트리 단위로 반환"""
+        print(f"  🌐 {self.name} RSS 피드 로딩 중...")
+        body = self._download_feed()
+
+        if body is None:
+            print(f"  ♻️  {self.name} 피드 변경 없음")
+            return
+
+        parse_started = time.perf_counter()
+        feed = feedparser.parse(body)
+        self.parse_ms = (time.perf_counter() - parse_started) * 1000
+        metrics.record('parse', self.parse_ms, self.source_id)
+
+        if feed.bozo and not feed.entries:
+            raise ValueError(f"RSS 파싱 실패: {feed.bozo_exception}")
+
+        self.fetch_path = "rss"
+        entries = (self._parse_entry(entry) for entry in feed.entries[:self.max_posts])
+        for post in self._until_known(entries):
+            yield post.to_dict()
+
+    @property
+    def probe_url(self) -> str:
+        return self.feed_url
+
+    def feed_request_headers(self) -> Dict[str, str]:
+        """저장된 검증값으로 조건부 GET 요청 헤더 구성 (녹화 중에는 항상 전체 본문 요청)"""
+        validators = feed_validators.get(self.source_id, self.feed_url)
+
+        headers = {
+            'User-Agent': feedparser.USER_AGENT,
+            'Accept-Encoding': 'gzip',
+        }
+        if replay_transport.recording:
+            return headers
+        if validators.get('etag'):
+            headers['If-None-Match'] = validators['etag']
+        if validators.get('last_modified'):
+            headers['If-Modified-Since'] = validators['last_modified']
+        return headers
+
+    def _download_feed(self) -> Optional[bytes]:
+        """
+        공유 피드 다운로더에서 조건부 GET 응답 받기
+
+        Returns:
+            피드 본문 (304 응답이거나 본문 해시가 같으면 None)
+        """
+        validators = feed_validators.get(self.source_id, self.feed_url)
+        with metrics.span('feed_download', self.source_id):
+            response = feed_fetcher.fetch(self)
+
+        if replay_transport.replaying:
+            # 재생한 본문은 지난 실행과 같으므로 검증값 비교 없이 다시 파싱
+            return response.body
+        if response.status == 304:
+            self.not_modified = True
+            return None
+        if not response.ok:
+            raise RuntimeError(f"RSS 피드 HTTP {response.status}")
+
+        body = response.body
+        body_hash = hashlib.sha256(body).hexdigest()
+        # 글이 모두 처리된 뒤에만 저장 (중간에 실패하면 다음 실행이 304로 글을 놓침)
+        self.pending_validators = {
+            'etag': response.headers.get('etag'),
+            'last_modified': response.headers.get('last-modified'),
+            'body_hash': body_hash,
+        }
+
+        if validators.get('body_hash') == body_hash:
+            self.not_modified = True
+            return None
+
+        return body
+
+    def settle(self, delivered: bool) -> None:
+        """모든 글이 처리됐으면 이번 검증값 저장, 아니면 저장된 검증값 제거"""
+        super().settle(delivered)
+        pending, self.pending_validators = self.pending_validators, None
+        if delivered:
+            if pending is not None:
+                feed_validators.update(self.source_id, self.feed_url, **pending)
+        else:
+            feed_validators.invalidate(self.source_id)
+
+    def _parse_entry(self, entry) -> Optional[Post]:
+        """RSS 엔트리에서 Post 객체 생성"""
+        title = entry.get('title', '').strip()
+        url = entry.get('link', '').strip()
+
+        if not title or not url:
+            return None
+
+        # 요약 추출 (HTML 태그 제거)
+        summary = self._extract_summary(entry)
+
+        # 날짜 파싱
+        date = self._parse_date(entry)
+
+        return Post(
+            title=title,
+            url=url,
+            summary=summary,
+            date=date,
+            source=self.source_id,
+        )
+
+    def _extract_summary(self, entry) -> str:
+        """RSS 엔트리에서 요약 추출"""
+        # summary 또는 description 필드 사용
+        raw = entry.get('summary', '') or entry.get('description', '')
+
+        # HTML 태그 제거
+        text = re.sub(r'<[^>]+>', '', raw)
+        # HTML 엔티티 디코딩
+        text = unescape(text)
+        # 연속 공백 정리
+        text = re.sub(r'\s+', ' ', text).strip()
+
+        # 최대 500자로 제한
+        if len(text) > 500:
+            text = text[:497] + '...'
+
+        return text
+
+    def _parse_date(self, entry) -> str:
+        """RSS 엔트리에서 날짜 파싱 (YYYY.MM.DD 형식)"""
+        # published_parsed 또는 updated_parsed 사용
+        time_struct = entry.get('published_parsed') or entry.get('updated_parsed')
+
+        if time_struct:
+            try:
+                dt = datetime(*time_struct[:6])
+                return dt.strftime('%Y.%m.%d')
+            except Exception:
+                pass
+
+        # 문자열에서 파싱 시도
+        date_str = entry.get('published', '') or entry.get('updated', '')
+        if date_str:
+            try:
+                # RFC 2822 형식 파싱 시도
+                from email.utils import parsedate_to_datetime
+                dt = parsedate_to_datetime(date_str)
+                return dt.strftime('%Y.%m.%d')
+            except Exception:
+                pass
+
+        return datetime.now().strftime('%Y.%m.%d')
+
+    def parse_posts(self, page) -> List[Post]:
+        """RSS 기반이므로 사용하지 않음 (추상 메서드 구현)"""
+        return []
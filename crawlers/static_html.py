@@ -0,0 +1,314 @@
+# -*- coding: utf-8 -*-
+
+import re
+from html.parser import HTMLParser
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urljoin
+
+from http_pool import http_pool
+from metrics import metrics
+from .extraction import ExtractionSpec, Field
+from .feed_fetcher import MAX_REDIRECTS
+from .replay import replay_transport
+
+# 정적 HTML 요청 User-Agent (일부 블로그는 기본 urllib UA를 차단)
+USER_AGENT = (
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/130.0.0.0 Safari/537.36"
+)
+
+# 닫는 태그가 없는 요소
+VOID_TAGS = frozenset({
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link',
+    'meta', 'param', 'source', 'track', 'wbr',
+})
+
+# innerText에서 줄바꿈을 만드는 블록 요소
+BLOCK_TAGS = frozenset({
+    'address', 'article', 'aside', 'blockquote', 'dd', 'div', 'dl', 'dt',
+    'figcaption', 'figure', 'footer', 'form', 'h1', 'h2', 'h3', 'h4', 'h5',
+    'h6', 'header', 'li', 'main', 'nav', 'ol', 'p', 'pre', 'section',
+    'table', 'tr', 'ul',
+})
+
+# innerText에 포함되지 않는 요소
+HIDDEN_TAGS = frozenset({'script', 'style', 'noscript', 'template', 'head'})
+
+
+class Node:
+    """최소 DOM 노드 (요소 또는 텍스트)"""
+
+    def __init__(self, tag: str, attrs: Optional[Dict[str, str]] = None,
+                 parent: Optional['Node'] = None, text: str = ""):
+        self.tag = tag
+        self.attrs = attrs or {}
+        self.parent = parent
+        self.children: List['Node'] = []
+        self.text = text
+
+    @property
+    def is_text(self) -> bool:
+        return self.tag == '#text'
+
+    @property
+    def classes(self) -> List[str]:
+        return self.attrs.get('class', '').split()
+
+    def iter_descendants(self):
+        """문서 순서대로 하위 요소 순회"""
+        for child in self.children:
+            if not child.is_text:
+                yield child
+                yield from child.iter_descendants()
+
+    def query_selector_all(self, selector: str) -> List['Node']:
+        matcher = compile_selector(selector)
+        return [node for node in self.iter_descendants() if matcher(node)]
+
+    def query_selector(self, selector: str) -> Optional['Node']:
+        matcher = compile_selector(selector)
+        for node in self.iter_descendants():
+            if matcher(node):
+                return node
+        return None
+
+    def get_attribute(self, name: str) -> Optional[str]:
+        return self.attrs.get(name)
+
+    def inner_text(self) -> str:
+        """브라우저 innerText 근사값 (블록 경계와 <br>에서 줄바꿈)"""
+        parts: List[str] = []
+        self._collect_text(parts)
+        lines = ''.join(parts).split('\n')
+        lines = [re.sub(r'\s+', ' ', line).strip() for line in lines]
+        return '\n'.join(line for line in lines if line)
+
+    def _collect_text(self, parts: List[str]) -> None:
+        for child in self.children:
+            if child.is_text:
+                parts.append(child.text)
+            elif child.tag == 'br':
+                parts.append('\n')
+            elif child.tag in HIDDEN_TAGS:
+                continue
+            elif child.tag in BLOCK_TAGS:
+                parts.append('\n')
+                child._collect_text(parts)
+                parts.append('\n')
+            else:
+                child._collect_text(parts)
+
+
+class _TreeBuilder(HTMLParser):
+    """HTMLParser 이벤트로 Node 트리 구성"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.root = Node('#document')
+        self._stack = [self.root]
+
+    def handle_starttag(self, tag, attrs):
+        node = Node(tag, {k: v or '' for k, v in attrs}, self._stack[-1])
+        self._stack[-1].children.append(node)
+        if tag not in VOID_TAGS:
+            self._stack.append(node)
+
+    def handle_startendtag(self, tag, attrs):
+        node = Node(tag, {k: v or '' for k, v in attrs}, self._stack[-1])
+        self._stack[-1].children.append(node)
+
+    def handle_endtag(self, tag):
+        # 짝이 맞지 않는 닫는 태그는 가장 가까운 같은 태그까지 닫음
+        for i in range(len(self._stack) - 1, 0, -1):
+            if self._stack[i].tag == tag:
+                del self._stack[i:]
+                return
+
+    def handle_data(self, data):
+        parent = self._stack[-1]
+        parent.children.append(Node('#text', parent=parent, text=data))
+
+
+def parse_html(html: str) -> Node:
+    """HTML 문자열을 Node 트리로 파싱"""
+    builder = _TreeBuilder()
+    builder.feed(html)
+    builder.close()
+    return builder.root
+
+
+# CSS 셀렉터: 크롤러 스펙이 실제로 쓰는 형태만 지원
+#   태그, .class, [attr], [attr=v], [attr^=v], [attr*=v], 그리고 자손 결합자(공백)
+# #id, 자식 결합자(>), $=, 쉼표 목록, 가상 클래스 등은 ValueError로 거부한다.
+# 스펙에 새 셀렉터 형태를 쓰려면 여기에 추가하고 tests/test_static_html.py에 사례를 넣는다.
+
+_COMPOUND_RE = re.compile(
+    r'(?P<tag>[a-zA-Z][\w-]*)'
+    r'|\.(?P<cls>[\w-]+)'
+    r'|\[(?P<attr>[\w-]+)(?:(?P<op>[\^\*]?=)["\']?(?P<value>[^"\'\]]*)["\']?)?\]'
+)
+
+_selector_cache: Dict[str, object] = {}
+
+
+def _parse_compound(text: str) -> List[Tuple[str, str, str, str]]:
+    """복합 셀렉터를 (종류, 이름, 연산자, 값) 목록으로 변환"""
+    conditions = []
+    pos = 0
+    while pos < len(text):
+        match = _COMPOUND_RE.match(text, pos)
+        if not match:
+            raise ValueError(f"지원하지 않는 셀렉터: {text}")
+        if match.group('tag'):
+            conditions.append(('tag', match.group('tag').lower(), '', ''))
+        elif match.group('cls'):
+            conditions.append(('class', match.group('cls'), '', ''))
+        else:
+            conditions.append(('attr', match.group('attr'),
+                               match.group('op') or '', match.group('value') or ''))
+        pos = match.end()
+    return conditions
+
+
+def _matches_compound(node: Node, conditions) -> bool:
+    for kind, name, op, value in conditions:
+        if kind == 'tag':
+            if node.tag != name:
+                return False
+        elif kind == 'class':
+            if name not in node.classes:
+                return False
+        else:
+            actual = node.attrs.get(name)
+            if actual is None:
+                return False
+            if op == '=' and actual != value:
+                return False
+            if op == '^=' and not actual.startswith(value):
+                return False
+            if op == '*=' and value not in actual:
+                return False
+    return True
+
+
+def compile_selector(selector: str):
+    """
+    셀렉터 문자열을 node → bool 함수로 변환
+
+    Raises:
+        ValueError: 지원하지 않는 셀렉터 형태
+    """
+    cached = _selector_cache.get(selector)
+    if cached:
+        return cached
+
+    # 자손 결합자로 이어진 복합 셀렉터들 (오른쪽에서 왼쪽으로 매칭)
+    steps = [_parse_compound(token) for token in selector.split()]
+    if not steps:
+        raise ValueError(f"지원하지 않는 셀렉터: {selector!r}")
+
+    def match_steps(node: Node, index: int) -> bool:
+        if not _matches_compound(node, steps[index]):
+            return False
+        if index == 0:
+            return True
+        ancestor = node.parent
+        while ancestor is not None and ancestor.tag != '#document':
+            if match_steps(ancestor, index - 1):
+                return True
+            ancestor = ancestor.parent
+        return False
+
+    def matcher(node: Node) -> bool:
+        return match_steps(node, len(steps) - 1)
+
+    _selector_cache[selector] = matcher
+    return matcher
+
+
+# ExtractionSpec 평가 (extraction.EXTRACT_SCRIPT 와 같은 규칙)
+
+def _pick(root: Node, field: Field) -> str:
+    for selector in field.selectors or [None]:
+        el = root if selector is None else root.query_selector(selector)
+        if el is None:
+            continue
+        raw = el.get_attribute(field.attr) if field.attr else el.inner_text()
+        value = (raw or '').strip()
+        if value and len(value) > field.min_length:
+            return value
+    return ''
+
+
+def extract_from_html(spec: ExtractionSpec, html: str) -> List[Dict[str, str]]:
+    """정적 HTML에 ExtractionSpec 적용"""
+    document = parse_html(html)
+
+    items: List[Node] = []
+    for selector in spec.items:
+        items = document.query_selector_all(selector)
+        if items:
+            break
+
+    rows = []
+    for item in items:
+        root = (spec.container and item.query_selector(spec.container)) or item
+        rows.append({name: _pick(root, field) for name, field in spec.fields.items()})
+    return rows
+
+
+class HTTPStatusError(RuntimeError):
+    """정적 HTML 요청이 2xx가 아닌 응답으로 끝남"""
+
+    def __init__(self, url: str, status: int):
+        super().__init__(f"HTTP {status}: {url}")
+        self.url = url
+        self.status = status
+
+
+_CHARSET_RE = re.compile(r'charset=["\']?([\w-]+)', re.IGNORECASE)
+
+
+def fetch_html(url: str, timeout: float = 15, source: str = "") -> str:
+    """
+    HTTP GET으로 HTML 문자열 가져오기 (녹화/재생 모드면 저장소 경유)
+
+    피드와 같은 keep-alive 연결 풀을 쓰고(gzip은 연결 풀에서 해제),
+    리다이렉트는 직접 따라가며, 소요 시간은 static_fetch 단계로 기록한다.
+
+    Raises:
+        HTTPStatusError: 최종 응답이 2xx가 아닐 때
+    """
+    replayed = replay_transport.lookup(url)
+    if replayed is not None:
+        return replayed.text()
+
+    headers = {
+        'User-Agent': USER_AGENT,
+        'Accept': 'text/html,application/xhtml+xml',
+        'Accept-Encoding': 'gzip',
+    }
+    with metrics.span('static_fetch', source):
+        target = url
+        for _ in range(MAX_REDIRECTS + 1):
+            http_pool.resolve(target)
+            response = http_pool.request('GET', target, headers=headers, timeout=timeout)
+            location = response.headers.get('location')
+            if response.status not in (301, 302, 303, 307, 308) or not location:
+                break
+            target = urljoin(target, location)
+        else:
+            raise RuntimeError(f"리다이렉트가 너무 많음: {url}")
+
+    if not response.ok:
+        raise HTTPStatusError(url, response.status)
+
+    match = _CHARSET_RE.search(response.headers.get('content-type', ''))
+    try:
+        html = response.body.decode(match.group(1) if match else 'utf-8', errors='replace')
+    except LookupError:
+        html = response.body.decode('utf-8', errors='replace')
+
+    replay_transport.record(url, 200, {'content-type': 'text/html; charset=utf-8'},
+                            html.encode('utf-8'))
+    return html
@@ -1,9 +1,14 @@
 # -*- coding: utf-8 -*-
 
-from typing import List
-from playwright.sync_api import Page
+from typing import List, Dict, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from playwright.sync_api import Page
 
 from .base import BaseCrawler, Post
+from .extraction import ExtractionSpec, Field
+from .readiness import AllReady, SelectorReady, DomStableReady
+from .routing import RoutingProfile
 
 
 class TossCrawler(BaseCrawler):
@@ -12,52 +17,56 @@ class TossCrawler(BaseCrawler):
     name = "토스"
     source_id = "toss"
     base_url = "https://toss.tech/category/engineering"
-
-    def parse_posts(self, page: Page) -> List[Post]:
+    readiness = AllReady(SelectorReady('a[href^="/article/"]'), DomStableReady(300))
+    # inner_text 줄 구분이 레이아웃에 의존하므로 스타일시트는 허용
+    routing = RoutingProfile(allow_types={'stylesheet'})
+
+    extraction = ExtractionSpec(
+        items=['a[href^="/article/"]'],
+        fields={
+            'href': Field(attr='href'),
+            'text': Field(),
+        },
+    )
+
+    def parse_posts(self, page: 'Page') -> List[Post]:
         """토스 테크 블로그 포스트 파싱"""
+        return self.build_posts(self.extraction.extract(page))
+
+    def build_posts(self, rows: List[Dict[str, str]]) -> List[Post]:
+        """추출 결과에서 Post 목록 생성"""
         posts = []
         seen_urls = set()
 
-        # JavaScript 렌더링 대기 - 글 카드가 로드될 때까지
-        page.wait_for_selector('a[href^="/article/"]', timeout=self.timeout)
-
-        # 블로그 글 링크 선택
-        post_links = page.query_selector_all('a[href^="/article/"]')
-
-        for link in post_links:
-            try:
-                href = link.get_attribute('href')
-                if not href or '/article/' not in href:
-                    continue
-
-                url = self._make_absolute_url(href)
-
-                # URL 중복 체크
-                if url in seen_urls:
-                    continue
+        for row in rows:
+            href = row['href']
+            if not href or '/article/' not in href:
+                continue
 
-                # 제목, 요약 한 번에 추출
-                title, summary = self._parse_content(link)
-                if not title or len(title) < 3:
-                    continue
+            url = self._make_absolute_url(href)
 
-                posts.append(Post(
-                    title=title,
-                    url=url,
-                    summary=summary,
-                    date='',  # 토스 블로그는 날짜 정보 없음
-                    source=self.source_id,
-                ))
-                seen_urls.add(url)
+            # URL 중복 체크
+            if url in seen_urls:
+                continue
 
-            except Exception:
+            # 제목, 요약 한 번에 추출
+            title, summary = self._parse_content(row['text'])
+            if not title or len(title) < 3:
                 continue
 
+            posts.append(Post(
+                title=title,
+                url=url,
+                summary=summary,
+                date='',  # 토스 블로그는 날짜 정보 없음
+                source=self.source_id,
+            ))
+            seen_urls.add(url)
+
         return posts
 
-    def _parse_content(self, link) -> tuple:
-        """링크에서 제목과 요약을 한 번에 추출"""
-        text = link.inner_text().strip()
+    def _parse_content(self, text: str) -> tuple:
+        """링크 텍스트에서 제목과 요약을 한 번에 추출"""
         lines = [line.strip() for line in text.split('\n') if line.strip()]
 
         # 토스 블로그 구조: [카테고리?, 기타?, 제목, 요약, ...]
@@ -0,0 +1,206 @@
+# -*- coding: utf-8 -*-
+
+import signal
+import statistics
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Type
+
+from config import (
+    DAEMON_STATE_FILE, DAEMON_DEFAULT_INTERVAL, DAEMON_MIN_INTERVAL, DAEMON_MAX_INTERVAL,
+    DAEMON_CADENCE_FRACTION, DAEMON_CADENCE_SAMPLES, DAEMON_BACKOFF, WORKER_SHUTDOWN_TIMEOUT,
+)
+from cache import cache
+from feed_validators import feed_validators
+from source_marks import source_marks
+from source_health import source_health
+from metrics import metrics, write_run_report
+from state_store import JsonStateStore
+from crawlers import BaseCrawler, BrowserWorkers
+from orchestrator import CrawlOrchestrator, SourceResult
+from pipeline import NotionPipeline
+
+
+class PollSchedule(JsonStateStore):
+    """
+    소스별 폴링 일정 저장소
+
+    소스마다 최근 새 글 날짜, 다음 실행 시각, 연속 무소식·실패 횟수를
+    저장한다. 폴링 간격은 최근 글 사이 간격의 중앙값에서 정하고,
+    새 글이 없거나 실패할 때마다 DAEMON_BACKOFF배씩 늘린다.
+    """
+
+    def __init__(self, path: str = DAEMON_STATE_FILE):
+        super().__init__(path)
+
+    def entry(self, source_id: str) -> Dict[str, Any]:
+        """소스 일정 (없으면 바로 실행하도록 생성)"""
+        self.load()
+        with self._lock:
+            return self._entries.setdefault(source_id, {
+                'dates': [], 'next_run': 0.0, 'interval': 0.0, 'quiet': 0, 'failures': 0,
+            })
+
+    def due(self, source_ids: List[str], now: float) -> List[str]:
+        """지금 실행할 소스 (입력 순서 유지)"""
+        return [source_id for source_id in source_ids if self.entry(source_id)['next_run'] <= now]
+
+    def next_run(self, source_ids: List[str]) -> float:
+        """가장 가까운 다음 실행 시각"""
+        return min(self.entry(source_id)['next_run'] for source_id in source_ids)
+
+    def cadence(self, source_id: str) -> float:
+        """
+        발행 주기에서 정한 기본 폴링 간격 (초)
+
+        최근 글 날짜('YYYY.MM.DD') 사이 간격의 중앙값에
+        DAEMON_CADENCE_FRACTION을 곱한다. 날짜가 둘 미만이면 기본값.
+        """
+        days = []
+        for value in self.entry(source_id)['dates']:
+            try:
+                days.append(datetime.strptime(value, '%Y.%m.%d').toordinal())
+            except ValueError:
+                continue
+        days = sorted(set(days))
+        if len(days) < 2:
+            return DAEMON_DEFAULT_INTERVAL
+
+        gap = statistics.median(b - a for a, b in zip(days, days[1:])) * 86400
+        return min(DAEMON_MAX_INTERVAL, max(DAEMON_MIN_INTERVAL, gap * DAEMON_CADENCE_FRACTION))
+
+    def update(self, result: SourceResult, now: float) -> float:
+        """실행 결과로 다음 실행 시각을 정하고 간격(초) 반환"""
+        with self._lock:
+            entry = self.entry(result.crawler.source_id)
+
+            if result.posts:
+                dates = entry['dates'] + [post.get('date', '') for post in result.posts if post.get('date')]
+                entry['dates'] = sorted(set(dates))[-DAEMON_CADENCE_SAMPLES:]
+                entry['quiet'] = entry['failures'] = 0
+                interval = self.cadence(result.crawler.source_id)
+            elif result.ok or result.not_modified:
+                # 새 글 없음: 발행 주기 간격에서 점점 늘림
+                entry['quiet'] += 1
+                entry['failures'] = 0
+                interval = self.cadence(result.crawler.source_id) * DAEMON_BACKOFF ** entry['quiet']
+            else:
+                # 실패: 최소 간격에서 시작해 점점 늘림
+                entry['failures'] += 1
+                interval = DAEMON_MIN_INTERVAL * DAEMON_BACKOFF ** (entry['failures'] - 1)
+
+            interval = min(DAEMON_MAX_INTERVAL, max(DAEMON_MIN_INTERVAL, interval))
+            entry['interval'] = interval
+            entry['next_run'] = now + interval
+            return interval
+
+
+class CrawlDaemon:
+    """
+    상주 크롤러 (python main.py --daemon)
+
+    하나의 프로세스에서 Chromium(브라우저 워커 1개), HTTP keep-alive 연결,
+    Notion 작성 워커를 계속 유지하고, 소스마다 PollSchedule이 정한 시각에
+    크롤링한다. 같은 시각에 도래한 소스는 한 번에 실행한다.
+
+    SIGTERM/SIGINT를 받으면 진행 중인 크롤링과 Notion 작성을 마치고
+    캐시·상태 파일을 저장한 뒤 종료한다.
+    """
+
+    def __init__(self, crawler_classes: List[Type[BaseCrawler]],
+                 schedule: Optional[PollSchedule] = None,
+                 report: Optional[Callable[[List[SourceResult]], None]] = None):
+        self.crawler_classes = {cls.source_id: cls for cls in crawler_classes}
+        self.schedule = schedule or PollSchedule()
+        self.report = report
+        self.runs = 0
+        self._stop = threading.Event()
+
+    def stop(self, signum: Optional[int] = None, frame: Any = None) -> None:
+        """종료 요청 (시그널 핸들러로도 사용)"""
+        if not self._stop.is_set():
+            print("\n🛑 종료 요청: 진행 중인 작업을 마친 뒤 종료합니다")
+        self._stop.set()
+
+    def install_signal_handlers(self) -> None:
+        """SIGTERM/SIGINT에서 stop 호출 (메인 스레드에서만 가능)"""
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(signum, self.stop)
+
+    def run(self) -> None:
+        """종료 요청이 올 때까지 일정에 따라 크롤링"""
+        source_ids = list(self.crawler_classes)
+
+        workers = None
+        if any(cls.uses_browser for cls in self.crawler_classes.values()):
+            workers = BrowserWorkers(1)
+        pipeline = NotionPipeline(orchestrator=CrawlOrchestrator(workers=workers))
+        pipeline.start()
+        started_at, started = datetime.now(), time.perf_counter()
+        try:
+            while not self._stop.is_set():
+                due = self.schedule.due(source_ids, time.time())
+                if due:
+                    started_at, started = datetime.now(), time.perf_counter()
+                    self._run_due(pipeline, due)
+                    self._checkpoint()
+                    self._report(started_at, started)
+                    started_at, started = datetime.now(), time.perf_counter()
+                    continue
+
+                wait = max(0.0, self.schedule.next_run(source_ids) - time.time())
+                self._stop.wait(wait)
+        finally:
+            pipeline.close()
+            if workers:
+                workers.shutdown(timeout=WORKER_SHUTDOWN_TIMEOUT)
+            self._checkpoint()
+            self._report(started_at, started)
+
+    def _report(self, started_at: datetime, started: float) -> None:
+        """
+        이번 크롤링의 실행 지표 저장 후 초기화
+
+        지표를 누적하면 상주하는 동안 메모리가 계속 늘어나므로,
+        보고서 하나는 크롤링 한 번(종료 시에는 마지막 보고 이후)만 담는다.
+        """
+        write_run_report('daemon', started_at, time.perf_counter() - started)
+        metrics.reset()
+
+    def _run_due(self, pipeline: NotionPipeline, due: List[str]) -> None:
+        """도래한 소스 크롤링 후 Notion 작성이 끝날 때까지 대기"""
+        self.runs += 1
+        print(f"\n🕐 {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} 크롤링: {', '.join(due)}")
+        added = pipeline.summary.added
+        pipeline.forget_seen()
+        results = pipeline.orchestrator.run([self.crawler_classes[source_id] for source_id in due],
+                                            on_post=pipeline.submit)
+        pipeline.drain()
+        pipeline.settle(results)
+
+        if self.report:
+            self.report(results)
+        now = time.time()
+        for result in results:
+            interval = self.schedule.update(result, now)
+            metrics.count('daemon_polls', source=result.crawler.source_id)
+            print(f"   ⏭️  {result.name}: {_format_interval(interval)} 후 다시 확인")
+        print(f"   ✨ {pipeline.summary.added - added}개 추가됨")
+
+    def _checkpoint(self) -> None:
+        """캐시·상태 파일 저장 (크롤링마다, 종료할 때)"""
+        try:
+            cache.flush()
+            feed_validators.save()
+            source_marks.save()
+            source_health.save()
+            self.schedule.save()
+        except OSError as e:
+            print(f"⚠️  상태 저장 실패: {e}")
+
+
+def _format_interval(seconds: float) -> str:
+    if seconds >= 3600:
+        return f"{seconds / 3600:.1f}시간"
+    return f"{seconds / 60:.0f}분"
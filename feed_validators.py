@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+
+from typing import Dict, Optional
+
+from config import FEED_VALIDATOR_FILE
+from state_store import JsonStateStore
+
+
+class FeedValidatorStore(JsonStateStore):
+    """
+    RSS 피드 조건부 요청 검증값 저장소
+
+    소스별로 ETag, Last-Modified, 본문 해시를 저장해 두고
+    다음 실행에서 조건부 GET에 사용한다.
+    """
+
+    def __init__(self, path: str = FEED_VALIDATOR_FILE):
+        super().__init__(path)
+
+    def get(self, source_id: str, feed_url: str) -> Dict[str, str]:
+        """소스의 검증값 반환 (피드 URL이 바뀌었으면 빈 값)"""
+        self.load()
+        with self._lock:
+            entry = self._entries.get(source_id)
+            if not entry or entry.get('feed_url') != feed_url:
+                return {}
+            return dict(entry)
+
+    def update(self, source_id: str, feed_url: str, etag: Optional[str],
+               last_modified: Optional[str], body_hash: str) -> None:
+        """소스의 검증값 갱신 (save 호출 전까지는 메모리에만 반영)"""
+        self.load()
+        with self._lock:
+            self._entries[source_id] = {
+                'feed_url': feed_url,
+                'etag': etag or '',
+                'last_modified': last_modified or '',
+                'body_hash': body_hash,
+            }
+
+    def invalidate(self, source_id: str) -> None:
+        """소스의 검증값 제거 (다음 실행에서 전체 피드를 다시 처리)"""
+        self.load()
+        with self._lock:
+            self._entries.pop(source_id, None)
+
+
+# 기본 검증값 저장소 인스턴스
+feed_validators = FeedValidatorStore()
@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+
+import gzip
+import http.client
+import json
+import socket
+import threading
+from typing import Dict, List, Optional, Tuple, Any
+from urllib.parse import urlsplit
+
+from config import HTTP_POOL_MAXSIZE, HTTP_TIMEOUT
+
+# 재사용한 keep-alive 연결이 서버 쪽에서 닫혔을 때 발생하는 예외
+_STALE_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    BrokenPipeError,
+    ConnectionResetError,
+    ConnectionAbortedError,
+)
+
+
+class HTTPResponse:
+    """HTTP 응답 (본문은 이미 읽혀 있음)"""
+
+    def __init__(self, status: int, headers: Dict[str, str], body: bytes):
+        self.status = status
+        self.headers = headers  # 헤더 이름은 소문자
+        self.body = body
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status < 300
+
+    def text(self) -> str:
+        return self.body.decode('utf-8', errors='replace')
+
+    def json(self) -> Any:
+        return json.loads(self.body.decode('utf-8'))
+
+
+class ConnectionPool:
+    """
+    호스트별 keep-alive HTTP(S) 연결 풀
+
+    요청이 끝난 연결을 닫지 않고 보관했다가 같은 호스트 요청에 재사용해
+    TCP/TLS 핸드셰이크 비용을 한 번만 치른다. 여러 스레드에서 동시에
+    사용할 수 있다.
+    """
+
+    def __init__(self, maxsize: int = HTTP_POOL_MAXSIZE,
+                 timeout: float = HTTP_TIMEOUT):
+        self.maxsize = maxsize  # 호스트별 보관할 유휴 연결 수
+        self.timeout = timeout
+        self._idle: Dict[Tuple[str, str, int], List[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+        self._resolved: Dict[Tuple[str, int], str] = {}  # (호스트, 포트) → 미리 조회한 IP
+        self.connections_opened = 0
+
+    @staticmethod
+    def _key(url: str) -> Tuple[str, str, int]:
+        parts = urlsplit(url)
+        scheme = parts.scheme or 'https'
+        port = parts.port or (443 if scheme == 'https' else 80)
+        return scheme, parts.hostname or '', port
+
+    def _new_connection(self, key: Tuple[str, str, int],
+                        timeout: float) -> http.client.HTTPConnection:
+        scheme, host, port = key
+        self.connections_opened += 1
+        if scheme == 'https':
+            conn = http.client.HTTPSConnection(host, port, timeout=timeout)
+        else:
+            conn = http.client.HTTPConnection(host, port, timeout=timeout)
+
+        address = self._resolved.get((host, port))
+        if address:
+            # Host 헤더와 TLS SNI는 호스트 이름 그대로, 접속만 조회해 둔 IP로
+            conn._create_connection = (
+                lambda addr, timeout=None, source=None:
+                socket.create_connection((address, addr[1]), timeout, source)
+            )
+        return conn
+
+    def resolve(self, url: str) -> str:
+        """호스트의 DNS 조회 결과를 저장해 두고 이후 새 연결에 사용"""
+        _, host, port = self._key(url)
+        with self._lock:
+            address = self._resolved.get((host, port))
+        if address:
+            return address
+
+        info = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        address = info[0][4][0]
+        with self._lock:
+            self._resolved[(host, port)] = address
+        return address
+
+    def _checkout(self, key: Tuple[str, str, int]) -> Optional[http.client.HTTPConnection]:
+        with self._lock:
+            idle = self._idle.get(key)
+            return idle.pop() if idle else None
+
+    def _checkin(self, key: Tuple[str, str, int], conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.maxsize:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def warm(self, url: str, timeout: Optional[float] = None) -> None:
+        """미리 연결을 열어 풀에 넣어 둠 (DNS 조회와 TLS 핸드셰이크 선행)"""
+        key = self._key(url)
+        conn = self._new_connection(key, timeout or self.timeout)
+        conn.connect()
+        self._checkin(key, conn)
+
+    def request(self, method: str, url: str, headers: Optional[Dict[str, str]] = None,
+                body: Optional[bytes] = None, timeout: Optional[float] = None) -> HTTPResponse:
+        """요청 후 응답 본문까지 읽어서 반환 (gzip 자동 해제)"""
+        key = self._key(url)
+        parts = urlsplit(url)
+        path = parts.path or '/'
+        if parts.query:
+            path += '?' + parts.query
+
+        conn = self._checkout(key)
+        reused = conn is not None
+        if conn is None:
+            conn = self._new_connection(key, timeout or self.timeout)
+        elif timeout:
+            conn.timeout = timeout
+            if conn.sock:
+                conn.sock.settimeout(timeout)
+
+        try:
+            conn.request(method, path, body=body, headers=headers or {})
+            response = conn.getresponse()
+            data = response.read()
+        except _STALE_ERRORS:
+            conn.close()
+            if not reused:
+                raise
+            # 유휴 중 닫힌 연결이면 새 연결로 한 번만 재시도
+            conn = self._new_connection(key, timeout or self.timeout)
+            try:
+                conn.request(method, path, body=body, headers=headers or {})
+                response = conn.getresponse()
+                data = response.read()
+            except Exception:
+                conn.close()
+                raise
+        except Exception as e:
+            conn.close()
+            if isinstance(e, OSError):
+                # 조회해 둔 IP가 더는 유효하지 않을 수 있으므로 다음에 다시 조회
+                with self._lock:
+                    self._resolved.pop(key[1:], None)
+            raise
+
+        response_headers = {k.lower(): v for k, v in response.getheaders()}
+        if response_headers.get('content-encoding', '').lower() == 'gzip':
+            data = gzip.decompress(data)
+
+        if response.will_close:
+            conn.close()
+        else:
+            self._checkin(key, conn)
+
+        return HTTPResponse(response.status, response_headers, data)
+
+    def close(self) -> None:
+        """모든 유휴 연결 종료"""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for conn in conns:
+                conn.close()
+
+
+# 기본 연결 풀 인스턴스
+http_pool = ConnectionPool()
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import argparse
 import sys
 import time
 from datetime import datetime
@@ -9,113 +10,253 @@ from datetime import datetime
 if sys.platform == 'win32':
     sys.stdout.reconfigure(encoding='utf-8')
 
-from config import REQUEST_DELAY
+from config import NOTION_WRITERS, BACKFILL_MAX_PAGES
 from cache import cache
-from notion_client import notion
-from crawlers import CRAWLERS
+from feed_validators import feed_validators
+from source_marks import source_marks
+from source_health import source_health, CLOSED, OPEN
+from metrics import write_run_report
+from profiling import PROFILE_MODES, profiler
+from crawlers import CRAWLER_SPECS, select_crawlers, browser_pool, replay_transport
+from pipeline import run_pipeline
 
 
-def crawl_all_blogs():
-    """모든 블로그에서 글 크롤링"""
-    all_posts = []
+def report_sources(results):
+    """소스별 크롤링 결과 출력"""
+    for result in results:
+        if result.ok:
+            skipped = f", 아는 글 {result.skipped}개 건너뜀" if result.skipped else ""
+            print(f"✅ {result.name}: {len(result.posts)}개의 새 글 발견 "
+                  f"({result.path}, {result.elapsed:.1f}초{skipped})")
+        elif result.circuit_open:
+            print(f"⏸️  {result.name}: {result.error} (회로 열림)")
+        elif result.not_modified:
+            print(f"♻️  {result.name}: 변경 없음 - 새 글 없음 ({result.elapsed:.1f}초)")
+        elif result.error:
+            print(f"⚠️  {result.name} 블로그에서 글을 가져오지 못했습니다: {result.error}")
+        else:
+            print(f"⚠️  {result.name} 블로그에서 글을 가져오지 못했습니다.")
 
-    for CrawlerClass in CRAWLERS:
-        crawler = CrawlerClass()
-        print(f"\n🔍 {crawler.name} 블로그 크롤링 중...")
 
-        posts = crawler.fetch()
-        if posts:
-            all_posts.extend(posts)
-            print(f"✅ {crawler.name}: {len(posts)}개의 글 발견")
-        else:
-            print(f"⚠️  {crawler.name} 블로그에서 글을 가져오지 못했습니다.")
-
-    return all_posts
-
-
-def filter_new_posts(posts):
-    """캐시에 없는 새 글만 필터링"""
-    return [p for p in posts if p['url'] not in cache]
-
-
-def display_posts(posts):
-    """포스트 목록 출력"""
-    for i, post in enumerate(posts, 1):
-        source_label = f"[{post.get('source', '?').upper()}]"
-        print(f"  {i}. {source_label} {post['title']}")
-        print(f"     📅 {post['date']}")
-        print(f"     🔗 {post['url']}")
-        if post.get('summary'):
-            summary_preview = post['summary'][:100]
-            if len(post['summary']) > 100:
-                summary_preview += '...'
-            print(f"     📝 {summary_preview}")
-        print()
-
-
-def add_to_notion(posts):
-    """Notion에 포스트 추가"""
-    added = 0
-
-    for post in posts:
-        source_label = f"[{post.get('source', '?').upper()}]"
-
-        if notion.create_page(
-            title=post['title'],
-            url=post['url'],
-            summary=post.get('summary', ''),
-            date=post.get('date', ''),
-        ):
-            cache.add(post['url'])
-            added += 1
-            print(f"  ✅ {source_label} {post['title']}")
-        else:
-            print(f"  ❌ {source_label} {post['title']}")
+def report_health(crawler_classes):
+    """소스별 최근 상태 요약 출력 (source_health.json 기준)"""
+    icons = {CLOSED: "🟢", OPEN: "🔴"}
+    print("\n🩺 소스 상태 (최근 결과 기준)")
+    for cls in crawler_classes:
+        stats = source_health.stats(cls.source_id)
+        if not stats['runs']:
+            continue
+        line = (f"   {icons.get(stats['state'], '🟡')} {cls.name}: 성공 {stats['successes']}/{stats['runs']}, "
+                f"소요 중앙값 {stats['p50_ms'] / 1000:.1f}초")
+        if stats['failures']:
+            line += f", 연속 실패 {stats['failures']}회 ({stats['last_error']})"
+        if stats['state'] == OPEN:
+            retry_at = datetime.fromtimestamp(stats['retry_at']).strftime('%m-%d %H:%M')
+            line += f", {retry_at} 이후 재확인"
+        print(line)
+
+
+def report_profile():
+    """--profile 결과 저장 및 요약 출력"""
+    if not profiler.enabled:
+        return
+    print(f"\n🔬 {profiler.mode} 프로파일 ({profiler.output_dir}/)")
+    profiler.finish()
+
+
+def sync(full: bool = False):
+    """Notion DB 기준으로 로컬 캐시 재구성·검증"""
+    # 모드별 모듈은 해당 모드에서만 import (크롤링 시작 시간에 포함되지 않게)
+    from notion_sync import sync_cache
+
+    print("=" * 70)
+    print("🔄 Notion Weblinks → 로컬 캐시 동기화")
+    print("=" * 70)
+
+    cache.load()
+    print(f"\n📦 캐시: {len(cache)}개 URL")
+
+    started = time.perf_counter()
+    try:
+        summary = sync_cache(full=full)
+    except Exception as e:
+        print(f"\n❌ 동기화 실패: {e}")
+        return
+    finally:
+        cache.close()
 
-        time.sleep(REQUEST_DELAY)
+    mode = "전체" if summary.full else f"증분 ({summary.high_water_mark} 이후)"
+    print(f"\n📥 {mode}: 페이지 {summary.pages}개, URL {summary.urls}개 확인")
+    print(f"✅ 캐시에 없던 URL {summary.added}개 추가")
+    if summary.full and summary.local_only:
+        print(f"⚠️  캐시에만 있는 URL {summary.local_only}개 (Notion에서 삭제되었거나 추가 실패)")
+    print(f"⏱️  소요 시간: {time.perf_counter() - started:.1f}초")
 
-    return added
 
+def backfill(crawler_classes, max_pages: int):
+    """과거 글 backfill (중단되면 다음 실행에서 이어서 진행)"""
+    from backfill import BackfillRunner
 
-def main():
-    """메인 실행"""
+    print("=" * 70)
+    print("📚 Tech Blog 과거 글 backfill → Notion Weblinks")
+    print("=" * 70)
+
+    cache.load()
+    print(f"\n📦 캐시: {len(cache)}개 URL")
+    print(f"\n🔍 소스별 최대 {max_pages}페이지 backfill...")
+
+    started_at = datetime.now()
+    started = time.perf_counter()
+    runner = BackfillRunner(max_pages=max_pages)
+    try:
+        results = runner.run(crawler_classes)
+    finally:
+        browser_pool.close()
+        cache.close()
+        source_marks.save()
+        write_run_report('backfill', started_at, time.perf_counter() - started)
+        report_profile()
+
+    print()
+    for result in results:
+        state = "완료" if result.done else f"다음 페이지 {result.cursor + 1}"
+        print(f"{'⚠️ ' if result.error else '✅'} {result.name}: 페이지 {result.pages}개, "
+              f"글 {result.posts}개 ({state})" + (f" - {result.error}" if result.error else ""))
+    print(f"⏱️  소요 시간: {time.perf_counter() - started:.1f}초")
+
+    summary = runner.summary
+    print("\n" + "=" * 70)
+    print(f"✨ 완료! {summary.added}/{summary.new}개 추가됨 (확인한 글 {summary.seen}개)")
+    print("=" * 70)
+
+
+def daemon(crawler_classes):
+    """상주 모드: 소스별 일정에 따라 계속 크롤링 (SIGTERM/SIGINT로 종료)"""
+    from daemon import CrawlDaemon
+
+    print("=" * 70)
+    print("🛰️  Tech Blog → Notion Weblinks 상주 모드")
+    print(f"🕐 시작 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print("=" * 70)
+
+    cache.load()
+    print(f"\n📦 캐시: {len(cache)}개 URL")
+    print(f"🔍 {len(crawler_classes)}개 블로그를 발행 주기에 맞춰 확인 (종료: SIGTERM 또는 Ctrl+C)")
+
+    runner = CrawlDaemon(crawler_classes, report=report_sources)
+    runner.install_signal_handlers()
+    try:
+        runner.run()
+    finally:
+        browser_pool.close()
+        cache.close()
+        report_profile()
+
+    report_health(crawler_classes)
+    print(f"\n✨ 종료 (크롤링 {runner.runs}회)")
+
+
+def parse_args(argv=None):
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(description="Tech Blog → Notion Weblinks 자동 추가")
+    parser.add_argument('--sync', action='store_true',
+                        help="크롤링 대신 Notion DB 기준으로 로컬 캐시 재구성·검증")
+    parser.add_argument('--full', action='store_true',
+                        help="--sync에서 저장된 high-water mark를 무시하고 전체 동기화")
+    parser.add_argument('--sources', type=lambda value: [s.strip() for s in value.split(',') if s.strip()],
+                        metavar='ID[,ID...]',
+                        help=f"실행할 소스만 선택 (가능: {', '.join(CRAWLER_SPECS)})")
+    parser.add_argument('--backfill', action='store_true',
+                        help="과거 목록 페이지를 넘기며 예전 글까지 추가 (중단 시 이어서 진행)")
+    parser.add_argument('--max-pages', type=int, default=BACKFILL_MAX_PAGES,
+                        help=f"--backfill에서 소스별로 읽을 최대 페이지 수 (기본 {BACKFILL_MAX_PAGES})")
+    parser.add_argument('--daemon', action='store_true',
+                        help="종료할 때까지 상주하며 소스별 발행 주기에 맞춰 크롤링 "
+                             "(Chromium·연결 유지, SIGTERM으로 종료)")
+    transport = parser.add_mutually_exclusive_group()
+    transport.add_argument('--record', action='store_const', const='record', dest='replay',
+                           help="목록 응답·DOM 스냅샷을 replay_cache/에 녹화하며 실행")
+    transport.add_argument('--replay', action='store_const', const='replay', dest='replay',
+                           help="블로그에 요청하지 않고 녹화한 응답으로 실행 (REPLAY_TTL 안의 녹화만)")
+    parser.add_argument('--profile', choices=PROFILE_MODES,
+                        help="프로파일 저장 (cpu: 실행 전체 cProfile run.prof, mem: 단계별 tracemalloc 상위 할당, "
+                             "mem은 소스를 하나씩 크롤링)")
+    return parser.parse_args(argv)
+
+
+def main(crawler_classes=None):
+    """메인 실행 (crawler_classes가 없으면 등록된 모든 크롤러)"""
+    if crawler_classes is None:
+        crawler_classes = select_crawlers()
+
+    started_at = datetime.now()
     print("=" * 70)
     print("📰 Tech Blog → Notion Weblinks 자동 추가")
-    print(f"🕐 실행 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"🕐 실행 시간: {started_at.strftime('%Y-%m-%d %H:%M:%S')}")
     print("=" * 70)
 
     # 1. 캐시 로드
     cache.load()
+    if replay_transport.active:
+        mode = "녹화" if replay_transport.recording else "재생 (블로그에 요청하지 않음)"
+        print(f"\n🎞️  {mode} 모드: {replay_transport.store.directory}/")
     print(f"\n📦 캐시: {len(cache)}개 URL")
 
-    # 2. 모든 블로그에서 글 가져오기
-    all_posts = crawl_all_blogs()
+    # 2. 크롤링 → 중복 제거 → Notion 추가를 스트리밍으로 진행
+    #    (새 글은 발견되는 대로 Notion 작성 워커에 전달됨)
+    print(f"\n🔍 {len(crawler_classes)}개 블로그 동시 크롤링, Notion 작성 워커 {NOTION_WRITERS}개...")
+    started = time.perf_counter()
+    try:
+        summary = run_pipeline(crawler_classes, sequential=profiler.mode == 'mem')
+    finally:
+        browser_pool.close()
+        cache.close()
+        feed_validators.save()
+        source_marks.save()
+        source_health.save()
+        write_run_report('crawl', started_at, time.perf_counter() - started)
+        report_profile()
+
+    # 3. 소스별 결과
+    print()
+    report_sources(summary.results)
+    if not replay_transport.replaying:
+        report_health(crawler_classes)
+    if replay_transport.active:
+        print(f"🎞️  {replay_transport.summary()}")
+    print(f"⏱️  소요 시간: {time.perf_counter() - started:.1f}초")
 
-    if not all_posts:
+    if not summary.seen and not summary.skipped:
         print("\n❌ 어떤 블로그에서도 글을 가져오지 못했습니다.")
         return
 
-    print(f"\n📊 총 {len(all_posts)}개의 글 발견")
+    print(f"\n📊 총 {summary.seen}개의 글 발견 (아는 글 {summary.skipped}개 건너뜀)")
 
-    # 3. 새 글 필터링
-    new_posts = filter_new_posts(all_posts)
-
-    if not new_posts:
+    if not summary.new:
         print("\n✨ 새로운 글이 없습니다!")
         return
 
-    print(f"\n🆕 {len(new_posts)}개의 새 글:")
-    display_posts(new_posts)
-
-    # 4. Notion에 추가
-    print("📝 Notion에 추가 중...")
-    added = add_to_notion(new_posts)
-
-    # 5. 결과
+    # 4. 결과
     print("\n" + "=" * 70)
-    print(f"✨ 완료! {added}/{len(new_posts)}개 추가됨")
+    print(f"✨ 완료! {summary.added}/{summary.new}개 추가됨")
     print("=" * 70)
 
 
 if __name__ == "__main__":
-    main()
+    args = parse_args()
+    profiler.start(args.profile)
+    replay_transport.configure(args.replay or "")
+    if args.sync:
+        sync(full=args.full)
+    else:
+        try:
+            crawler_classes = select_crawlers(args.sources)
+        except KeyError as e:
+            sys.exit(f"❌ {e.args[0]}")
+
+        if args.backfill:
+            backfill(crawler_classes, args.max_pages)
+        elif args.daemon:
+            daemon(crawler_classes)
+        else:
+            main(crawler_classes)
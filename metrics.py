@@ -0,0 +1,252 @@
+# -*- coding: utf-8 -*-
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from config import METRICS_LATENCY_BUCKETS, METRICS_REPORT_FILE, METRICS_PROM_FILE
+
+# 정렬된 (라벨 이름, 값) 튜플
+Labels = Tuple[Tuple[str, str], ...]
+
+
+def _labels(labels: Dict[str, str]) -> Labels:
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def _prom_labels(labels: Labels, **extra: str) -> str:
+    """Prometheus 라벨 문자열 ({a="1",b="2"}, 라벨이 없으면 빈 문자열)"""
+    items = list(labels) + sorted(extra.items())
+    if not items:
+        return ""
+    escaped = []
+    for key, value in items:
+        value = value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+        escaped.append(f'{key}="{value}"')
+    return "{" + ",".join(escaped) + "}"
+
+
+class Histogram:
+    """누적 버킷 히스토그램 (초 단위)"""
+
+    def __init__(self, buckets: Tuple[float, ...] = METRICS_LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)  # 버킷별 (누적 아님)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.count += 1
+        self.sum += value
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                return
+
+    def cumulative(self) -> List[Tuple[float, int]]:
+        """(상한, 누적 개수) 목록 (+Inf 제외)"""
+        total = 0
+        result = []
+        for bound, count in zip(self.buckets, self.counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'count': self.count,
+            'sum_s': self.sum,
+            'buckets': {f"{bound:g}": count for bound, count in self.cumulative()},
+        }
+
+
+class Metrics:
+    """
+    실행 계측 기록기
+
+    세 가지를 모은다.
+    - span: (단계, 소스) 별 소요 시간 (브라우저 실행, 파싱, Notion 작성 등)
+    - counter: 라벨별 누적 값 (소스별 발견/새 글/작성/실패 수 등)
+    - histogram: 라벨별 지연 분포 (Notion 요청 지연)
+
+    실행이 끝나면 write_json으로 JSON 보고서를, write_prometheus로
+    node_exporter textfile collector용 파일을 남긴다. 여러 스레드에서
+    동시에 기록할 수 있고, 기록 한 번은 잠금 한 번 수준이라 항상 켜 둔다.
+    """
+
+    def __init__(self):
+        self._spans: Dict[Tuple[str, str], List[float]] = {}
+        self._counters: Dict[Tuple[str, Labels], float] = {}
+        self._histograms: Dict[Tuple[str, Labels], Histogram] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, name: str, source: str = "") -> Iterator[None]:
+        """with 블록의 소요 시간을 name 단계로 기록 (예외가 나도 기록)"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, (time.perf_counter() - started) * 1000, source)
+
+    def record(self, name: str, elapsed_ms: float, source: str = "") -> None:
+        """이미 잰 소요 시간 기록"""
+        with self._lock:
+            self._spans.setdefault((name, source), []).append(elapsed_ms)
+
+    def count(self, name: str, value: float = 1, **labels: str) -> None:
+        """카운터 증가"""
+        key = (name, _labels(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name: str, seconds: float, **labels: str) -> None:
+        """히스토그램에 값(초) 추가"""
+        key = (name, _labels(labels))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram()
+            histogram.observe(seconds)
+
+    def spans(self) -> Dict[Tuple[str, str], List[float]]:
+        """(단계, 소스) → 소요 시간 목록 복사본"""
+        with self._lock:
+            return {key: list(values) for key, values in self._spans.items()}
+
+    def counter(self, name: str, **labels: str) -> float:
+        """카운터 현재 값"""
+        with self._lock:
+            return self._counters.get((name, _labels(labels)), 0)
+
+    def stages(self) -> Dict[str, Dict[str, float]]:
+        """단계별 요약 ({'count', 'total_ms', 'p50_ms', 'max_ms'}, 소스 합산)"""
+        merged: Dict[str, List[float]] = {}
+        for (name, _), values in self.spans().items():
+            merged.setdefault(name, []).extend(values)
+        return {name: _summarize(values) for name, values in merged.items()}
+
+    def report(self) -> Dict[str, Any]:
+        """JSON 보고서 본문 (단계, 소스별 단계·카운터, 히스토그램)"""
+        spans = self.spans()
+        with self._lock:
+            counters = dict(self._counters)
+            histograms = {key: histogram.to_dict() for key, histogram in self._histograms.items()}
+
+        sources: Dict[str, Dict[str, Any]] = {}
+        for (name, source), values in spans.items():
+            if source:
+                sources.setdefault(source, {}).setdefault('stages', {})[name] = _summarize(values)
+
+        other_counters = []
+        for (name, labels), value in sorted(counters.items()):
+            label_map = dict(labels)
+            if name == 'posts' and 'source' in label_map and 'state' in label_map:
+                entry = sources.setdefault(label_map['source'], {}).setdefault('posts', {})
+                entry[label_map['state']] = entry.get(label_map['state'], 0) + value
+            else:
+                other_counters.append({'name': name, 'labels': label_map, 'value': value})
+
+        return {
+            'stages': self.stages(),
+            'sources': sources,
+            'counters': other_counters,
+            'histograms': [{'name': name, 'labels': dict(labels), **histogram}
+                           for (name, labels), histogram in sorted(histograms.items())],
+        }
+
+    def write_json(self, path: str, **extra: Any) -> None:
+        """JSON 보고서 저장 (extra는 최상위 항목으로 추가)"""
+        report = {**extra, **self.report()}
+        _write_atomic(path, json.dumps(report, ensure_ascii=False, indent=2))
+
+    def write_prometheus(self, path: str, prefix: str = "techblog_crawler") -> None:
+        """
+        Prometheus 텍스트 형식으로 저장 (node_exporter textfile collector용)
+
+        collector가 쓰다 만 파일을 읽지 않도록 임시 파일 교체 방식으로 쓴다.
+        """
+        spans = self.spans()
+        with self._lock:
+            counters = dict(self._counters)
+            histograms = {key: (histogram.cumulative(), histogram.count, histogram.sum)
+                          for key, histogram in self._histograms.items()}
+
+        lines = [
+            f"# HELP {prefix}_stage_seconds 실행 단계별 소요 시간",
+            f"# TYPE {prefix}_stage_seconds summary",
+        ]
+        for (name, source), values in sorted(spans.items()):
+            labels = _labels({'stage': name, 'source': source} if source else {'stage': name})
+            lines.append(f"{prefix}_stage_seconds_sum{_prom_labels(labels)} {sum(values) / 1000:.6f}")
+            lines.append(f"{prefix}_stage_seconds_count{_prom_labels(labels)} {len(values)}")
+
+        for name in sorted({name for name, _ in counters}):
+            lines.append(f"# TYPE {prefix}_{name}_total counter")
+            for (counter_name, labels), value in sorted(counters.items()):
+                if counter_name == name:
+                    lines.append(f"{prefix}_{name}_total{_prom_labels(labels)} {value:g}")
+
+        for name in sorted({name for name, _ in histograms}):
+            lines.append(f"# TYPE {prefix}_{name} histogram")
+            for (histogram_name, labels), (buckets, count, total) in sorted(histograms.items()):
+                if histogram_name != name:
+                    continue
+                for bound, cumulative in buckets:
+                    lines.append(f"{prefix}_{name}_bucket{_prom_labels(labels, le=f'{bound:g}')} {cumulative}")
+                lines.append(f"{prefix}_{name}_bucket{_prom_labels(labels, le='+Inf')} {count}")
+                lines.append(f"{prefix}_{name}_sum{_prom_labels(labels)} {total:.6f}")
+                lines.append(f"{prefix}_{name}_count{_prom_labels(labels)} {count}")
+
+        lines.append(f"# TYPE {prefix}_last_run_timestamp_seconds gauge")
+        lines.append(f"{prefix}_last_run_timestamp_seconds {time.time():.0f}")
+        _write_atomic(path, "\n".join(lines) + "\n")
+
+    def reset(self) -> None:
+        """기록 초기화"""
+        with self._lock:
+            self._spans.clear()
+            self._counters.clear()
+            self._histograms.clear()
+
+
+def _summarize(values: List[float]) -> Dict[str, float]:
+    values = sorted(values)
+    return {
+        'count': len(values),
+        'total_ms': round(sum(values), 3),
+        'p50_ms': round(values[len(values) // 2], 3),
+        'max_ms': round(values[-1], 3),
+    }
+
+
+def _write_atomic(path: str, text: str) -> None:
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+def write_run_report(mode: str, started_at: datetime, elapsed: float,
+                     json_path: Optional[str] = None,
+                     prom_path: Optional[str] = None) -> None:
+    """기본 기록기의 실행 보고서 저장 (경로가 비어 있으면 건너뜀)"""
+    json_path = METRICS_REPORT_FILE if json_path is None else json_path
+    prom_path = METRICS_PROM_FILE if prom_path is None else prom_path
+    try:
+        if json_path:
+            metrics.write_json(json_path, mode=mode,
+                               started_at=started_at.isoformat(timespec='seconds'),
+                               elapsed_s=round(elapsed, 3))
+        if prom_path:
+            metrics.write_prometheus(prom_path)
+    except OSError as e:
+        print(f"⚠️  실행 지표 저장 실패: {e}")
+
+
+# 기본 기록기 인스턴스
+metrics = Metrics()
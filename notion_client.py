@@ -1,25 +1,48 @@
 # -*- coding: utf-8 -*-
 
+import asyncio
+import http.client
 import json
-from urllib.request import Request, urlopen
-from urllib.error import HTTPError
-from typing import Optional, Dict, Any, List
+import time
+from typing import Optional, Dict, Any, Iterator, List, Callable
+from urllib.parse import quote
 
 from config import (
     NOTION_API_TOKEN,
     NOTION_API_VERSION,
+    NOTION_API_BASE_URL,
     WEBLINKS_DATABASE_ID,
     DEFAULT_TAG,
+    NOTION_MAX_RETRIES,
+    HTTP_TIMEOUT,
 )
+from http_pool import ConnectionPool, http_pool
+from rate_limiter import AdaptiveTokenBucket, parse_retry_after, backoff_delay
+from metrics import metrics
+
+# 재시도할 연결 오류 (타임아웃, 연결 끊김, DNS 실패, 응답 중간에 끊김)
+_NETWORK_ERRORS = (OSError, http.client.HTTPException)
+
+
+def _endpoint_label(endpoint: str) -> str:
+    """지표 라벨용 엔드포인트 (ID와 쿼리 문자열 제거, 예: /databases/{id}/query)"""
+    parts = endpoint.split('?')[0].strip('/').split('/')
+    return '/' + '/'.join('{id}' if i % 2 else part for i, part in enumerate(parts))
 
 
 class NotionClient:
     """Notion API 클라이언트"""
 
-    BASE_URL = "https://api.notion.com/v1"
+    BASE_URL = NOTION_API_BASE_URL
 
-    def __init__(self, token: str = NOTION_API_TOKEN):
+    def __init__(self, token: str = NOTION_API_TOKEN,
+                 transport: Optional[ConnectionPool] = None,
+                 limiter: Optional[AdaptiveTokenBucket] = None,
+                 max_retries: int = NOTION_MAX_RETRIES):
         self.token = token
+        self.transport = transport or http_pool  # keep-alive 연결 풀
+        self.limiter = limiter or AdaptiveTokenBucket()  # 평균 3 req/s 제한
+        self.max_retries = max_retries
         self.headers = {
             "Authorization": f"Bearer {token}",
             "Notion-Version": NOTION_API_VERSION,
@@ -31,47 +54,157 @@ class NotionClient:
         return bool(self.token)
 
     def _request(self, endpoint: str, method: str = 'GET',
-                 data: Optional[Dict] = None) -> Optional[Dict]:
-        """API 요청 수행"""
+                 data: Optional[Dict] = None,
+                 recover: Optional[Callable[[], Optional[Dict]]] = None) -> Optional[Dict]:
+        """
+        API 요청 수행
+
+        토큰 버킷으로 속도를 제한하고, 실패하면 Retry-After 또는 지터 백오프
+        후 최대 max_retries번 재시도한다.
+        - 429: Notion이 요청을 처리하지 않았으므로 그대로 재시도
+        - 5xx, 연결 오류: 요청이 이미 처리됐을 수 있다. 멱등이 아닌 요청은
+          recover를 넘기고, 재시도 전에 recover로 처리 여부를 확인해 결과가
+          있으면 그것을 반환한다 (확인할 수 없으면 중복을 피해 포기)
+        시도마다 응답 지연과 상태 코드를 metrics에 기록한다.
+        """
         url = f"{self.BASE_URL}{endpoint}"
+        body = json.dumps(data).encode('utf-8') if data else None
+        label = _endpoint_label(endpoint)
 
-        try:
-            req = Request(url, headers=self.headers, method=method)
-            if data:
-                req.data = json.dumps(data).encode('utf-8')
+        for attempt in range(self.max_retries + 1):
+            with metrics.span('notion_rate_wait'):
+                self.limiter.acquire()
 
-            with urlopen(req, timeout=10) as response:
-                return json.loads(response.read().decode('utf-8'))
+            started = time.perf_counter()
+            response = None
+            try:
+                response = self.transport.request(method, url, headers=self.headers,
+                                                  body=body, timeout=HTTP_TIMEOUT)
+            except _NETWORK_ERRORS as e:
+                metrics.count('notion_responses', endpoint=label, status='error')
+                failure = f"요청 실패: {e}"
+            except Exception as e:
+                metrics.count('notion_responses', endpoint=label, status='error')
+                print(f"❌ 요청 실패: {e}")
+                return None
+            finally:
+                metrics.observe('notion_request_seconds', time.perf_counter() - started,
+                                endpoint=label)
 
-        except HTTPError as e:
-            error_body = e.read().decode('utf-8') if hasattr(e, 'read') else str(e)
-            print(f"❌ Notion API 오류: {e.code} - {error_body}")
-            return None
-        except Exception as e:
-            print(f"❌ 요청 실패: {e}")
-            return None
+            if response is not None:
+                metrics.count('notion_responses', endpoint=label, status=str(response.status))
+                if response.ok:
+                    self.limiter.on_success()
+                    return response.json()
+                if response.status != 429 and response.status < 500:
+                    print(f"❌ Notion API 오류: {response.status} - {response.text()}")
+                    return None
+                failure = f"Notion API 오류: {response.status} - {response.text()}"
+
+            if attempt == self.max_retries:
+                print(f"❌ {failure}")
+                return None
+
+            delay = parse_retry_after(response.headers.get('retry-after')) if response else None
+            if delay is None:
+                delay = backoff_delay(attempt)
+
+            if response is not None and response.status == 429:
+                # 리미터가 delay 동안 모든 요청을 멈추고 속도를 낮춤
+                self.limiter.on_throttle(delay)
+                print(f"  ⏳ Notion 요청 제한 (429), {delay:.1f}초 후 재시도")
+                continue
+
+            reason = f"서버 오류 ({response.status})" if response is not None else "연결 오류"
+            print(f"  ⏳ Notion {reason}, {delay:.1f}초 후 재시도")
+            time.sleep(delay)
+
+            if recover is not None:
+                try:
+                    recovered = recover()
+                except Exception as e:
+                    print(f"❌ 요청이 처리됐는지 확인할 수 없어 재시도하지 않음: {e}")
+                    return None
+                if recovered is not None:
+                    print("  ♻️  이전 요청이 이미 처리되어 재시도하지 않음")
+                    return recovered
+
+        return None
 
     def query_database(self, database_id: str = WEBLINKS_DATABASE_ID,
                        filter_: Optional[Dict] = None) -> List[Dict]:
-        """데이터베이스 쿼리"""
+        """데이터베이스 쿼리 (모든 페이지)"""
         if not self.is_configured():
             return []
+        return list(self.iter_database(database_id, filter_))
+
+    def iter_database(self, database_id: str = WEBLINKS_DATABASE_ID,
+                      filter_: Optional[Dict] = None,
+                      sorts: Optional[List[Dict]] = None,
+                      filter_properties: Optional[List[str]] = None,
+                      page_size: int = 100) -> Iterator[Dict]:
+        """
+        데이터베이스 쿼리 결과를 페이지 단위로 받아 하나씩 반환
+
+        has_more/next_cursor를 따라 끝까지 요청한다. 중간 요청이 실패하면
+        일부만 받은 결과를 완전한 것으로 오해하지 않도록 RuntimeError를 낸다.
 
-        data = {}
+        Args:
+            filter_properties: 응답에 포함할 속성 ID 목록 (없으면 전체)
+        """
+        endpoint = f"/databases/{database_id}/query"
+        if filter_properties:
+            # 속성 ID는 응답에서 이미 퍼센트 인코딩된 형태로 옴
+            endpoint += '?' + '&'.join(f"filter_properties={quote(p, safe='%')}"
+                                       for p in filter_properties)
+
+        data: Dict[str, Any] = {'page_size': page_size}
         if filter_:
             data['filter'] = filter_
+        if sorts:
+            data['sorts'] = sorts
+
+        while True:
+            result = self._request(endpoint, 'POST', data)
+            if result is None:
+                raise RuntimeError("Notion 데이터베이스 쿼리 실패")
+
+            yield from result.get('results', [])
+
+            if not result.get('has_more') or not result.get('next_cursor'):
+                return
+            data['start_cursor'] = result['next_cursor']
+
+    def get_property_id(self, name: str,
+                        database_id: str = WEBLINKS_DATABASE_ID) -> Optional[str]:
+        """데이터베이스 속성 이름으로 속성 ID 조회"""
+        result = self._request(f"/databases/{database_id}")
+        if not result:
+            return None
+        prop = result.get('properties', {}).get(name)
+        return prop.get('id') if prop else None
+
+    def find_page(self, url: str,
+                  database_id: str = WEBLINKS_DATABASE_ID) -> Optional[Dict]:
+        """
+        URL 속성이 url인 페이지 (없으면 None)
 
-        result = self._request(f"/databases/{database_id}/query", 'POST', data)
-        return result.get('results', []) if result else []
+        Raises:
+            RuntimeError: 조회가 실패했을 때
+        """
+        filter_ = {'property': 'URL', 'url': {'equals': url}}
+        for page in self.iter_database(database_id, filter_, page_size=1):
+            return page
+        return None
 
     def create_page(self, title: str, url: str,
                     database_id: str = WEBLINKS_DATABASE_ID,
                     summary: str = "", date: str = "",
-                    tag: str = DEFAULT_TAG) -> bool:
-        """Notion 페이지 생성"""
+                    tag: str = DEFAULT_TAG) -> Optional[str]:
+        """Notion 페이지 생성 (생성된 페이지 ID 반환, 실패 시 None)"""
         if not self.is_configured():
             print(f"⚠️  Notion API 토큰 없음 (시뮬레이션): {title}")
-            return False
+            return None
 
         payload = self._build_page_payload(
             database_id=database_id,
@@ -82,8 +215,30 @@ class NotionClient:
             tag=tag,
         )
 
-        result = self._request("/pages", 'POST', payload)
-        return result is not None
+        # 페이지 생성은 멱등이 아니므로 5xx·연결 오류 뒤에는 이미 만들어졌는지 먼저 확인
+        result = self._request("/pages", 'POST', payload,
+                               recover=lambda: self.find_page(url, database_id))
+        if result is None:
+            return None
+        return result.get('id') or None
+
+    async def aquery_database(self, database_id: str = WEBLINKS_DATABASE_ID,
+                              filter_: Optional[Dict] = None) -> List[Dict]:
+        """데이터베이스 쿼리 (비동기, 같은 연결 풀 사용)"""
+        return await asyncio.to_thread(self.query_database, database_id, filter_)
+
+    async def acreate_page(self, title: str, url: str,
+                           database_id: str = WEBLINKS_DATABASE_ID,
+                           summary: str = "", date: str = "",
+                           tag: str = DEFAULT_TAG) -> Optional[str]:
+        """
+        Notion 페이지 생성 (비동기, 같은 연결 풀 사용)
+
+        asyncio.gather로 여러 요청을 동시에 보낼 수 있다.
+        """
+        return await asyncio.to_thread(
+            self.create_page, title, url, database_id, summary, date, tag,
+        )
 
     def _build_page_payload(self, database_id: str, title: str, url: str,
                             summary: str, date: str, tag: str) -> Dict[str, Any]:
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+
+from datetime import datetime
+from typing import Dict, Optional
+
+from config import NOTION_SYNC_STATE_FILE, WEBLINKS_DATABASE_ID
+from state_store import JsonStateStore
+from cache import URLCache, cache
+from notion_client import NotionClient, notion
+from url_canon import canonicalize_url
+
+
+class NotionSyncState(JsonStateStore):
+    """
+    Notion 미러 동기화 상태 저장소
+
+    데이터베이스별로 마지막으로 받은 페이지의 last_edited_time(high-water
+    mark)을 저장해 두고, 다음 동기화에서는 그 이후 수정된 페이지만 받는다.
+    """
+
+    def __init__(self, path: str = NOTION_SYNC_STATE_FILE):
+        super().__init__(path)
+
+    def high_water_mark(self, database_id: str) -> str:
+        """데이터베이스의 마지막 last_edited_time (없으면 빈 문자열)"""
+        self.load()
+        with self._lock:
+            return self._entries.get(database_id, {}).get('last_edited_time', '')
+
+    def update(self, database_id: str, last_edited_time: str) -> None:
+        """high-water mark 갱신 (save 호출 전까지는 메모리에만 반영)"""
+        self.load()
+        with self._lock:
+            self._entries[database_id] = {
+                'last_edited_time': last_edited_time,
+                'synced_at': datetime.now().isoformat(timespec='seconds'),
+            }
+
+
+class SyncSummary:
+    """동기화 결과"""
+
+    def __init__(self, full: bool):
+        self.full = full          # 전체 동기화 여부
+        self.pages = 0            # Notion에서 받은 페이지 수
+        self.urls = 0             # URL이 있는 페이지 수
+        self.added = 0            # 캐시에 없어서 추가한 URL 수
+        self.local_only = 0       # 캐시에만 있는 URL 수 (전체 동기화에서만 계산)
+        self.high_water_mark = ''
+
+
+def _page_url(page: Dict, property_name: str = 'URL') -> str:
+    """페이지 객체에서 URL 속성 값 추출"""
+    prop = page.get('properties', {}).get(property_name) or {}
+    return prop.get('url') or ''
+
+
+def sync_cache(full: bool = False,
+               database_id: str = WEBLINKS_DATABASE_ID,
+               client: Optional[NotionClient] = None,
+               url_cache: Optional[URLCache] = None,
+               state: Optional[NotionSyncState] = None) -> SyncSummary:
+    """
+    Notion Weblinks DB를 기준으로 로컬 캐시 재구성·검증
+
+    DB를 페이지 단위로 끝까지 받아 URL 속성만 읽고, 캐시에 없는 URL을
+    추가한다. 저장된 high-water mark가 있으면 그 이후 수정된 페이지만
+    요청하고(증분), full이면 처음부터 다시 받는다. 전체 동기화에서는
+    캐시에만 있는 URL 수(Notion에서 지워졌거나 추가에 실패한 글)도 센다.
+    high-water mark는 끝까지 성공했을 때만 저장한다.
+    """
+    client = client or notion
+    url_cache = url_cache or cache
+    state = state or NotionSyncState()
+
+    since = '' if full else state.high_water_mark(database_id)
+    summary = SyncSummary(full=not since)
+    summary.high_water_mark = since
+
+    url_property = client.get_property_id('URL', database_id)
+    if not url_property:
+        raise RuntimeError("Notion DB에서 URL 속성을 찾을 수 없습니다")
+
+    filter_ = None
+    if since:
+        # last_edited_time은 분 단위라 같은 분에 수정된 페이지까지 다시 받음
+        filter_ = {'timestamp': 'last_edited_time',
+                   'last_edited_time': {'on_or_after': since}}
+
+    notion_urls = set()
+    pages = client.iter_database(
+        database_id,
+        filter_=filter_,
+        sorts=[{'timestamp': 'last_edited_time', 'direction': 'ascending'}],
+        filter_properties=[url_property],
+    )
+    for page in pages:
+        summary.pages += 1
+        summary.high_water_mark = max(summary.high_water_mark, page.get('last_edited_time', ''))
+
+        url = _page_url(page)
+        if not url:
+            continue
+        summary.urls += 1
+        notion_urls.add(canonicalize_url(url))
+
+        if url not in url_cache:
+            summary.added += 1
+        url_cache.add(url, page_id=page.get('id', ''))
+
+    if summary.full:
+        # Notion의 URL은 모두 캐시에 추가됐으므로 차이가 곧 캐시에만 있는 URL
+        summary.local_only = max(0, len(url_cache) - len(notion_urls))
+
+    if summary.high_water_mark:
+        state.update(database_id, summary.high_water_mark)
+        state.save()
+
+    return summary
@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import List, Dict, Any, Type, Optional, Callable
+
+from config import CRAWL_CONCURRENCY, SOURCE_TIMEOUT, BROWSER_WORKERS, WORKER_SHUTDOWN_TIMEOUT
+from metrics import metrics
+from source_health import SourceHealthStore, source_health, RUN, PROBE, SKIP
+from crawlers import BaseCrawler, BrowserWorkers, feed_fetcher, replay_transport
+
+# 크롤러의 deadline이 멈춰 있을 때 다시 확인하는 간격 (초)
+_DEADLINE_POLL = 0.5
+
+
+class SourceResult:
+    """소스별 크롤링 결과"""
+
+    def __init__(self, crawler: BaseCrawler, posts: List[Dict[str, Any]],
+                 error: str = "", elapsed: float = 0.0, error_class: str = "",
+                 circuit_open: bool = False):
+        self.crawler = crawler
+        self.posts = posts
+        self.error = error
+        self.elapsed = elapsed
+        self.error_class = error_class  # 오류 종류 (예외 클래스 이름, 시간 초과, 글 없음)
+        self.circuit_open = circuit_open  # 회로가 열려 크롤링하지 않음
+
+    @property
+    def name(self) -> str:
+        return self.crawler.name
+
+    @property
+    def ok(self) -> bool:
+        # 새 글이 없어도 아는 글을 확인했으면 성공
+        return bool(self.posts) or (self.skipped > 0 and not self.error)
+
+    @property
+    def skipped(self) -> int:
+        return self.crawler.skipped
+
+    @property
+    def path(self) -> str:
+        return self.crawler.fetch_path
+
+    @property
+    def not_modified(self) -> bool:
+        return self.crawler.not_modified and not self.error
+
+
+class CrawlOrchestrator:
+    """
+    크롤러 동시 실행기
+
+    RSS 크롤러는 스레드 풀에서, Playwright 크롤러는 브라우저 워커에서
+    asyncio 이벤트 루프가 함께 조율한다. 전체 동시 실행 수와
+    소스별 제한 시간을 적용한다.
+
+    제한 시간은 크롤러의 deadline으로도 전달되어 페이지 이동, 준비 대기,
+    정적 HTML·피드 다운로드가 그 시각을 넘기지 않는다. 크롤러가 파이프라인
+    큐가 가득 차 기다리는 시간은 제한 시간에 넣지 않는다. 그래도 끝나지 않은
+    워커는 WORKER_SHUTDOWN_TIMEOUT만 기다린 뒤 두고 진행한다.
+
+    workers를 넘기면 실행마다 브라우저 워커를 만들지 않고 그 워커를
+    사용하며 종료도 하지 않는다 (데몬 모드에서 Chromium을 계속 띄워 둠).
+
+    소스마다 결과를 health에 기록하고, 회로가 열린 소스는 건너뛰거나
+    HEAD 요청으로 먼저 확인한다 (재생 모드에서는 사용하지 않음).
+    """
+
+    def __init__(self, max_concurrency: int = CRAWL_CONCURRENCY,
+                 source_timeout: float = SOURCE_TIMEOUT,
+                 browser_workers: int = BROWSER_WORKERS,
+                 workers: Optional[BrowserWorkers] = None,
+                 health: Optional[SourceHealthStore] = source_health):
+        self.max_concurrency = max(1, max_concurrency)
+        self.source_timeout = source_timeout
+        self.browser_workers = max(1, browser_workers)
+        self.workers = workers
+        self.health = health
+        self._on_post = None
+
+    def run(self, crawler_classes: List[Type[BaseCrawler]],
+            on_post: Optional[Callable[[Dict[str, Any]], None]] = None) -> List[SourceResult]:
+        """
+        모든 크롤러 실행 후 입력 순서대로 결과 반환
+
+        Args:
+            on_post: 글이 파싱될 때마다 크롤러 스레드에서 호출할 콜백
+        """
+        self._on_post = on_post
+        return asyncio.run(self._run_all([cls() for cls in crawler_classes]))
+
+    async def _run_all(self, crawlers: List[BaseCrawler]) -> List[SourceResult]:
+        """소스별 작업을 동시에 실행"""
+        health = None if replay_transport.replaying else self.health
+        decisions = {crawler.source_id: health.decide(crawler.source_id) if health else RUN
+                     for crawler in crawlers}
+
+        # RSS 피드는 소스 작업이 시작되기 전에 한꺼번에 내려받기 시작
+        # (회로가 열린 소스는 확인을 통과한 뒤에 받음)
+        feed_fetcher.prefetch([crawler for crawler in crawlers
+                               if not crawler.uses_browser and decisions[crawler.source_id] == RUN])
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        rss_executor = ThreadPoolExecutor(max_workers=self.max_concurrency,
+                                          thread_name_prefix="rss")
+        browser_workers = self.workers
+        owns_workers = browser_workers is None
+        # 건너뛸 소스만 남은 경우 Chromium을 띄우지 않음
+        browser_count = sum(1 for crawler in crawlers
+                            if crawler.uses_browser and decisions[crawler.source_id] != SKIP)
+        if owns_workers and browser_count:
+            browser_workers = BrowserWorkers(min(self.browser_workers, browser_count))
+
+        try:
+            return await asyncio.gather(*[
+                self._run_source(crawler, decisions[crawler.source_id], health,
+                                 semaphore, rss_executor, browser_workers)
+                for crawler in crawlers
+            ])
+        finally:
+            feed_fetcher.discard(crawlers)
+            rss_executor.shutdown(wait=False, cancel_futures=True)
+            if owns_workers and browser_workers:
+                stuck = browser_workers.shutdown(timeout=WORKER_SHUTDOWN_TIMEOUT)
+                if stuck:
+                    print(f"⚠️  끝나지 않은 브라우저 워커를 두고 진행: {', '.join(stuck)}")
+
+    async def _run_source(self, crawler: BaseCrawler, decision: str,
+                          health: Optional[SourceHealthStore],
+                          semaphore: asyncio.Semaphore,
+                          rss_executor: ThreadPoolExecutor,
+                          browser_workers: BrowserWorkers) -> SourceResult:
+        """단일 소스 실행 후 상태 기록 (회로가 열렸으면 건너뜀)"""
+        if decision == SKIP:
+            metrics.count('circuit_skips', source=crawler.source_id)
+            return SourceResult(crawler, [], "연속 실패로 건너뜀", circuit_open=True)
+
+        async with semaphore:
+            started = time.perf_counter()
+            if decision == PROBE:
+                result = await self._probe(crawler, rss_executor)
+                if result is not None:
+                    result.elapsed = time.perf_counter() - started
+                    health.record(crawler.source_id, False, result.elapsed, result.error_class)
+                    return result
+
+            result = await self._fetch(crawler, rss_executor, browser_workers)
+            result.elapsed = time.perf_counter() - started
+            if health:
+                health.record(crawler.source_id, result.ok or result.not_modified,
+                              result.elapsed, result.error_class)
+            return result
+
+    async def _probe(self, crawler: BaseCrawler,
+                     rss_executor: ThreadPoolExecutor) -> Optional[SourceResult]:
+        """회로가 열린 소스를 HEAD 요청으로 확인 (통과하면 None, 실패하면 건너뛴 결과)"""
+        print(f"  🩺 {crawler.name}: 연속 실패 후 재확인 중...")
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.run_in_executor(rss_executor, crawler.probe)
+        except Exception as e:
+            metrics.count('circuit_skips', source=crawler.source_id)
+            return SourceResult(crawler, [], f"재확인 실패: {e}",
+                                error_class=type(e).__name__, circuit_open=True)
+        return None
+
+    async def _fetch(self, crawler: BaseCrawler, rss_executor: ThreadPoolExecutor,
+                     browser_workers: BrowserWorkers) -> SourceResult:
+        """크롤러 실행 (제한 시간 초과 시 실패 처리)"""
+        crawler.deadline = time.monotonic() + self.source_timeout
+        fetch = partial(crawler.fetch, self._on_post)
+
+        if crawler.uses_browser:
+            future = asyncio.wrap_future(browser_workers.submit(fetch))
+        else:
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(rss_executor, fetch)
+
+        try:
+            posts = await self._wait_deadline(crawler, future)
+            # 크롤러가 처리한 예외도 결과에 남김
+            error, error_class = crawler.error, crawler.error_class
+        except asyncio.TimeoutError:
+            posts = []
+            error, error_class = f"{self.source_timeout}초 제한 시간 초과", "SourceTimeout"
+        except Exception as e:
+            posts = []
+            error, error_class = str(e), type(e).__name__
+
+        result = SourceResult(crawler, posts or [], error, error_class=error_class)
+        if not (result.ok or result.not_modified or error_class):
+            result.error_class = "NoPosts"
+        return result
+
+
+    @staticmethod
+    async def _wait_deadline(crawler: BaseCrawler, future: 'asyncio.Future') -> Any:
+        """
+        크롤러의 deadline까지 future 대기 (지나면 asyncio.TimeoutError)
+
+        크롤러가 파이프라인 backpressure로 기다리는 동안은 deadline이 멈췄다가
+        그만큼 늦춰지므로, 고정 시간이 아니라 deadline을 다시 읽으며 기다린다.
+        """
+        while True:
+            left = crawler.seconds_left()
+            if left is not None and left <= 0:
+                # 아직 시작하지 않은 작업(브라우저 워커 대기열)은 실행하지 않음
+                future.cancel()
+                raise asyncio.TimeoutError
+            done, _ = await asyncio.wait({future}, timeout=_DEADLINE_POLL if left is None else left)
+            if done:
+                return future.result()
+
+
+def crawl_concurrently(crawler_classes: List[Type[BaseCrawler]]) -> List[SourceResult]:
+    """기본 설정으로 모든 크롤러 동시 실행"""
+    return CrawlOrchestrator().run(crawler_classes)
@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+
+import queue
+import threading
+from typing import List, Dict, Any, Type, Optional
+
+from config import NOTION_WRITERS, PIPELINE_QUEUE_SIZE
+from cache import cache
+from url_canon import canonicalize_url
+from notion_client import notion
+from source_marks import source_marks
+from metrics import metrics
+from profiling import profiler
+from crawlers import BaseCrawler
+from orchestrator import CrawlOrchestrator, SourceResult
+
+# 작성 워커 종료 신호
+_STOP = object()
+
+
+class PipelineSummary:
+    """파이프라인 실행 결과"""
+
+    def __init__(self):
+        self.results: List[SourceResult] = []
+        self.seen = 0       # 크롤러가 찾은 글 수
+        self.new = 0        # 캐시에 없는 새 글 수
+        self.added = 0      # Notion에 추가된 글 수
+        self.failed = 0     # Notion 추가 실패 수
+
+    @property
+    def skipped(self) -> int:
+        """크롤러가 이미 아는 글이라 건너뛴 목록 항목 수"""
+        return sum(result.skipped for result in self.results)
+
+
+class NotionPipeline:
+    """
+    크롤러 → 중복 제거 → Notion 작성 스트리밍 파이프라인
+
+    크롤러가 글을 파싱하는 대로 캐시와 비교해 새 글만 제한된 크기의
+    큐에 넣고, 작성 워커들이 큐에서 꺼내 Notion에 추가한다.
+    큐가 가득 차면 크롤러 스레드가 대기한다 (backpressure).
+    """
+
+    def __init__(self, writers: int = NOTION_WRITERS,
+                 queue_size: int = PIPELINE_QUEUE_SIZE,
+                 orchestrator: Optional[CrawlOrchestrator] = None):
+        self.writers = max(1, writers)
+        self.queue_size = queue_size
+        self.orchestrator = orchestrator or CrawlOrchestrator()
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._lock = threading.Lock()
+        self._seen_urls = set()
+        self._failed_sources = set()  # 이번 실행에서 작성에 실패한 소스
+        self._closed = threading.Event()
+        self._summary = PipelineSummary()
+        self._workers: List[threading.Thread] = []
+
+    def run(self, crawler_classes: List[Type[BaseCrawler]]) -> PipelineSummary:
+        """크롤링과 Notion 작성을 동시에 진행하고 결과 반환"""
+        self.start()
+        try:
+            self._summary.results = self.orchestrator.run(crawler_classes, on_post=self.submit)
+        finally:
+            self.close()
+
+        self.settle(self._summary.results)
+        return self._summary
+
+    def start(self) -> None:
+        """Notion 작성 워커 시작"""
+        self._workers = [
+            threading.Thread(target=self._write_loop, name=f"notion-writer-{i}", daemon=True)
+            for i in range(self.writers)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    def submit(self, post: Dict[str, Any]) -> None:
+        """
+        중복 제거 단계 (크롤러 스레드에서 호출)
+
+        새 글만 큐에 넣고, 큐가 가득 차면 자리가 날 때까지 대기한다.
+        """
+        if self._closed.is_set():
+            return
+
+        source = post.get('source', '')
+        metrics.count('posts', source=source, state='seen')
+        with metrics.span('filter', source), self._lock:
+            self._summary.seen += 1
+            key = canonicalize_url(post['url'])
+            if key in self._seen_urls or key in cache:
+                return
+            self._seen_urls.add(key)
+            self._summary.new += 1
+        metrics.count('posts', source=source, state='new')
+
+        # 큐가 가득 차면 여기서 대기 (크롤러 속도를 작성 속도에 맞춤)
+        while not self._closed.is_set():
+            try:
+                self._queue.put(post, timeout=0.5)
+                return
+            except queue.Full:
+                continue
+
+    def drain(self) -> None:
+        """지금까지 큐에 넣은 글이 모두 작성될 때까지 대기"""
+        self._queue.join()
+
+    def settle(self, results: List[SourceResult]) -> None:
+        """
+        작성이 모두 끝난 뒤(drain 또는 close 후) 소스별 상태 확정
+
+        오류·시간 초과 없이 끝났고 작성 실패도 없는 소스만 이번 실행의
+        상태(피드 검증값)를 저장하고, 나머지는 다음 실행에서 다시 처리하도록 지운다.
+        """
+        with self._lock:
+            failed, self._failed_sources = self._failed_sources, set()
+        for result in results:
+            result.crawler.settle(not result.error and result.crawler.source_id not in failed)
+
+    def forget_seen(self) -> None:
+        """
+        이번 실행에서 본 URL 목록 비우기 (drain 후 다음 실행 전에 호출)
+
+        작성된 글은 캐시에 있으므로 다시 걸러진다. 계속 실행되는 데몬에서
+        목록이 끝없이 커지지 않게 한다.
+        """
+        with self._lock:
+            self._seen_urls.clear()
+
+    def close(self) -> None:
+        """늦게 도착한 글은 버리고, 워커는 큐에 남은 글까지 처리 후 종료"""
+        self._closed.set()
+        for _ in self._workers:
+            self._queue.put(_STOP)
+        for worker in self._workers:
+            worker.join()
+        self._workers = []
+
+    @property
+    def summary(self) -> PipelineSummary:
+        return self._summary
+
+    def _write_loop(self) -> None:
+        """Notion 작성 워커"""
+        with profiler.stage('notion_write'):
+            while True:
+                post = self._queue.get()
+                try:
+                    if post is _STOP:
+                        return
+                    self._write(post)
+                finally:
+                    self._queue.task_done()
+
+    def _write(self, post: Dict[str, Any]) -> None:
+        """글 하나를 Notion에 추가"""
+        source_label = f"[{post.get('source', '?').upper()}]"
+
+        with metrics.span('notion_write', post.get('source', '')):
+            page_id = notion.create_page(
+                title=post['title'],
+                url=post['url'],
+                summary=post.get('summary', ''),
+                date=post.get('date', ''),
+            )
+
+        with self._lock:
+            if page_id:
+                cache.add(post['url'], post=post, page_id=page_id)
+                source_marks.advance(post.get('source', ''), canonicalize_url(post['url']),
+                                     post.get('date', ''))
+                self._summary.added += 1
+                metrics.count('posts', source=post.get('source', ''), state='written')
+                print(f"  ✅ {source_label} {post['title']}")
+                print(f"     📅 {post['date']}  🔗 {post['url']}")
+            else:
+                # 다음 실행에서 다시 시도하도록 본 URL에서 빼고, settle에서 소스 상태를 확정하지 않음
+                self._seen_urls.discard(canonicalize_url(post['url']))
+                self._failed_sources.add(post.get('source', ''))
+                self._summary.failed += 1
+                metrics.count('posts', source=post.get('source', ''), state='failed')
+                print(f"  ❌ {source_label} {post['title']}")
+
+
+def run_pipeline(crawler_classes: List[Type[BaseCrawler]],
+                 sequential: bool = False) -> PipelineSummary:
+    """
+    기본 설정으로 스트리밍 파이프라인 실행
+
+    Args:
+        sequential: 소스를 하나씩 크롤링하고 작성 워커도 하나만 사용
+            (메모리 프로파일에서 단계별 할당을 구분하기 위함)
+    """
+    if sequential:
+        orchestrator = CrawlOrchestrator(max_concurrency=1, browser_workers=1)
+        return NotionPipeline(writers=1, orchestrator=orchestrator).run(crawler_classes)
+    return NotionPipeline().run(crawler_classes)
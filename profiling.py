@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple, TYPE_CHECKING
+
+# cProfile/pstats/tracemalloc는 --profile을 켰을 때만 import (시작 시간 절약)
+if TYPE_CHECKING:
+    import cProfile
+    import pstats
+
+from config import PROFILE_DIR, PROFILE_TOP_N, PROFILE_MEM_FRAMES
+
+PROFILE_MODES = ('cpu', 'mem')
+
+
+def _mem_filters() -> List:
+    """tracemalloc 스냅샷에서 뺄 프레임 (프로파일러 자신, import 과정)"""
+    import tracemalloc
+    return [
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+        tracemalloc.Filter(False, "<unknown>"),
+    ]
+
+
+class _RunProfile:
+    """
+    실행 전체를 하나로 기록하는 CPU 프로파일 (cProfile)
+
+    Python 3.12부터는 cProfile이 sys.monitoring을 써서 Profile 하나가 모든
+    스레드의 호출을 기록한다. 3.11 이하의 cProfile은 켠 스레드만 기록하므로,
+    켠 뒤에 시작하는 스레드(크롤러, 작성 워커)마다 threading.setprofile로
+    C 프로파일러를 하나씩 켜고 stop에서 합친다 (Python 콜백은 스레드의 첫
+    이벤트에서 한 번만 실행됨).
+    """
+
+    def __init__(self):
+        import cProfile
+        self._main = cProfile.Profile()
+        self._threads: List['cProfile.Profile'] = []
+        self._per_thread = sys.version_info < (3, 12)
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        if self._per_thread:
+            threading.setprofile(self._start_thread)
+        self._main.enable()
+
+    def _start_thread(self, frame, event: str, arg) -> None:
+        import cProfile
+        profile = cProfile.Profile()
+        with self._lock:
+            self._threads.append(profile)
+        profile.enable()
+
+    def stop(self) -> 'pstats.Stats':
+        """프로파일을 끄고 모든 스레드의 기록을 합친 통계 반환"""
+        import pstats
+        threading.setprofile(None)
+        self._main.disable()
+        stats = pstats.Stats(self._main)
+        with self._lock:
+            threads, self._threads = self._threads, []
+        for profile in threads:
+            # 다른 스레드의 프로파일러는 그 스레드에서만 끌 수 있으므로 지금까지 값만 읽음
+            profile.snapshot_stats()
+            stats.add(_Snapshot(profile.stats))
+        return stats
+
+
+class _Snapshot:
+    """pstats.Stats.add에 넘길 이미 계산된 통계"""
+
+    def __init__(self, stats: Dict):
+        self.stats = stats
+
+    def create_stats(self) -> None:
+        pass
+
+
+class StageProfiler:
+    """
+    실행 단계별 CPU/메모리 프로파일러 (python main.py --profile cpu|mem)
+
+    - cpu: start부터 finish까지 실행 전체를 cProfile 하나로 기록해
+      run.prof로 저장 (snakeviz, pstats로 열 수 있음). 단계를 나눠 프로파일러를
+      켜고 끄지 않으므로, 단계별 소요 시간은 metrics span(run_metrics.json)으로 본다.
+    - mem: stage(name) 블록 전후 tracemalloc 스냅샷 차이 상위 N줄과 블록
+      동안의 최대 증가량을 {name}.mem.txt로 저장
+    mem 모드가 아니면 stage는 아무것도 하지 않는 with 블록이다.
+
+    tracemalloc은 프로세스 전체를 추적하므로 mem 모드에서는 소스를 하나씩
+    크롤링해야 단계별 차이가 의미 있다 (run_pipeline(sequential=True)).
+    그래도 동시에 도는 Notion 작성 워커의 할당은 섞일 수 있다.
+    """
+
+    def __init__(self, output_dir: str = PROFILE_DIR, top_n: int = PROFILE_TOP_N):
+        self.mode: Optional[str] = None
+        self.output_dir = output_dir
+        self.top_n = top_n
+        self._cpu: Optional[_RunProfile] = None
+        self._mem: Dict[str, List[Tuple[int, int, str]]] = {}  # (최대 증가량, 증가량, 보고서)
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode is not None
+
+    def start(self, mode: Optional[str]) -> None:
+        """프로파일링 시작 (mode가 None이면 끈 상태 유지)"""
+        if mode not in (None,) + PROFILE_MODES:
+            raise ValueError(f"알 수 없는 프로파일 모드: {mode}")
+        self.mode = mode
+        if mode == 'cpu':
+            self._cpu = _RunProfile()
+            self._cpu.start()
+        elif mode == 'mem':
+            import tracemalloc
+            tracemalloc.start(PROFILE_MEM_FRAMES)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """블록을 name 단계로 메모리 프로파일링 (mem 모드에서만)"""
+        if self.mode == 'mem':
+            with self._profile_mem(name):
+                yield
+        else:
+            yield
+
+    @contextmanager
+    def _profile_mem(self, name: str) -> Iterator[None]:
+        import tracemalloc
+        # 최대치는 프로세스 전체 값이라 reset_peak로 지우면 바깥·동시 단계의
+        # 값이 망가진다. 대신 블록 전후 값과 스냅샷 차이로 이 블록의 최대 증가량을 구함
+        start, start_peak = tracemalloc.get_traced_memory()
+        before = tracemalloc.take_snapshot().filter_traces(_mem_filters())
+        try:
+            yield
+        finally:
+            current, peak = tracemalloc.get_traced_memory()
+            after = tracemalloc.take_snapshot().filter_traces(_mem_filters())
+            diff = after.compare_to(before, 'lineno')
+            growth = sum(stat.size_diff for stat in diff)
+            held = sum(stat.size_diff for stat in diff if stat.size_diff > 0)
+            if peak > start_peak:
+                # 블록 동안 최대치가 새로 기록됨
+                rise, note = max(held, peak - start), ""
+            else:
+                # 이전 최대치를 넘지 않았으면 종료 시점까지 늘어난 할당을 하한으로 사용
+                rise, note = held, " 이상"
+
+            lines = [
+                f"# {name}",
+                f"# 블록 동안 최대 증가량 {rise / 1024:.0f}KB{note}, 종료 시점 {current / 1024:.0f}KB",
+                f"# 증가량 합계 {growth / 1024:+.0f}KB",
+                "",
+            ]
+            lines += [str(stat) for stat in diff[:self.top_n]]
+            with self._lock:
+                self._mem.setdefault(name, []).append((rise, growth, "\n".join(lines)))
+
+    def finish(self) -> List[str]:
+        """결과를 output_dir에 저장하고 저장한 파일 경로 목록 반환"""
+        if self.mode is None:
+            return []
+
+        import tracemalloc
+        os.makedirs(self.output_dir, exist_ok=True)
+        written = []
+        with self._lock:
+            cpu, self._cpu = self._cpu, None
+            mem, self._mem = self._mem, {}
+
+        if cpu is not None:
+            stats = cpu.stop()
+            path = os.path.join(self.output_dir, "run.prof")
+            stats.dump_stats(path)
+            written.append(path)
+            print(f"  🔬 전체 실행: {stats.total_tt:.2f}초 (모든 스레드 합계) - {self._top_functions(stats)}")
+            print("     단계별 소요 시간은 run_metrics.json 참고")
+
+        for name, reports in sorted(mem.items()):
+            path = os.path.join(self.output_dir, f"{name}.mem.txt")
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write("\n\n".join(report for _, _, report in reports) + "\n")
+            written.append(path)
+            peak = max(peak for peak, _, _ in reports)
+            growth = sum(growth for _, growth, _ in reports)
+            print(f"  🔬 {name}: 최대 증가 {peak / 1024:.0f}KB, 증가 {growth / 1024:+.0f}KB")
+
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+        return written
+
+    @staticmethod
+    def _top_functions(stats: 'pstats.Stats', count: int = 3) -> str:
+        """자체 시간(tottime) 상위 함수 요약 한 줄"""
+        entries = sorted(stats.stats.items(), key=lambda item: item[1][2], reverse=True)
+        parts = []
+        for (filename, line, function), (_, _, tottime, _, _) in entries[:count]:
+            parts.append(f"{function} ({os.path.basename(filename)}:{line}) {tottime:.2f}초")
+        return ", ".join(parts)
+
+
+# 기본 프로파일러 인스턴스 (start 전에는 꺼져 있음)
+profiler = StageProfiler()
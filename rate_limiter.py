@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+from config import NOTION_RATE_LIMIT, NOTION_BACKOFF_BASE, NOTION_BACKOFF_MAX
+
+
+class AdaptiveTokenBucket:
+    """
+    적응형 토큰 버킷
+
+    초당 rate개의 토큰을 채우고 요청마다 하나씩 소비한다.
+    스로틀(429)을 받으면 속도를 절반으로 줄이고 Retry-After 동안 모든
+    요청을 멈추며, 성공이 이어지면 max_rate까지 천천히 다시 올린다.
+    여러 스레드에서 동시에 사용할 수 있다.
+    """
+
+    def __init__(self, rate: float = NOTION_RATE_LIMIT, burst: float = 1.0,
+                 min_rate: float = 0.5, increase_step: float = 0.1):
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.increase_step = increase_step  # 성공 1회당 증가량 (req/s)
+        self.throttled = 0
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+        self._updated = now
+
+    def acquire(self) -> None:
+        """토큰을 하나 얻을 때까지 대기"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    wait = self._paused_until - now
+                else:
+                    self._refill(now)
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def on_success(self) -> None:
+        """성공 응답 반영 (속도를 조금씩 회복)"""
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.increase_step)
+
+    def on_throttle(self, retry_after: float) -> None:
+        """429 응답 반영 (속도 절반, retry_after 동안 전체 일시정지)"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.throttled += 1
+            self.rate = max(self.min_rate, self.rate / 2)
+            self._tokens = 0
+            self._paused_until = max(self._paused_until, now + retry_after)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After 헤더 (초 또는 HTTP 날짜)를 초 단위로 변환"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(attempt: int, base: float = NOTION_BACKOFF_BASE,
+                  cap: float = NOTION_BACKOFF_MAX) -> float:
+    """지수 백오프 + 지터 (attempt는 0부터)"""
+    delay = min(cap, base * (2 ** attempt))
+    return random.uniform(delay / 2, delay)
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from config import (
+    HEALTH_FILE, HEALTH_HISTORY, HEALTH_FAILURE_THRESHOLD,
+    HEALTH_OPEN_SECONDS, HEALTH_OPEN_MAX_SECONDS,
+)
+from state_store import JsonStateStore
+
+# 회로 상태
+CLOSED = 'closed'        # 정상 실행
+OPEN = 'open'            # 연속 실패로 건너뜀 (retry_at까지)
+HALF_OPEN = 'half_open'  # 대기 시간이 지나 한 번 확인 중
+
+# decide 결과
+RUN = 'run'      # 평소처럼 크롤링
+PROBE = 'probe'  # 가벼운 확인 후 통과하면 크롤링
+SKIP = 'skip'    # 크롤링하지 않음
+
+
+class SourceHealthStore(JsonStateStore):
+    """
+    소스별 상태 기록과 회로 차단기
+
+    소스마다 최근 HEALTH_HISTORY번의 결과(성공 여부, 소요 시간, 오류 종류)와
+    회로 상태를 저장한다. 연속 HEALTH_FAILURE_THRESHOLD번 실패하면 회로가
+    열려 HEALTH_OPEN_SECONDS 동안 건너뛰고, 그 뒤에는 가벼운 확인(HEAD)을
+    통과한 경우에만 한 번 크롤링해 본다. 성공하면 회로가 닫히고, 실패하면
+    대기 시간을 두 배로 늘려(HEALTH_OPEN_MAX_SECONDS까지) 다시 연다.
+    """
+
+    def __init__(self, path: str = HEALTH_FILE):
+        super().__init__(path)
+
+    def _entry(self, source_id: str) -> Dict[str, Any]:
+        return self._entries.setdefault(source_id, {
+            'state': CLOSED, 'failures': 0, 'cooldown': 0, 'retry_at': 0, 'history': [],
+        })
+
+    def decide(self, source_id: str, now: Optional[float] = None) -> str:
+        """
+        이번 실행에서 소스를 어떻게 다룰지 결정 (RUN, PROBE, SKIP)
+
+        PROBE를 반환하면 회로를 반쯤 연 상태로 바꾸고, 결과는 record로 알려야 한다.
+        """
+        self.load()
+        now = time.time() if now is None else now
+        with self._lock:
+            entry = self._entry(source_id)
+            if entry['state'] == CLOSED or not HEALTH_FAILURE_THRESHOLD:
+                return RUN
+            if entry['state'] == OPEN and now < entry['retry_at']:
+                return SKIP
+            entry['state'] = HALF_OPEN
+            return PROBE
+
+    def record(self, source_id: str, ok: bool, elapsed: float, error: str = "",
+               now: Optional[float] = None) -> str:
+        """
+        크롤링(또는 확인) 결과 기록 후 회로 상태 반환 (save 호출 전까지는 메모리에만 반영)
+
+        Args:
+            elapsed: 소요 시간 (초)
+            error: 실패한 경우 오류 종류 (예외 클래스 이름 등)
+        """
+        self.load()
+        now = time.time() if now is None else now
+        with self._lock:
+            entry = self._entry(source_id)
+            entry['history'] = (entry['history'] + [{
+                'at': datetime.fromtimestamp(now).isoformat(timespec='seconds'),
+                'ok': ok,
+                'ms': round(elapsed * 1000),
+                'error': '' if ok else error,
+            }])[-HEALTH_HISTORY:]
+
+            if ok:
+                entry.update(state=CLOSED, failures=0, cooldown=0, retry_at=0)
+                return CLOSED
+
+            entry['failures'] += 1
+            if entry['state'] == HALF_OPEN:
+                # 확인 실패: 대기 시간을 늘려 다시 열기
+                cooldown = min(HEALTH_OPEN_MAX_SECONDS, max(HEALTH_OPEN_SECONDS, entry['cooldown'] * 2))
+            elif HEALTH_FAILURE_THRESHOLD and entry['failures'] >= HEALTH_FAILURE_THRESHOLD:
+                cooldown = HEALTH_OPEN_SECONDS
+            else:
+                return entry['state']
+            entry.update(state=OPEN, cooldown=cooldown, retry_at=now + cooldown)
+            return OPEN
+
+    def stats(self, source_id: str) -> Dict[str, Any]:
+        """
+        소스 요약 (state, runs, successes, p50_ms, last_error, failures, retry_at)
+
+        last_error는 가장 최근 실패의 오류 종류, failures는 연속 실패 수.
+        """
+        self.load()
+        with self._lock:
+            entry = dict(self._entry(source_id))
+        history = entry['history']
+        errors = [item['error'] for item in history if not item['ok']]
+        elapsed = sorted(item['ms'] for item in history)
+        return {
+            'state': entry['state'],
+            'runs': len(history),
+            'successes': sum(1 for item in history if item['ok']),
+            'p50_ms': elapsed[len(elapsed) // 2] if elapsed else 0,
+            'last_error': errors[-1] if errors else '',
+            'failures': entry['failures'],
+            'retry_at': entry['retry_at'],
+        }
+
+
+# 기본 상태 저장소 인스턴스
+source_health = SourceHealthStore()
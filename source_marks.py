@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+from typing import Dict
+
+from config import SOURCE_MARK_FILE
+from state_store import JsonStateStore
+
+
+class SourceMarkStore(JsonStateStore):
+    """
+    소스별 high-water mark 저장소
+
+    소스마다 Notion에 들어간 가장 최신 글의 URL과 날짜를 저장해 두고,
+    크롤러가 목록을 최신순으로 훑다가 이미 아는 글에서 멈추는 데 쓴다.
+    지난 실행이 끝까지 처리되지 않은 소스(작성 실패, 시간 초과, 강제 종료)는
+    'incomplete' 표시를 남겨 다음 실행에서 멈추지 않고 목록을 끝까지 본다.
+    """
+
+    def __init__(self, path: str = SOURCE_MARK_FILE):
+        super().__init__(path)
+
+    def get(self, source_id: str) -> Dict[str, str]:
+        """소스의 mark 반환 ({'url', 'date', 'incomplete'}, 없으면 빈 값)"""
+        self.load()
+        with self._lock:
+            return dict(self._entries.get(source_id, {}))
+
+    def advance(self, source_id: str, url: str, date: str) -> None:
+        """
+        더 최신 글이면 mark 갱신 (save 호출 전까지는 메모리에만 반영)
+
+        날짜는 소스가 주는 'YYYY.MM.DD' 문자열이라 사전순 비교로 충분하다.
+        같은 날짜면 나중에 알게 된 글로 바꾸지 않는다.
+        """
+        self.load()
+        with self._lock:
+            entry = self._entries.get(source_id)
+            if entry and entry.get('date', '') >= date:
+                return
+            self._entries.setdefault(source_id, {}).update(url=url, date=date)
+
+    def begin(self, source_id: str) -> None:
+        """
+        소스 처리를 시작하며 'incomplete' 표시 (프로세스가 죽어도 남도록 바로 저장)
+
+        complete로 지우기 전까지 다음 실행은 조기 중단하지 않는다.
+        """
+        self.load()
+        with self._lock:
+            entry = self._entries.setdefault(source_id, {})
+            if entry.get('incomplete'):
+                return
+            entry['incomplete'] = True
+            try:
+                self.save()
+            except OSError as e:
+                print(f"⚠️  {self.path} 저장 실패: {e}")
+
+    def complete(self, source_id: str) -> None:
+        """모든 글이 처리된 소스의 'incomplete' 표시 제거 (save 호출 전까지는 메모리에만 반영)"""
+        self.load()
+        with self._lock:
+            entry = self._entries.get(source_id)
+            if entry:
+                entry.pop('incomplete', None)
+
+
+# 기본 mark 저장소 인스턴스
+source_marks = SourceMarkStore()
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+
+import json
+import os
+import threading
+from typing import Any, Dict
+
+
+class JsonStateStore:
+    """
+    키별 상태를 JSON 파일 하나에 저장하는 저장소의 기반 클래스
+
+    처음 사용할 때 한 번 로드하고(파일이 없거나 깨졌으면 빈 상태),
+    save는 임시 파일에 쓴 뒤 os.replace로 교체한다. 서브클래스는
+    self._entries를 self._lock 안에서만 다룬다. 잠금은 재진입 가능하므로
+    잠금 안에서 save를 호출해도 된다.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._entries: Dict[str, Any] = {}
+        self._loaded = False
+        self._lock = threading.RLock()
+
+    def load(self) -> None:
+        """저장 파일에서 상태 로드 (이미 로드했으면 무시)"""
+        with self._lock:
+            if self._loaded:
+                return
+
+            entries: Any = {}
+            if os.path.exists(self.path):
+                try:
+                    with open(self.path, 'r', encoding='utf-8') as f:
+                        entries = json.load(f)
+                except (OSError, ValueError) as e:
+                    print(f"⚠️  {self.path} 읽기 실패, 빈 상태로 시작: {e}")
+            self._entries = entries if isinstance(entries, dict) else {}
+            self._loaded = True
+
+    def save(self) -> None:
+        """
+        상태를 파일에 저장 (임시 파일 교체 방식, 로드한 적이 없으면 무시)
+
+        Raises:
+            OSError: 쓰기 실패 (임시 파일은 지우고, 기존 파일은 그대로 둠)
+        """
+        with self._lock:
+            if not self._loaded:
+                return
+
+            tmp_path = f"{self.path}.tmp"
+            try:
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(self._entries, f, ensure_ascii=False, indent=2, sort_keys=True)
+                os.replace(tmp_path, self.path)
+            except OSError:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+                raise
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+from crawlers.browser_pool import BrowserPool, child_pids, child_rss_mb
+
+pytestmark = pytest.mark.skipif(not os.path.isdir('/proc'), reason="/proc 필요")
+
+# 자식 하나를 띄우고 기다리는 프로세스 (드라이버 → Chromium 구조 흉내)
+DRIVER = ("import subprocess, sys, time; "
+          "subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(30)']); time.sleep(30)")
+
+
+def rss_mb(pid):
+    with open(f'/proc/{pid}/statm', 'rb') as f:
+        return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+
+
+def test_child_rss_counts_only_the_given_tree():
+    drivers = [subprocess.Popen([sys.executable, '-c', DRIVER]) for _ in range(2)]
+    try:
+        deadline = time.monotonic() + 5
+        while not all(child_pids(driver.pid) for driver in drivers) and time.monotonic() < deadline:
+            time.sleep(0.05)
+        browser, = child_pids(drivers[0].pid)
+
+        # 드라이버 자신과 다른 드라이버의 하위 프로세스는 빠짐
+        assert child_rss_mb(drivers[0].pid) == pytest.approx(rss_mb(browser), rel=0.2)
+        assert child_rss_mb(os.getpid()) > child_rss_mb(drivers[0].pid) + child_rss_mb(drivers[1].pid)
+    finally:
+        for driver in drivers:
+            for pid in child_pids(driver.pid):
+                os.kill(pid, 9)
+            driver.kill()
+            driver.wait()
+
+
+def test_memory_limit_is_skipped_without_known_driver():
+    pool = BrowserPool(rss_limit_mb=1)
+    assert pool._driver_pid is None
+    assert not pool._over_memory_limit()
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+
+import os
+
+import pytest
+
+from cache import TextFileBackend, HashIndexBackend, read_url_file
+
+
+def write(path, data):
+    with open(path, 'wb') as f:
+        f.write(data)
+
+
+@pytest.mark.parametrize('make_backend', [
+    lambda tmp_path: TextFileBackend(str(tmp_path / 'cache.txt'), flush_interval=60),
+    lambda tmp_path: HashIndexBackend(str(tmp_path / 'cache.txt'), str(tmp_path / 'cache.idx'),
+                                      flush_interval=60),
+], ids=['text', 'index'])
+def test_torn_tail_is_not_loaded(tmp_path, make_backend):
+    write(str(tmp_path / 'cache.txt'), b"https://example.com/a\nhttps://example.com/b12")
+    backend = make_backend(tmp_path)
+    backend.load()
+
+    assert backend.contains("https://example.com/a")
+    assert not backend.contains("https://example.com/b12")
+    backend.close()
+
+
+def test_flush_truncates_torn_tail(tmp_path):
+    path = str(tmp_path / 'cache.txt')
+    write(path, b"https://example.com/a\nhttps://example.com/b12")
+    backend = TextFileBackend(path, flush_interval=60)
+    backend.load()
+    backend.add("https://example.com/c")
+    backend.flush()
+
+    with open(path, 'rb') as f:
+        assert f.read() == b"https://example.com/a\nhttps://example.com/c\n"
+    assert read_url_file(path) == ["https://example.com/a", "https://example.com/c"]
+
+
+def test_flush_truncates_file_with_only_torn_line(tmp_path):
+    path = str(tmp_path / 'cache.txt')
+    write(path, b"https://exam")
+    backend = TextFileBackend(path, flush_interval=60)
+    backend.add("https://example.com/c")
+    backend.flush()
+
+    with open(path, 'rb') as f:
+        assert f.read() == b"https://example.com/c\n"
+
+
+def test_load_migrates_legacy_lines_to_canonical_form(tmp_path):
+    path = str(tmp_path / 'cache.txt')
+    write(path, b"https://medium.com/daangn/title-1a2b3c4d5e6f?source=rss----abc---4\n"
+                b"https://example.com/a\n"
+                b"http://example.com/b/\n"
+                b"https://medium.com/p/1a2b3c4d5e6f\n")
+    backend = TextFileBackend(path, flush_interval=60)
+    backend.load()
+
+    expected = b"https://medium.com/p/1a2b3c4d5e6f\nhttps://example.com/a\nhttps://example.com/b\n"
+    with open(path, 'rb') as f:
+        assert f.read() == expected
+    assert backend.count() == 3
+
+    # 이미 표준 형태면 다시 쓰지 않음 (교체하면 inode가 바뀜)
+    inode = os.stat(path).st_ino
+    TextFileBackend(path, flush_interval=60).load()
+    assert os.stat(path).st_ino == inode
@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+
+import json
+import time
+from datetime import datetime
+
+import pytest
+
+import crawlers.rss
+import daemon
+from config import DAEMON_DEFAULT_INTERVAL, DAEMON_MIN_INTERVAL, DAEMON_MAX_INTERVAL
+import pipeline
+from cache import URLCache, TextFileBackend
+from crawlers import BaseCrawler
+from feed_validators import FeedValidatorStore
+from metrics import metrics
+from orchestrator import SourceResult
+from source_marks import SourceMarkStore
+
+
+class FakeCrawler(BaseCrawler):
+    name = "Fake"
+    source_id = "fake"
+    uses_browser = False
+
+    def parse_posts(self, page):
+        return []
+
+
+class FakeOrchestrator:
+    """매 실행마다 같은 글 하나를 내놓는 오케스트레이터"""
+
+    def __init__(self, post):
+        self.post = post
+
+    def run(self, crawler_classes, on_post=None):
+        results = []
+        for cls in crawler_classes:
+            on_post(dict(self.post))
+            results.append(SourceResult(cls(), [dict(self.post)]))
+        return results
+
+
+class FlakyNotion:
+    """첫 번째 작성만 실패하는 Notion 클라이언트"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def create_page(self, **kwargs):
+        self.calls += 1
+        return None if self.calls == 1 else f"page-{self.calls}"
+
+
+@pytest.fixture
+def isolated(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(pipeline, 'cache', URLCache(backend=TextFileBackend(str(tmp_path / 'cache.txt'))))
+    monkeypatch.setattr(pipeline, 'source_marks', SourceMarkStore(str(tmp_path / 'marks.json')))
+    monkeypatch.setattr(crawlers.rss, 'feed_validators', FeedValidatorStore(str(tmp_path / 'validators.json')))
+    notion = FlakyNotion()
+    monkeypatch.setattr(pipeline, 'notion', notion)
+    return notion
+
+
+def test_failed_write_is_retried_on_next_poll(isolated, tmp_path):
+    post = {'title': "글", 'url': "https://example.com/post/1", 'date': "2024.05.01", 'source': 'fake'}
+    runner = daemon.CrawlDaemon([FakeCrawler], schedule=daemon.PollSchedule(str(tmp_path / 'state.json')))
+    notion_pipeline = pipeline.NotionPipeline(writers=1, orchestrator=FakeOrchestrator(post))
+    notion_pipeline.start()
+    try:
+        runner._run_due(notion_pipeline, ['fake'])
+        assert notion_pipeline.summary.failed == 1
+        assert post['url'] not in pipeline.cache
+
+        runner._run_due(notion_pipeline, ['fake'])
+    finally:
+        notion_pipeline.close()
+
+    assert isolated.calls == 2
+    assert notion_pipeline.summary.added == 1
+    assert post['url'] in pipeline.cache
+
+
+def test_forget_seen_clears_urls_between_polls(isolated):
+    notion_pipeline = pipeline.NotionPipeline(writers=1)
+    notion_pipeline.start()
+    try:
+        notion_pipeline.submit({'title': "글", 'url': "https://example.com/a", 'source': 'fake'})
+        notion_pipeline.drain()
+        notion_pipeline.forget_seen()
+        assert not notion_pipeline._seen_urls
+    finally:
+        notion_pipeline.close()
+
+
+def test_report_covers_one_poll_and_resets_metrics(isolated, tmp_path):
+    runner = daemon.CrawlDaemon([FakeCrawler], schedule=daemon.PollSchedule(str(tmp_path / 'state.json')))
+    metrics.count('daemon_polls', source='fake')
+    runner._report(datetime.now(), time.perf_counter())
+
+    with open(tmp_path / 'run_metrics.json', encoding='utf-8') as f:
+        report = json.load(f)
+    assert report['mode'] == 'daemon'
+    assert any(counter['name'] == 'daemon_polls' for counter in report['counters'])
+    assert metrics.counter('daemon_polls', source='fake') == 0
+
+
+def poll_result(posts=(), skipped=0, error=""):
+    crawler = FakeCrawler()
+    crawler.skipped = skipped
+    return SourceResult(crawler, [{'date': date} for date in posts], error)
+
+
+@pytest.fixture
+def schedule(tmp_path):
+    return daemon.PollSchedule(str(tmp_path / 'state.json'))
+
+
+def test_interval_follows_publishing_cadence(schedule):
+    # 글 간격 2일, 4일, 2일 → 중앙값 2일 × 0.25 = 12시간
+    dates = ["2024.05.01", "2024.05.03", "2024.05.07", "2024.05.09"]
+    interval = schedule.update(poll_result(dates), 1000.0)
+    assert interval == 12 * 3600
+    assert schedule.entry('fake')['next_run'] == 1000.0 + interval
+    assert schedule.due(['fake'], 1000.0 + interval - 1) == []
+    assert schedule.due(['fake'], 1000.0 + interval) == ['fake']
+
+
+def test_unknown_cadence_uses_default_and_bad_dates_are_ignored(schedule):
+    assert schedule.update(poll_result(["2024.05.01", "5월 3일"]), 0.0) == DAEMON_DEFAULT_INTERVAL
+
+
+def test_cadence_is_clamped_and_counts_each_date_once(schedule):
+    assert schedule.update(poll_result(["2024.01.01", "2024.03.01"]), 0.0) == DAEMON_MAX_INTERVAL
+    schedule.entry('fake')['dates'] = []
+    assert schedule.update(poll_result(["2024.05.01", "2024.05.01", "2024.05.02"]), 0.0) == 6 * 3600
+
+
+def test_quiet_polls_back_off_from_cadence(schedule):
+    schedule.update(poll_result(["2024.05.01", "2024.05.03"]), 0.0)
+
+    assert schedule.update(poll_result(skipped=3), 0.0) == 24 * 3600
+    assert schedule.update(poll_result(skipped=3), 0.0) == DAEMON_MAX_INTERVAL
+    assert schedule.entry('fake')['quiet'] == 2
+
+    # 새 글이 나오면 발행 주기 간격으로 돌아감
+    assert schedule.update(poll_result(["2024.05.05"]), 0.0) == 12 * 3600
+    assert schedule.entry('fake')['quiet'] == 0
+
+
+def test_failures_back_off_from_minimum(schedule):
+    intervals = [schedule.update(poll_result(error="HTTPError"), 0.0) for _ in range(4)]
+    assert intervals == [DAEMON_MIN_INTERVAL * 2 ** i for i in range(4)]
+
+    # 성공하면 실패 횟수 초기화
+    schedule.update(poll_result(skipped=1), 0.0)
+    assert schedule.entry('fake')['failures'] == 0
+    assert schedule.update(poll_result(error="HTTPError"), 0.0) == DAEMON_MIN_INTERVAL
+
+
+def test_schedule_survives_save(schedule, tmp_path):
+    schedule.update(poll_result(["2024.05.01", "2024.05.03"]), 1000.0)
+    schedule.save()
+
+    reloaded = daemon.PollSchedule(str(tmp_path / 'state.json'))
+    assert reloaded.next_run(['fake']) == 1000.0 + 12 * 3600
+    assert reloaded.entry('fake')['dates'] == ["2024.05.01", "2024.05.03"]
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+
+import pytest
+
+import notion_client
+from http_pool import ConnectionPool, HTTPResponse
+from notion_client import NotionClient
+from rate_limiter import AdaptiveTokenBucket
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), 'benchmarks'))
+from local_server import NotionStub  # noqa: E402
+
+
+class FaultyTransport:
+    """
+    스텁 앞에 두는 전송 계층
+
+    faults에 넣은 순서대로 첫 요청들을 망가뜨린다.
+    - 'lost': 요청은 처리하고 응답 대신 502 반환 (생성 후 응답 유실)
+    - 'reset': 요청을 보내지 않고 연결 오류
+    """
+
+    def __init__(self, faults):
+        self.pool = ConnectionPool()
+        self.faults = list(faults)
+        self.calls = []
+
+    def request(self, method, url, headers=None, body=None, timeout=None):
+        self.calls.append((method, url))
+        fault = self.faults.pop(0) if self.faults else None
+        if fault == 'reset':
+            raise ConnectionResetError("connection reset by peer")
+        response = self.pool.request(method, url, headers=headers, body=body, timeout=timeout)
+        if fault == 'lost':
+            return HTTPResponse(502, {}, b'{"object": "error", "status": 502}')
+        return response
+
+
+@pytest.fixture
+def stub(monkeypatch):
+    monkeypatch.setattr(notion_client, 'backoff_delay', lambda attempt: 0.0)
+    server = NotionStub().start()
+    yield server
+    server.stop()
+
+
+def make_client(stub, faults):
+    transport = FaultyTransport(faults)
+    client = NotionClient(token="test", transport=transport,
+                          limiter=AdaptiveTokenBucket(rate=1000, burst=1000), max_retries=2)
+    client.BASE_URL = stub.api_url
+    return client, transport
+
+
+def test_lost_create_response_is_not_retried_into_duplicate(stub):
+    client, transport = make_client(stub, ['lost'])
+
+    page_id = client.create_page("글", "https://example.com/a", database_id="db")
+
+    assert len(stub.pages) == 1
+    assert page_id == stub.pages[0]['id']
+    # POST /pages 한 번, 확인 쿼리 한 번
+    assert [call[1].rsplit('/', 1)[-1] for call in transport.calls] == ['pages', 'query']
+
+
+def test_create_is_retried_when_page_was_not_created(stub):
+    client, transport = make_client(stub, ['reset'])
+
+    page_id = client.create_page("글", "https://example.com/a", database_id="db")
+
+    assert len(stub.pages) == 1
+    assert page_id == stub.pages[0]['id']
+    assert [call[1].rsplit('/', 1)[-1] for call in transport.calls] == ['pages', 'query', 'pages']
+
+
+def test_query_retries_server_errors_and_connection_errors(stub):
+    stub.create_page({'properties': {'URL': {'url': "https://example.com/a"}}})
+    client, transport = make_client(stub, ['reset', 'lost'])
+
+    assert client.find_page("https://example.com/a", database_id="db") is not None
+    assert client.find_page("https://example.com/b", database_id="db") is None
+    assert len(transport.calls) == 4
+
+
+def test_create_gives_up_when_recovery_query_fails(stub):
+    client, transport = make_client(stub, ['lost', 'reset', 'reset', 'reset'])
+
+    assert client.create_page("글", "https://example.com/a", database_id="db") is None
+    # 페이지는 생성됐지만 확인할 수 없으므로 다시 만들지 않음
+    assert len(stub.pages) == 1
+    assert [call[0] for call in transport.calls].count('POST') == 4
+    assert transport.calls[-1][1].endswith('/query')
@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+
+import time
+
+import pytest
+
+import orchestrator
+import pipeline
+from cache import URLCache, TextFileBackend
+from source_marks import SourceMarkStore
+import crawlers.base
+import crawlers.rss
+from crawlers import BaseCrawler, BrowserWorkers, FeedFetcher, Post, RSSCrawler
+from feed_validators import FeedValidatorStore
+from orchestrator import CrawlOrchestrator
+from source_health import SourceHealthStore
+
+
+class SlowCrawler(BaseCrawler):
+    """글 하나를 낸 뒤 제한 시간을 넘겨 두 번째 글을 내는 크롤러"""
+
+    name = "Slow"
+    source_id = "slow"
+    uses_browser = False
+
+    def parse_posts(self, page):
+        return []
+
+    def iter_posts(self):
+        yield {'title': "첫 글", 'url': "https://example.com/1", 'source': self.source_id}
+        time.sleep(0.4)
+        yield {'title': "늦은 글", 'url': "https://example.com/2", 'source': self.source_id}
+
+
+def test_time_left_ms_is_bounded_by_deadline():
+    crawler = SlowCrawler()
+    assert crawler.time_left_ms() == crawler.timeout
+
+    crawler.deadline = time.monotonic() + 1
+    assert 0 < crawler.time_left_ms() <= 1000
+
+    crawler.deadline = time.monotonic() - 1
+    with pytest.raises(TimeoutError):
+        crawler.time_left_ms()
+
+
+def test_source_timeout_stops_delivering_posts():
+    delivered = []
+    orchestrator = CrawlOrchestrator(source_timeout=0.2, health=None)
+
+    started = time.monotonic()
+    result, = orchestrator.run([SlowCrawler], on_post=delivered.append)
+    assert time.monotonic() - started < 0.4
+    assert result.error_class == "SourceTimeout"
+
+    # 크롤러 스레드가 깨어나도 제한 시간이 지난 글은 전달하지 않음
+    time.sleep(0.4)
+    assert [post['title'] for post in delivered] == ["첫 글"]
+    assert result.crawler.error_class == "TimeoutError"
+
+
+def test_worker_shutdown_does_not_wait_for_stuck_jobs():
+    workers = BrowserWorkers(1)
+    workers.submit(lambda: time.sleep(1))
+
+    started = time.monotonic()
+    stuck = workers.shutdown(timeout=0.1)
+    assert time.monotonic() - started < 0.5
+    assert stuck == ['browser-0']
+
+
+class UnusedFeedCrawler(SlowCrawler):
+    """피드를 미리 받게 하지만 fetch하지 않는 크롤러"""
+
+    name = "UnusedFeed"
+    source_id = "unused_feed"
+    feed_url = "https://example.com/feed"
+
+    def iter_posts(self):
+        return iter([])
+
+
+def test_unconsumed_prefetch_is_discarded(monkeypatch):
+    fetcher = FeedFetcher()
+    downloads = []
+    monkeypatch.setattr(fetcher, '_download', lambda crawler: downloads.append(crawler) or "응답")
+    monkeypatch.setattr(orchestrator, 'feed_fetcher', fetcher)
+
+    CrawlOrchestrator(health=None).run([UnusedFeedCrawler])
+    assert fetcher._futures == {}
+
+    # 다음 실행은 남은 응답이 아니라 새로 받은 응답을 씀
+    before = len(downloads)
+    assert fetcher.fetch(UnusedFeedCrawler()) == "응답"
+    assert len(downloads) == before + 1
+
+
+class ListCrawler(SlowCrawler):
+    """이미 파싱한 목록의 글을 바로 내놓는 크롤러"""
+
+    name = "List"
+    source_id = "list"
+    count = 10
+
+    def iter_posts(self):
+        for i in range(self.count):
+            yield {'title': f"글 {i}", 'url': f"https://example.com/{i}",
+                   'date': "2024.05.01", 'source': self.source_id}
+
+
+class SlowNotion:
+
+    def __init__(self, delay):
+        self.delay = delay
+        self.urls = []
+
+    def create_page(self, **kwargs):
+        time.sleep(self.delay)
+        self.urls.append(kwargs['url'])
+        return f"page-{len(self.urls)}"
+
+
+def test_pipeline_backpressure_does_not_count_against_source_timeout(tmp_path, monkeypatch):
+    monkeypatch.setattr(pipeline, 'cache', URLCache(backend=TextFileBackend(str(tmp_path / 'cache.txt'))))
+    monkeypatch.setattr(pipeline, 'source_marks', SourceMarkStore(str(tmp_path / 'marks.json')))
+    notion = SlowNotion(0.1)
+    monkeypatch.setattr(pipeline, 'notion', notion)
+    health = SourceHealthStore(str(tmp_path / 'health.json'))
+
+    # 작성에 1초쯤 걸리지만 크롤링 자체는 바로 끝나므로 0.3초 제한에 걸리지 않아야 함
+    notion_pipeline = pipeline.NotionPipeline(
+        writers=1, queue_size=2,
+        orchestrator=CrawlOrchestrator(source_timeout=0.3, health=health))
+    summary = notion_pipeline.run([ListCrawler])
+
+    result, = summary.results
+    assert result.error_class == ""
+    assert len(result.posts) == ListCrawler.count
+    assert len(notion.urls) == ListCrawler.count
+    assert health.stats('list')['failures'] == 0
+
+
+FEED = b"""<?xml version="1.0"?><rss version="2.0"><channel><title>t</title>
+<item><title>A</title><link>https://example.com/a</link></item>
+<item><title>B</title><link>https://example.com/b</link></item>
+</channel></rss>"""
+
+
+class StubFeedCrawler(RSSCrawler):
+    """네트워크 없이 고정 피드를 받는 RSS 크롤러"""
+
+    name = "StubFeed"
+    source_id = "stub_feed"
+    feed_url = "https://example.com/feed"
+
+    def _download_feed(self):
+        self.pending_validators = {'etag': '"v2"', 'last_modified': None, 'body_hash': "hash"}
+        return FEED
+
+
+def isolate_stores(tmp_path, monkeypatch):
+    """파이프라인과 크롤러가 같은 임시 캐시·mark 저장소를 보게 함"""
+    cache = URLCache(backend=TextFileBackend(str(tmp_path / 'cache.txt')))
+    marks = SourceMarkStore(str(tmp_path / 'marks.json'))
+    for module in (pipeline, crawlers.base):
+        monkeypatch.setattr(module, 'cache', cache)
+        monkeypatch.setattr(module, 'source_marks', marks)
+    return cache, marks
+
+
+class FailingNotion(SlowNotion):
+
+    def __init__(self, fail_urls):
+        super().__init__(0)
+        self.fail_urls = set(fail_urls)
+
+    def create_page(self, **kwargs):
+        if kwargs['url'] in self.fail_urls:
+            return None
+        return super().create_page(**kwargs)
+
+
+@pytest.mark.parametrize('fail_urls, saved', [
+    ([], True),
+    (["https://example.com/b"], False),
+])
+def test_feed_validators_saved_only_after_every_post_is_written(tmp_path, monkeypatch, fail_urls, saved):
+    isolate_stores(tmp_path, monkeypatch)
+    monkeypatch.setattr(pipeline, 'notion', FailingNotion(fail_urls))
+    validators = FeedValidatorStore(str(tmp_path / 'validators.json'))
+    validators.update('stub_feed', StubFeedCrawler.feed_url, '"v1"', None, "old")
+    monkeypatch.setattr(crawlers.rss, 'feed_validators', validators)
+
+    notion_pipeline = pipeline.NotionPipeline(writers=1, orchestrator=CrawlOrchestrator(health=None))
+    notion_pipeline.run([StubFeedCrawler])
+
+    stored = validators.get('stub_feed', StubFeedCrawler.feed_url)
+    if saved:
+        assert stored['etag'] == '"v2"'
+    else:
+        # 실패한 글이 있으면 새 검증값을 저장하지 않고 기존 것도 지워 다음 실행에서 전체를 다시 받음
+        assert stored.get('etag') is None
+
+
+class NewestFirstCrawler(SlowCrawler):
+    """urls 순서(최신순) 목록을 조기 중단 규칙으로 훑는 크롤러"""
+
+    name = "NewestFirst"
+    source_id = "newest_first"
+    urls = []
+
+    def iter_posts(self):
+        posts = [Post(url.rsplit('/', 1)[-1], url, date="2024.05.01", source=self.source_id)
+                 for url in self.urls]
+        for post in self._until_known(posts):
+            yield post.to_dict()
+
+
+def test_older_failed_post_is_retried_despite_known_posts_above(tmp_path, monkeypatch):
+    isolate_stores(tmp_path, monkeypatch)
+    base = "https://example.com/"
+
+    def run(urls, fail_urls=()):
+        monkeypatch.setattr(NewestFirstCrawler, 'urls', [base + url for url in urls])
+        notion = FailingNotion([base + url for url in fail_urls])
+        monkeypatch.setattr(pipeline, 'notion', notion)
+        pipeline.NotionPipeline(writers=1, orchestrator=CrawlOrchestrator(health=None)) \
+            .run([NewestFirstCrawler])
+        return [url[len(base):] for url in notion.urls]
+
+    assert run(["3", "2", "1"], fail_urls=["1"]) == ["3", "2"]
+    # 위에 아는 글(3, 2)이 연속으로 있어도 지난 실행이 실패했으므로 1까지 다시 봄
+    assert run(["4", "3", "2", "1"]) == ["4", "1"]
+    # 모두 처리된 뒤에는 다시 조기 중단
+    assert run(["5", "4", "3", "2", "1", "0"]) == ["5"]
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+
+import os
+import pstats
+import threading
+
+from profiling import StageProfiler
+
+
+def busy_a():
+    return sum(i * i for i in range(20000))
+
+
+def busy_b():
+    return sorted(str(i) for i in range(20000))
+
+
+def functions(path):
+    return {name for _, _, name in pstats.Stats(path).stats}
+
+
+def test_cpu_profile_covers_the_whole_run_across_threads(tmp_path):
+    profiler = StageProfiler(output_dir=str(tmp_path))
+    profiler.start('cpu')
+    busy_a()
+    thread = threading.Thread(target=busy_b)
+    thread.start()
+    thread.join()
+    written = profiler.finish()
+
+    assert written == [os.path.join(tmp_path, 'run.prof')]
+    assert {'busy_a', 'busy_b'} <= functions(written[0])
+
+
+def test_inner_mem_stage_keeps_outer_peak(tmp_path):
+    profiler = StageProfiler(output_dir=str(tmp_path))
+    profiler.start('mem')
+    try:
+        with profiler.stage('outer'):
+            block = bytearray(4 * 1024 * 1024)
+            del block
+            with profiler.stage('inner'):
+                small = [bytearray(1024) for _ in range(10)]
+            del small
+        outer, inner = profiler._mem['outer'][0][0], profiler._mem['inner'][0][0]
+    finally:
+        profiler.finish()
+
+    assert outer >= 4 * 1024 * 1024
+    assert inner < 1024 * 1024
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+
+import time
+from email.utils import formatdate
+
+import pytest
+
+import rate_limiter
+from rate_limiter import AdaptiveTokenBucket, backoff_delay, parse_retry_after
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limiter.time, 'monotonic', clock.monotonic)
+    monkeypatch.setattr(rate_limiter.time, 'sleep', clock.sleep)
+    return clock
+
+
+@pytest.mark.parametrize('value, expected', [
+    (None, None),
+    ("", None),
+    ("3", 3.0),
+    ("0.5", 0.5),
+    ("-2", 0.0),
+    ("soon", None),
+])
+def test_parse_retry_after_seconds(value, expected):
+    assert parse_retry_after(value) == expected
+
+
+def test_parse_retry_after_http_date():
+    assert parse_retry_after(formatdate(time.time() + 30, usegmt=True)) == pytest.approx(30, abs=2)
+    assert parse_retry_after(formatdate(time.time() - 30, usegmt=True)) == 0.0
+
+
+def test_backoff_delay_doubles_with_jitter_and_cap():
+    for attempt, delay in [(0, 1.0), (1, 2.0), (3, 8.0), (10, 30.0)]:
+        for _ in range(20):
+            assert delay / 2 <= backoff_delay(attempt, base=1.0, cap=30.0) <= delay
+
+
+def test_bucket_spends_burst_then_waits_one_interval(clock):
+    bucket = AdaptiveTokenBucket(rate=4, burst=2)
+    for _ in range(3):
+        bucket.acquire()
+
+    # 버스트 2개는 바로, 세 번째는 1/rate초 대기
+    assert clock.sleeps == [pytest.approx(0.25)]
+
+
+def test_bucket_refills_up_to_burst(clock):
+    bucket = AdaptiveTokenBucket(rate=4, burst=2)
+    bucket.acquire()
+    bucket.acquire()
+    clock.now += 10
+
+    bucket.acquire()
+    bucket.acquire()
+    assert clock.sleeps == []
+    bucket.acquire()
+    assert clock.sleeps == [pytest.approx(0.25)]
+
+
+def test_throttle_halves_rate_and_pauses(clock):
+    bucket = AdaptiveTokenBucket(rate=4, burst=1, min_rate=1.5)
+    bucket.on_throttle(2.0)
+    assert bucket.rate == 2
+    assert bucket.throttled == 1
+
+    bucket.acquire()
+    bucket.acquire()
+    # Retry-After 2초 동안 멈춘 뒤(그동안 토큰은 burst까지 참), 다음은 새 속도(2 req/s)로
+    assert clock.sleeps == [pytest.approx(2.0), pytest.approx(0.5)]
+
+    bucket.on_throttle(0)
+    assert bucket.rate == 1.5  # min_rate 아래로는 내려가지 않음
+
+
+def test_success_restores_rate_up_to_max(clock):
+    bucket = AdaptiveTokenBucket(rate=3, min_rate=0.5, increase_step=0.5)
+    bucket.on_throttle(0)
+    assert bucket.rate == 1.5
+
+    for _ in range(2):
+        bucket.on_success()
+    assert bucket.rate == pytest.approx(2.5)
+    for _ in range(5):
+        bucket.on_success()
+    assert bucket.rate == 3
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+
+from config import HEALTH_FAILURE_THRESHOLD, HEALTH_OPEN_SECONDS, HEALTH_OPEN_MAX_SECONDS, HEALTH_HISTORY
+from source_health import CLOSED, HALF_OPEN, OPEN, PROBE, RUN, SKIP, SourceHealthStore
+
+NOW = 1_700_000_000.0
+
+
+@pytest.fixture
+def store(tmp_path):
+    return SourceHealthStore(str(tmp_path / 'health.json'))
+
+
+def open_circuit(store, now=NOW):
+    for i in range(HEALTH_FAILURE_THRESHOLD):
+        state = store.record('d2', False, 1.0, "TimeoutError", now=now + i)
+    return state
+
+
+def test_circuit_opens_after_consecutive_failures(store):
+    for i in range(HEALTH_FAILURE_THRESHOLD - 1):
+        assert store.record('d2', False, 1.0, "TimeoutError", now=NOW) == CLOSED
+        assert store.decide('d2', now=NOW) == RUN
+
+    assert store.record('d2', False, 1.0, "TimeoutError", now=NOW) == OPEN
+    assert store.decide('d2', now=NOW + 1) == SKIP
+    assert store.stats('d2')['retry_at'] == NOW + HEALTH_OPEN_SECONDS
+
+
+def test_success_resets_failure_count(store):
+    for _ in range(HEALTH_FAILURE_THRESHOLD - 1):
+        store.record('d2', False, 1.0, "TimeoutError", now=NOW)
+    store.record('d2', True, 1.0, now=NOW)
+    assert store.record('d2', False, 1.0, "TimeoutError", now=NOW) == CLOSED
+
+
+def test_probe_after_cooldown_closes_on_success(store):
+    open_circuit(store)
+    later = NOW + HEALTH_OPEN_SECONDS + 10
+
+    assert store.decide('d2', now=later) == PROBE
+    assert store.stats('d2')['state'] == HALF_OPEN
+    assert store.record('d2', True, 0.5, now=later) == CLOSED
+    assert store.decide('d2', now=later) == RUN
+    assert store.stats('d2')['failures'] == 0
+
+
+def test_failed_probe_doubles_cooldown_up_to_max(store):
+    open_circuit(store)
+    now = NOW + HEALTH_FAILURE_THRESHOLD
+    cooldown = HEALTH_OPEN_SECONDS
+    for _ in range(12):
+        now += cooldown
+        assert store.decide('d2', now=now) == PROBE
+        assert store.record('d2', False, 1.0, "HTTPError", now=now) == OPEN
+        cooldown = min(HEALTH_OPEN_MAX_SECONDS, cooldown * 2)
+        assert store.stats('d2')['retry_at'] == now + cooldown
+        assert store.decide('d2', now=now + cooldown - 1) == SKIP
+    assert cooldown == HEALTH_OPEN_MAX_SECONDS
+
+
+def test_half_open_probe_is_retried_on_next_decide(store):
+    """확인 결과를 기록하지 못하고 끝나도 다음 실행에서 다시 확인"""
+    open_circuit(store)
+    later = NOW + HEALTH_OPEN_SECONDS + 10
+    assert store.decide('d2', now=later) == PROBE
+    assert store.decide('d2', now=later + 1) == PROBE
+
+
+def test_stats_and_history_survive_save(store, tmp_path):
+    store.record('d2', True, 0.2, now=NOW)
+    store.record('d2', True, 0.4, now=NOW)
+    store.record('d2', False, 0.3, "HTTPError", now=NOW)
+    store.save()
+
+    stats = SourceHealthStore(str(tmp_path / 'health.json')).stats('d2')
+    assert stats == {
+        'state': CLOSED, 'runs': 3, 'successes': 2, 'p50_ms': 300,
+        'last_error': "HTTPError", 'failures': 1, 'retry_at': 0,
+    }
+
+
+def test_history_is_bounded(store):
+    for _ in range(HEALTH_HISTORY + 5):
+        store.record('d2', True, 0.1, now=NOW)
+    assert store.stats('d2')['runs'] == HEALTH_HISTORY
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+
+import json
+
+import pytest
+
+from feed_validators import FeedValidatorStore
+
+
+def test_save_and_reload(tmp_path):
+    path = str(tmp_path / 'validators.json')
+    store = FeedValidatorStore(path)
+    store.update('d2', "https://d2.naver.com/d2.atom", '"abc"', None, "hash")
+    store.save()
+
+    assert FeedValidatorStore(path).get('d2', "https://d2.naver.com/d2.atom")['etag'] == '"abc"'
+    assert not (tmp_path / 'validators.json.tmp').exists()
+
+
+@pytest.mark.parametrize('content', ["{broken", "[1, 2]"])
+def test_unreadable_file_starts_empty(tmp_path, content):
+    path = tmp_path / 'validators.json'
+    path.write_text(content, encoding='utf-8')
+
+    assert FeedValidatorStore(str(path)).get('d2', "https://d2.naver.com/d2.atom") == {}
+
+
+def test_save_without_load_keeps_file(tmp_path):
+    path = tmp_path / 'validators.json'
+    path.write_text(json.dumps({'d2': {'feed_url': "x"}}), encoding='utf-8')
+
+    FeedValidatorStore(str(path)).save()
+    assert json.loads(path.read_text(encoding='utf-8')) == {'d2': {'feed_url': "x"}}
+
+
+def test_failed_save_removes_tmp_file(tmp_path):
+    store = FeedValidatorStore(str(tmp_path / 'missing' / 'validators.json'))
+    store.invalidate('d2')
+
+    with pytest.raises(OSError):
+        store.save()
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+
+import pytest
+
+from crawlers import CRAWLER_SPECS
+from crawlers.static_html import HTTPStatusError, compile_selector, fetch_html, parse_html
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), 'benchmarks'))
+from local_server import FixtureServer  # noqa: E402
+
+HTML = """<div class="post"><h2><a href="/story/1" data-action="open">제목</a></h2>
+<p class="entry-date">2024.05.01</p></div>"""
+
+
+def spec_selectors():
+    for spec in CRAWLER_SPECS.values():
+        extraction = spec.load().extraction
+        if extraction is None:
+            continue
+        yield from extraction.items
+        if extraction.container:
+            yield extraction.container
+        for field in extraction.fields.values():
+            yield from field.selectors
+
+
+def test_every_extraction_spec_selector_is_supported():
+    for selector in spec_selectors():
+        compile_selector(selector)
+
+
+@pytest.mark.parametrize('selector, tag', [
+    ('h2 a', 'a'),
+    ('.post a[href^="/story/"]', 'a'),
+    ('a[data-action="open"]', 'a'),
+    ('[class*="date"]', 'p'),
+    ('div p', 'p'),
+])
+def test_supported_selectors_match(selector, tag):
+    node = parse_html(HTML).query_selector(selector)
+    assert node is not None and node.tag == tag
+
+
+@pytest.mark.parametrize('selector', ['#main', 'div > a', 'a[href$=".html"]', 'h2, h3', 'a:first-child', ''])
+def test_unsupported_selectors_are_rejected(selector):
+    with pytest.raises(ValueError):
+        compile_selector(selector)
+
+
+@pytest.fixture
+def server():
+    server = FixtureServer().start()
+    yield server
+    server.stop()
+
+
+def test_fetch_html_reads_page_and_reports_status(server):
+    assert 'cont_post' in fetch_html(server.base_url('d2'), timeout=5)
+
+    with pytest.raises(HTTPStatusError) as error:
+        fetch_html(f"{server.url}/missing/page", timeout=5)
+    assert error.value.status == 404
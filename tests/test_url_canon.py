@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+
+import pipeline
+from cache import URLCache, TextFileBackend
+from crawlers.base import Post
+from url_canon import canonicalize_url, medium_post_id
+from source_marks import SourceMarkStore
+
+MEDIUM_URL = "https://medium.com/daangn/some-title-1a2b3c4d5e6f?source=rss----abc---4"
+
+
+class RecordingNotion:
+
+    def __init__(self):
+        self.urls = []
+
+    def create_page(self, **kwargs):
+        self.urls.append(kwargs['url'])
+        return f"page-{len(self.urls)}"
+
+
+@pytest.fixture
+def isolated(tmp_path, monkeypatch):
+    monkeypatch.setattr(pipeline, 'cache', URLCache(backend=TextFileBackend(str(tmp_path / 'cache.txt'))))
+    monkeypatch.setattr(pipeline, 'source_marks', SourceMarkStore(str(tmp_path / 'marks.json')))
+    notion = RecordingNotion()
+    monkeypatch.setattr(pipeline, 'notion', notion)
+    return notion
+
+
+def test_post_keeps_original_url():
+    post = Post("제목", MEDIUM_URL)
+
+    assert post.url == MEDIUM_URL
+    assert post.to_dict()['url'] == MEDIUM_URL
+    assert post.key == "https://medium.com/p/1a2b3c4d5e6f"
+
+
+def test_pipeline_writes_original_url_and_dedups_by_key(isolated):
+    notion_pipeline = pipeline.NotionPipeline(writers=1)
+    notion_pipeline.start()
+    try:
+        notion_pipeline.submit({'title': "글", 'url': MEDIUM_URL,
+                                'date': "2024.05.01", 'source': 'daangn'})
+        notion_pipeline.submit({'title': "글", 'url': "https://medium.com/p/1a2b3c4d5e6f",
+                                'date': "2024.05.01", 'source': 'daangn'})
+        notion_pipeline.drain()
+    finally:
+        notion_pipeline.close()
+
+    assert isolated.urls == [MEDIUM_URL]
+    assert "https://medium.com/daangn/renamed-title-1a2b3c4d5e6f" in pipeline.cache
+    assert pipeline.source_marks.get('daangn')['url'] == "https://medium.com/p/1a2b3c4d5e6f"
+
+
+@pytest.mark.parametrize('url', [
+    "https://example.com:abc/post",
+    "https://example.com:99999/post",
+    "http://[::1/post",
+])
+def test_malformed_url_falls_back_to_raw(url):
+    assert canonicalize_url(url) == url
+    assert Post("제목", url).key == url
+
+
+@pytest.mark.parametrize('url, expected', [
+    ("http://[::1]:8080/a/", "http://[::1]:8080/a"),
+    ("http://[2001:DB8::1]/a?utm_source=x", "https://[2001:db8::1]/a"),
+    ("https://[2001:db8::1]:443/", "https://[2001:db8::1]/"),
+])
+def test_ipv6_host_keeps_brackets(url, expected):
+    assert canonicalize_url(url) == expected
+
+
+@pytest.mark.parametrize('url, expected', [
+    # 스킴·호스트 소문자, http → https, 기본 포트·fragment 제거
+    ("HTTP://Example.COM/Path", "https://example.com/Path"),
+    ("https://example.com:443/a#section", "https://example.com/a"),
+    ("http://example.com:80/", "https://example.com/"),
+    ("https://example.com:8443/a", "https://example.com:8443/a"),
+    # 로컬 호스트는 http 유지
+    ("http://localhost:8000/feed", "http://localhost:8000/feed"),
+    ("http://127.0.0.1/a", "http://127.0.0.1/a"),
+    # 추적 파라미터 제거, 남은 쿼리 정렬
+    ("https://example.com/a?utm_source=x&b=2&fbclid=y&a=1", "https://example.com/a?a=1&b=2"),
+    ("https://example.com/a?utm_medium=x&id=", "https://example.com/a?id="),
+    # 끝 슬래시 제거 (루트 제외)
+    ("https://example.com/a/b/", "https://example.com/a/b"),
+    ("https://example.com", "https://example.com/"),
+    ("https://example.com///", "https://example.com/"),
+    # Medium 글은 /p/<id>로 통일
+    ("https://medium.com/daangn/some-title-1a2b3c4d5e6f?source=rss", "https://medium.com/p/1a2b3c4d5e6f"),
+    ("https://blog.medium.com/title-abcdef1234", "https://medium.com/p/abcdef1234"),
+    ("https://techblog.gccompany.co.kr/title-1a2b3c4d5e6f", "https://medium.com/p/1a2b3c4d5e6f"),
+    ("https://medium.com/p/1A2B3C4D5E6F", "https://medium.com/p/1a2b3c4d5e6f"),
+    # Medium 글이 아니면 Medium 전용 파라미터만 제거
+    ("https://medium.com/daangn?source=rss&page=2", "https://medium.com/daangn?page=2"),
+    ("https://medium.com/daangn?ref=home&page=2", "https://medium.com/daangn?page=2"),
+    ("https://example.com/a?source=rss", "https://example.com/a?source=rss"),
+    ("https://example.com/a?ref=home&id=", "https://example.com/a?id=&ref=home"),
+    # http(s)가 아니면 그대로
+    ("  mailto:someone@example.com ", "mailto:someone@example.com"),
+    ("", ""),
+])
+def test_canonicalize_url(url, expected):
+    assert canonicalize_url(url) == expected
+
+
+@pytest.mark.parametrize('host, path, expected', [
+    ("medium.com", "/daangn/title-1a2b3c4d5e6f", "1a2b3c4d5e6f"),
+    ("medium.com", "/p/1a2b3c4d5e6f", "1a2b3c4d5e6f"),
+    ("medium.com", "/p/not-an-id", ""),
+    ("medium.com", "/daangn", ""),
+    ("medium.com", "/", ""),
+    ("example.com", "/title-1a2b3c4d5e6f", ""),
+])
+def test_medium_post_id(host, path, expected):
+    assert medium_post_id(host, path) == expected
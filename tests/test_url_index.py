@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+
+from url_index import HashIndex, _bloom_positions, file_digest, url_hash
+
+URLS = [f"https://example.com/post/{i}" for i in range(2000)]
+
+
+@pytest.fixture
+def index_path(tmp_path):
+    return str(tmp_path / 'cache.idx')
+
+
+def open_index(path):
+    index = HashIndex(path)
+    assert index.open()
+    return index
+
+
+@pytest.mark.parametrize('bloom_bits_per_key', [0, 10])
+def test_lookup_finds_every_key_and_rejects_others(index_path, bloom_bits_per_key):
+    count = HashIndex.build(index_path, (url_hash(url) for url in URLS + URLS[:10]),
+                            bloom_bits_per_key=bloom_bits_per_key)
+    index = open_index(index_path)
+    try:
+        assert count == len(index) == len(URLS)
+        assert list(index) == sorted(url_hash(url) for url in URLS)
+        assert all(url in index for url in URLS)
+        assert not any(f"https://example.com/other/{i}" in index for i in range(2000))
+    finally:
+        index.close()
+
+
+def test_bloom_filter_rejects_most_misses_before_search(index_path):
+    HashIndex.build(index_path, (url_hash(url) for url in URLS), bloom_bits_per_key=10)
+    index = open_index(index_path)
+    try:
+        # 키당 10비트, 해시 7개 → 이론상 오탐률 약 0.8%
+        misses = [url_hash(f"https://example.com/other/{i}") for i in range(5000)]
+        passed = sum(1 for h in misses if _bloom_passes(index, h))
+        assert passed / len(misses) < 0.03
+        assert all(_bloom_passes(index, url_hash(url)) for url in URLS)
+    finally:
+        index.close()
+
+
+def _bloom_passes(index, h):
+    return all(index._bloom[pos >> 3] & (1 << (pos & 7))
+               for pos in _bloom_positions(h, index._bloom_bits))
+
+
+def test_empty_index(index_path):
+    assert HashIndex.build(index_path, [], bloom_bits_per_key=10) == 0
+    index = open_index(index_path)
+    try:
+        assert len(index) == 0
+        assert "https://example.com/" not in index
+    finally:
+        index.close()
+
+
+def test_header_keeps_source_position(index_path, tmp_path):
+    source = tmp_path / 'cache.txt'
+    source.write_bytes(b"https://example.com/a\n")
+    digest = file_digest(str(source), 22)
+    HashIndex.build(index_path, [1, 2], source_size=22, source_digest=digest)
+
+    index = open_index(index_path)
+    try:
+        assert (index.source_size, index.source_digest) == (22, digest)
+    finally:
+        index.close()
+
+    # 같은 크기라도 내용이 바뀌면 digest가 달라짐
+    source.write_bytes(b"https://example.com/b\n")
+    assert file_digest(str(source), 22) != digest
+
+
+@pytest.mark.parametrize('content', [b"", b"not an index" * 10])
+def test_invalid_file_is_not_opened(index_path, content):
+    with open(index_path, 'wb') as f:
+        f.write(content)
+    index = HashIndex(index_path)
+    assert not index.open()
+    assert "https://example.com/" not in index
+
+
+def test_truncated_file_is_not_opened(index_path):
+    HashIndex.build(index_path, (url_hash(url) for url in URLS), bloom_bits_per_key=10)
+    with open(index_path, 'rb+') as f:
+        f.truncate(1000)
+    assert not HashIndex(index_path).open()
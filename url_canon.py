@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+
+import re
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+from config import MEDIUM_CUSTOM_DOMAINS
+
+# 항상 제거하는 추적용 쿼리 파라미터 (이름만으로 추적용임이 분명한 것만)
+TRACKING_PARAMS = frozenset({
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'mc_cid', 'mc_eid',
+    'ref_src', 'igshid', '_hsenc', '_hsmi',
+})
+TRACKING_PREFIXES = ('utm_',)
+
+# Medium에서만 제거하는 파라미터 (?source=rss----..., ?sk=..., ?ref=...)
+# ref처럼 다른 사이트에서는 내용을 고르는 데 쓰일 수 있는 이름은 여기에만 둔다.
+MEDIUM_PARAMS = frozenset({'source', 'sk', 'gi', 'ref'})
+
+# https로 올리지 않는 로컬 호스트
+LOCAL_HOSTS = frozenset({'localhost', '127.0.0.1', '::1'})
+
+# Medium 글 ID (슬러그 끝의 16진수 또는 /p/<id>)
+_MEDIUM_ID_RE = re.compile(r'(?:^|-)([0-9a-f]{10,12})$')
+
+
+def is_medium_host(host: str) -> bool:
+    """Medium 또는 Medium 커스텀 도메인인지 확인"""
+    return (host == 'medium.com' or host.endswith('.medium.com')
+            or host in MEDIUM_CUSTOM_DOMAINS)
+
+
+def medium_post_id(host: str, path: str) -> str:
+    """Medium 글 URL에서 글 ID 추출 (글이 아니면 빈 문자열)"""
+    if not is_medium_host(host):
+        return ""
+
+    segments = [s for s in path.split('/') if s]
+    if len(segments) == 2 and segments[0] == 'p':
+        return segments[1].lower() if re.fullmatch(r'[0-9a-fA-F]{10,12}', segments[1]) else ""
+    if not segments:
+        return ""
+
+    match = _MEDIUM_ID_RE.search(segments[-1].lower())
+    return match.group(1) if match else ""
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    URL을 캐시 비교용 표준 형태로 변환
+
+    - 스킴/호스트 소문자, http → https, 기본 포트와 fragment 제거
+    - 추적 파라미터 제거 (Medium 전용 파라미터는 Medium에서만), 남은 쿼리는 정렬
+    - 끝 슬래시 제거 (루트 경로 제외)
+    - Medium 글(커스텀 도메인 포함)은 슬러그와 무관한
+      https://medium.com/p/<id> 형태로 통일 (제목이 바뀌어도 같은 글)
+    - 포트가 잘못된 URL은 원문 그대로 반환
+    """
+    url = (url or '').strip()
+    if not url.lower().startswith(('http://', 'https://')):
+        return url
+
+    try:
+        parts = urlsplit(url)
+        port = parts.port
+    except ValueError:
+        # 잘못된 포트 (예: :abc, :99999), IPv6 괄호 짝이 안 맞음 → 비교만 원문으로
+        return url
+
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or '').lower()
+    default_port = {'http': 80, 'https': 443}[scheme]
+    if scheme == 'http' and host not in LOCAL_HOSTS:
+        scheme = 'https'
+
+    # hostname은 IPv6 주소의 괄호를 떼므로 다시 붙임
+    netloc = f"[{host}]" if ':' in host else host
+    if port and port != default_port:
+        netloc = f"{netloc}:{port}"
+
+    post_id = medium_post_id(host, parts.path)
+    if post_id:
+        return f"https://medium.com/p/{post_id}"
+
+    medium = is_medium_host(host)
+    query = [
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if k not in TRACKING_PARAMS
+        and not k.startswith(TRACKING_PREFIXES)
+        and not (medium and k in MEDIUM_PARAMS)
+    ]
+
+    path = parts.path or '/'
+    if len(path) > 1:
+        path = path.rstrip('/') or '/'
+
+    return urlunsplit((scheme, netloc, path, urlencode(sorted(query)), ''))
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+
+import hashlib
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from typing import Iterable, Optional
+
+# 파일 형식: 64바이트 헤더 + 정렬된 uint64 해시 배열 + (선택) Bloom 필터 비트
+#   magic(8) | 해시 개수(8) | 원본 파일 크기(8) | Bloom 비트 수(8) | 원본 끝부분 해시(16) | 예약
+_MAGIC = b'URLIDX1' + (b'L' if sys.byteorder == 'little' else b'B')
+_HEADER = struct.Struct('<8sQQQ16s')
+_HEADER_SIZE = 64
+_BLOOM_HASHES = 7
+
+
+def url_hash(url: str) -> int:
+    """URL의 64비트 해시 (blake2b)"""
+    return int.from_bytes(hashlib.blake2b(url.encode('utf-8'), digest_size=8).digest(), 'little')
+
+
+def file_digest(path: str, size: int, window: int = 256) -> bytes:
+    """파일의 size 바이트 지점 직전 window 바이트의 해시 (16바이트)"""
+    if size <= 0 or not os.path.exists(path):
+        return bytes(16)
+    with open(path, 'rb') as f:
+        f.seek(max(0, size - window))
+        data = f.read(min(size, window))
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _bloom_positions(h: int, bits: int):
+    """64비트 해시 하나에서 Bloom 비트 위치 k개 생성 (double hashing)"""
+    h1, h2 = h & 0xFFFFFFFF, (h >> 32) | 1
+    for i in range(_BLOOM_HASHES):
+        yield (h1 + i * h2) % bits
+
+
+class HashIndex:
+    """
+    mmap으로 여는 URL 해시 인덱스
+
+    URL마다 8바이트 해시만 정렬해 저장하고 이진 탐색으로 조회한다.
+    파일을 읽어 파싱하지 않고 mmap만 하므로 로드 시간과 메모리가 URL 수와
+    거의 무관하다. 64비트 해시라 100만 개에서도 충돌 확률은 1e-7 수준이다.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.source_size = 0  # 인덱스가 반영한 원본 텍스트 파일 크기
+        self.source_digest = b''  # 그 시점 원본 파일 끝부분의 해시
+        self._file = None
+        self._mmap: Optional[mmap.mmap] = None
+        self._view: Optional[memoryview] = None
+        self._hashes: Optional[memoryview] = None
+        self._bloom: Optional[memoryview] = None
+        self._bloom_bits = 0
+
+    @staticmethod
+    def build(path: str, hashes: Iterable[int], source_size: int = 0,
+              source_digest: bytes = b'', bloom_bits_per_key: int = 0) -> int:
+        """
+        해시 목록으로 인덱스 파일 생성 (임시 파일에 쓴 뒤 원자적 교체)
+
+        Args:
+            source_size: 인덱스가 반영한 원본 텍스트 파일 크기
+            source_digest: 원본 파일 끝부분 해시 (파일이 새로 쓰였는지 판별용)
+            bloom_bits_per_key: 0보다 크면 키당 해당 비트 수의 Bloom 필터 추가
+
+        Returns:
+            저장된 해시 개수
+        """
+        values = array('Q', sorted(set(hashes)))
+        count = len(values)
+
+        bloom_bits = count * bloom_bits_per_key if bloom_bits_per_key > 0 else 0
+        bloom = bytearray((bloom_bits + 7) // 8)
+        for h in values if bloom_bits else ():
+            for pos in _bloom_positions(h, bloom_bits):
+                bloom[pos >> 3] |= 1 << (pos & 7)
+
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            header = _HEADER.pack(_MAGIC, count, source_size, bloom_bits, source_digest)
+            f.write(header.ljust(_HEADER_SIZE, b'\0'))
+            f.write(values.tobytes())
+            f.write(bloom)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+        return count
+
+    def open(self) -> bool:
+        """인덱스 파일을 mmap으로 열기 (없거나 형식이 다르면 False)"""
+        self.close()
+        if not os.path.exists(self.path) or os.path.getsize(self.path) < _HEADER_SIZE:
+            return False
+
+        self._file = open(self.path, 'rb')
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, count, source_size, bloom_bits, digest = _HEADER.unpack_from(self._mmap)
+        end = _HEADER_SIZE + count * 8
+        if magic != _MAGIC or len(self._mmap) < end + (bloom_bits + 7) // 8:
+            self.close()
+            return False
+
+        self.source_size = source_size
+        self.source_digest = digest
+        self._view = memoryview(self._mmap)
+        self._hashes = self._view[_HEADER_SIZE:end].cast('Q')
+        self._bloom_bits = bloom_bits
+        if bloom_bits:
+            self._bloom = self._view[end:end + (bloom_bits + 7) // 8]
+        return True
+
+    def contains_hash(self, h: int) -> bool:
+        if self._hashes is None:
+            return False
+        if self._bloom is not None:
+            for pos in _bloom_positions(h, self._bloom_bits):
+                if not self._bloom[pos >> 3] & (1 << (pos & 7)):
+                    return False
+        i = bisect_left(self._hashes, h)
+        return i < len(self._hashes) and self._hashes[i] == h
+
+    def __contains__(self, url: str) -> bool:
+        return self.contains_hash(url_hash(url))
+
+    def __len__(self) -> int:
+        return len(self._hashes) if self._hashes is not None else 0
+
+    def __iter__(self):
+        return iter(self._hashes if self._hashes is not None else ())
+
+    def close(self) -> None:
+        """mmap 해제 (memoryview를 먼저 놓아야 닫을 수 있음)"""
+        for view in (self._hashes, self._bloom, self._view):
+            if view is not None:
+                view.release()
+        self._hashes = self._bloom = self._view = None
+        self._bloom_bits = 0
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None